@@ -0,0 +1,41 @@
+"""
+Compares the timestamp parsing of unit.utils.date_utils with the previous strptime based parser.
+Run from the repository root: python benchmarks/date_parsing.py
+"""
+import random
+import timeit
+from datetime import datetime, timedelta, timezone
+
+from unit.utils import date_utils
+
+
+def timestamps(count: int, distinct: int):
+    start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+    pool = [(start + timedelta(seconds=random.randrange(10 ** 7), milliseconds=random.randrange(1000)))
+            .isoformat(timespec="milliseconds").replace("+00:00", "Z") for _ in range(distinct)]
+    return [random.choice(pool) for _ in range(count)]
+
+
+def strptime(values):
+    for value in values:
+        datetime.strptime(value, date_utils.DATETIME_FORMAT)
+
+
+def to_datetime(values):
+    date_utils.parse_datetime.cache_clear()
+    for value in values:
+        date_utils.to_datetime(value)
+
+
+def main(count: int = 100000, repeat: int = 5):
+    # distinct timestamps only, then a page-like mix where createdAt/updatedAt values repeat
+    for distinct in (count, count // 10):
+        values = timestamps(count, distinct)
+        baseline = min(timeit.repeat(lambda: strptime(values), number=1, repeat=repeat))
+        fast = min(timeit.repeat(lambda: to_datetime(values), number=1, repeat=repeat))
+        print(f"{count} timestamps, {distinct} distinct: strptime {baseline:.3f}s, to_datetime {fast:.3f}s "
+              f"({baseline / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
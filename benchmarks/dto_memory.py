@@ -0,0 +1,83 @@
+"""
+Measures the memory held per decoded DTO by the compact (__slots__) transaction, event, authorization and account
+end of day DTOs, against the same values kept in a per-instance __dict__ as they were before, and the memory held by
+the relationships of a page of transactions of a single account with and without interning.
+Run from the repository root: python benchmarks/dto_memory.py
+"""
+import tracemalloc
+
+from unit.models.codecs import DtoDecoder
+
+resources = {
+    "bookTransaction": {
+        "createdAt": "2022-02-10T17:56:49.235Z", "direction": "Credit", "amount": 100, "balance": 1000,
+        "summary": "Book transfer",
+        "counterparty": {"name": "April Oniel", "routingNumber": "812345678", "accountNumber": "1000000001",
+                         "accountType": "Checking"}
+    },
+    "transaction.created": {"createdAt": "2022-02-10T17:56:49.235Z", "summary": "Book transfer", "direction": "Credit",
+                            "amount": 100},
+    "authorization": {"createdAt": "2022-02-10T17:56:49.235Z", "amount": 2500, "cardLast4Digits": "0019",
+                      "status": "Authorized", "merchant": {"name": "Europcar", "type": 3381, "category": "Car Rental"},
+                      "recurring": False},
+    "accountEndOfDay": {"date": "2022-02-10", "balance": 1000, "hold": 0, "available": 1000},
+}
+
+
+class DictDTO(object):
+    def __init__(self, dto):
+        self.id = dto.id
+        self.type = dto.type
+        self.attributes = dto.attributes
+        self.relationships = dto.relationships
+
+
+def materialize(obj):
+    vars(obj)
+    return obj
+
+
+def bytes_per_object(make, count: int) -> float:
+    tracemalloc.start()
+    objects = [make(i) for i in range(count)]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return size / count
+
+
+def relationships_size(count: int, shared: bool) -> float:
+    payload = [{"type": "bookTransaction", "id": str(i), "attributes": resources["bookTransaction"],
+                "relationships": {"account": {"data": {"type": "depositAccount", "id": "10"}},
+                                  "customer": {"data": {"type": "customer", "id": "5"}}}} for i in range(count)]
+
+    tracemalloc.start()
+    if shared:
+        relationships = [dto.relationships for dto in DtoDecoder.decode(payload)]
+    else:
+        relationships = [DtoDecoder.decode(p).relationships for p in payload]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del relationships
+    return size / count
+
+
+def main(count: int = 100000):
+    for _type, attributes in resources.items():
+        dtos = [DtoDecoder.decode({"type": _type, "id": str(i), "attributes": attributes,
+                                   "relationships": {"account": {"data": {"type": "account", "id": "10"}}}})
+                for i in range(count)]
+        # only the objects themselves are measured: their attributes and relationships are shared by both layouts
+        compact = bytes_per_object(lambda i: type(dtos[i]).__new__(type(dtos[i])), count)
+        before = bytes_per_object(lambda i: DictDTO(dtos[i]), count)
+        # Python < 3.11 always allocates the __dict__, newer versions once it is accessed (e.g. by vars())
+        materialized = bytes_per_object(lambda i: materialize(DictDTO(dtos[i])), count)
+        print(f"{type(dtos[0]).__name__}: {before:.0f} bytes per object with __dict__ ({materialized:.0f} once "
+              f"allocated), {compact:.0f} with __slots__")
+
+    print(f"relationships of a transaction: {relationships_size(count, False):.0f} bytes decoded one by one, "
+          f"{relationships_size(count, True):.0f} bytes interned within the page")
+
+
+if __name__ == "__main__":
+    main()
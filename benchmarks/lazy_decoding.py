@@ -0,0 +1,82 @@
+"""
+Compares eager and lazy decoding of a page of transactions when only id, amount and createdAt are read.
+Run from the repository root: python benchmarks/lazy_decoding.py
+"""
+import copy
+import timeit
+import tracemalloc
+
+from unit.models.codecs import DtoDecoder
+from unit.utils import date_utils
+
+transaction = {
+    "type": "purchaseTransaction",
+    "id": "1",
+    "attributes": {
+        "createdAt": "2022-02-10T17:56:49.235Z",
+        "direction": "Debit",
+        "amount": 2500,
+        "balance": 10000,
+        "summary": "Purchase",
+        "cardLast4Digits": "0019",
+        "merchant": {"name": "Europcar Mobility Group", "type": 3381, "category": "Car Rental", "location": "Cupertino"},
+        "coordinates": {"longitude": -77.0364, "latitude": 38.8951},
+        "recurring": False,
+        "ecommerce": True,
+        "cardPresent": False,
+        "cardNetwork": "Visa",
+        "paymentMethod": "Contactless",
+        "digitalWallet": "Apple",
+        "cardVerificationData": {"verificationMethod": "CVV2"}
+    },
+    "relationships": {
+        "account": {"data": {"type": "account", "id": "10"}},
+        "customer": {"data": {"type": "customer", "id": "5"}},
+        "card": {"data": {"type": "card", "id": "7"}}
+    }
+}
+
+
+def page(count: int):
+    transactions = []
+    for i in range(count):
+        t = copy.deepcopy(transaction)
+        t["id"] = str(i)
+        t["attributes"]["createdAt"] = f"2022-02-10T17:{i // 60 % 60:02}:{i % 60:02}.235Z"
+        transactions.append(t)
+
+    return transactions
+
+
+def scan(payload, lazy: bool):
+    date_utils.parse_datetime.cache_clear()
+    total = 0
+    for dto in DtoDecoder.decode(payload, lazy):
+        attributes = dto.attributes
+        total += attributes["amount"]
+        attributes["createdAt"]
+        dto.id
+
+    return total
+
+
+def allocated(payload, lazy: bool) -> int:
+    tracemalloc.start()
+    dtos = DtoDecoder.decode(payload, lazy)
+    for dto in dtos:
+        dto.attributes["createdAt"]
+    size = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return size
+
+
+def main(count: int = 100000, repeat: int = 5):
+    payload = page(count)
+    for lazy in (False, True):
+        seconds = min(timeit.repeat(lambda: scan(payload, lazy), number=1, repeat=repeat))
+        print(f"{'lazy' if lazy else 'eager'}: {count} transactions scanned in {seconds:.3f}s, "
+              f"{allocated(payload, lazy) / 2 ** 20:.1f} MiB retained")
+
+
+if __name__ == "__main__":
+    main()
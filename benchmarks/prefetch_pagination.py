@@ -0,0 +1,65 @@
+"""
+Compares walking every page of transactions one page at a time and with pages prefetched, against a local server
+that answers each page after a fixed latency.
+Run from the repository root: python benchmarks/prefetch_pagination.py
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+from unit import Unit
+from unit.models.transaction import ListTransactionParams
+from unit.utils.configuration import Configuration
+
+TOTAL = 5000
+LATENCY = 0.05
+
+
+def transaction(i):
+    return {
+        "type": "bookTransaction",
+        "id": str(i),
+        "attributes": {"createdAt": "2022-02-10T17:56:49.235Z", "amount": i, "direction": "Credit",
+                       "balance": 1000, "summary": "Book transfer",
+                       "counterparty": {"name": "April Oniel", "routingNumber": "812345678",
+                                        "accountNumber": "1000000001", "accountType": "Checking"}},
+        "relationships": {"account": {"data": {"type": "account", "id": "10"}}}
+    }
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        query = parse_qs(urlparse(self.path).query)
+        limit, offset = int(query["page[limit]"][0]), int(query["page[offset]"][0])
+        time.sleep(LATENCY)
+        content = json.dumps({"data": [transaction(i) for i in range(offset, min(offset + limit, TOTAL))],
+                              "meta": {"pagination": {"total": TOTAL, "limit": limit, "offset": offset}}}).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/vnd.api+json")
+        self.send_header("content-length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+def main(limit: int = 100):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    unit = Unit(configuration=Configuration(f"http://127.0.0.1:{server.server_address[1]}", "token"))
+
+    for prefetch_pages in (0, 2, 4, 8):
+        start = time.perf_counter()
+        count = sum(1 for _ in unit.transactions.iter_all(ListTransactionParams(limit=limit), prefetch_pages))
+        print(f"prefetch_pages={prefetch_pages}: {count} transactions in {time.perf_counter() - start:.2f}s")
+
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
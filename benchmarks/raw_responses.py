@@ -0,0 +1,64 @@
+"""
+Compares decoding a page of transactions into DTOs with raw "json" and "bytes" responses.
+Run from the repository root: python benchmarks/raw_responses.py
+"""
+import copy
+import json
+import timeit
+
+from unit.api.base_resource import BaseResource
+from unit.utils import date_utils
+from unit.utils.configuration import Configuration
+from unit.utils.raw import raw_responses
+from unit.utils.transport import TransportResponse
+
+transaction = {
+    "type": "bookTransaction",
+    "id": "1",
+    "attributes": {
+        "createdAt": "2022-02-10T17:56:49.235Z",
+        "direction": "Credit",
+        "amount": 2500,
+        "balance": 10000,
+        "summary": "Book transfer",
+        "counterparty": {"name": "April Oniel", "routingNumber": "812345678", "accountNumber": "1000000001",
+                         "accountType": "Checking"}
+    },
+    "relationships": {
+        "account": {"data": {"type": "account", "id": "10"}},
+        "customer": {"data": {"type": "customer", "id": "5"}}
+    }
+}
+
+
+def page(count: int) -> bytes:
+    transactions = []
+    for i in range(count):
+        t = copy.deepcopy(transaction)
+        t["id"] = str(i)
+        t["attributes"]["createdAt"] = f"2022-02-10T17:{i // 60 % 60:02}:{i % 60:02}.235Z"
+        transactions.append(t)
+
+    return json.dumps({"data": transactions, "meta": {"pagination": {"total": count}}}).encode()
+
+
+def decode(resource: BaseResource, response: TransportResponse, raw_format):
+    date_utils.parse_datetime.cache_clear()
+    if raw_format is None:
+        return resource.decode(response)
+
+    with raw_responses(raw_format):
+        return resource.decode(response)
+
+
+def main(count: int = 1000, number: int = 20, repeat: int = 5):
+    resource = BaseResource("transactions", Configuration("https://api.s.unit.sh", "token"))
+    response = TransportResponse(200, {}, page(count))
+    for raw_format in (None, "json", "bytes"):
+        seconds = min(timeit.repeat(lambda: decode(resource, response, raw_format), number=number,
+                                    repeat=repeat)) / number
+        print(f"{raw_format or 'dto'}: {count} transactions decoded in {seconds * 1000:.2f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""
+Compares the peak memory of transactions.list() and transactions.stream() over a page of 1000 transactions, when each
+transaction is processed and dropped.
+Run from the repository root: python benchmarks/streaming_decode.py
+"""
+import json
+import tracemalloc
+
+from unit import Unit
+from unit.utils.configuration import Configuration
+from unit.utils.transport import Transport, TransportResponse, CHUNK_SIZE
+
+
+def transaction(i: int):
+    return {
+        "type": "purchaseTransaction",
+        "id": str(i),
+        "attributes": {
+            "createdAt": "2022-02-10T17:56:49.235Z", "direction": "Debit", "amount": 2500, "balance": 10000,
+            "summary": "Purchase " + "x" * 200, "cardLast4Digits": "0019",
+            "merchant": {"name": "Europcar Mobility Group", "type": 3381, "category": "Car Rental"},
+            "recurring": False, "ecommerce": True, "cardPresent": False
+        },
+        "relationships": {
+            "account": {"data": {"type": "account", "id": "10"}},
+            "customer": {"data": {"type": "customer", "id": "5"}},
+            "card": {"data": {"type": "card", "id": "7"}}
+        }
+    }
+
+
+class PageTransport(Transport):
+    """
+    Serves the page from memory, in chunks when streamed.
+    """
+    def __init__(self, count: int):
+        self.page = json.dumps({"data": [transaction(i) for i in range(count)],
+                                "meta": {"pagination": {"total": count}}}).encode()
+
+    def request(self, method, url, params=None, data=None, headers=None, timeout=None):
+        return TransportResponse(200, {}, bytes(self.page))
+
+    def stream(self, method, url, params=None, data=None, headers=None, timeout=None):
+        return TransportResponse(200, {}, None)
+
+    def iter_content(self, response, chunk_size: int = CHUNK_SIZE):
+        for i in range(0, len(self.page), chunk_size):
+            yield self.page[i:i + chunk_size]
+
+
+def peak(call) -> int:
+    tracemalloc.start()
+    call()
+    size = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return size
+
+
+def main(count: int = 1000):
+    transport = PageTransport(count)
+    client = Unit(configuration=Configuration("https://api.s.unit.sh", "token", transport=transport))
+
+    def process_list():
+        for t in client.transactions.list().data:
+            t.attributes["amount"]
+
+    def process_stream():
+        for t in client.transactions.stream().data:
+            t.attributes["amount"]
+
+    print(f"page of {count} transactions, {len(transport.page) / 2 ** 20:.1f} MiB: peak memory "
+          f"{peak(process_list) / 2 ** 20:.1f} MiB with list(), {peak(process_stream) / 2 ** 20:.1f} MiB with stream()")
+
+
+if __name__ == "__main__":
+    main()
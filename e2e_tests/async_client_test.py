@@ -0,0 +1,83 @@
+import asyncio
+import json
+
+import httpx
+
+from unit import AsyncUnit
+from unit.models.transaction import ListTransactionParams
+from unit.utils.configuration import Configuration
+from unit.utils.transport import AsyncHttpxTransport
+
+transaction = {
+    "type": "bookTransaction",
+    "id": "1",
+    "attributes": {
+        "createdAt": "2022-02-10T17:56:49.235Z",
+        "amount": 200,
+        "direction": "Credit",
+        "balance": 1000,
+        "summary": "Book transfer",
+        "counterparty": {
+            "name": "April Oniel",
+            "routingNumber": "812345678",
+            "accountNumber": "1000000001",
+            "accountType": "Checking"
+        }
+    },
+    "relationships": {
+        "account": {"data": {"type": "account", "id": "10"}}
+    }
+}
+
+
+def mock_configuration(handler, retries=0):
+    transport = AsyncHttpxTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return Configuration("https://api.s.unit.sh", "token", retries, async_transport=transport)
+
+
+def test_async_list_transactions():
+    requests = []
+
+    def handler(request: httpx.Request):
+        requests.append(request)
+        return httpx.Response(200, json={"data": [transaction]})
+
+    async def run():
+        async with AsyncUnit(configuration=mock_configuration(handler)) as client:
+            return await asyncio.gather(*[client.transactions.list(ListTransactionParams(10)) for _ in range(5)])
+
+    responses = asyncio.run(run())
+
+    assert len(requests) == 5
+    assert requests[0].url.params["page[limit]"] == "10"
+    assert requests[0].headers["authorization"] == "Bearer token"
+    for response in responses:
+        assert response.data[0].type == "bookTransaction"
+        assert response.data[0].attributes["amount"] == 200
+
+
+def test_async_error_response():
+    def handler(request: httpx.Request):
+        return httpx.Response(404, json={"errors": [{"title": "Not Found", "status": "404"}]})
+
+    async def run():
+        async with AsyncUnit(configuration=mock_configuration(handler)) as client:
+            return await client.transactions.get("1")
+
+    error = asyncio.run(run())
+    assert error.errors[0].status == "404"
+
+
+def test_async_retries_server_errors():
+    statuses = [503, 200]
+
+    def handler(request: httpx.Request):
+        return httpx.Response(statuses.pop(0), json={"data": transaction})
+
+    async def run():
+        async with AsyncUnit(configuration=mock_configuration(handler, retries=1)) as client:
+            return await client.transactions.get("1")
+
+    response = asyncio.run(run())
+    assert response.data.id == "1"
+    assert statuses == []
@@ -0,0 +1,78 @@
+import time
+
+import pytest
+
+from e2e_tests.helpers.transport import StubTransport
+from unit import Unit
+from unit.utils.circuit_breaker import CircuitBreaker, CircuitOpenError, OPEN, HALF_OPEN, CLOSED
+from unit.utils.configuration import Configuration
+
+limits = {"type": "limits", "attributes": {"limits": {"dailyWithdrawal": 1, "dailyPurchase": 1,
+                                                      "monthlyWithdrawal": 1, "monthlyPurchase": 1},
+                                           "dailyTotals": {"withdrawals": 0, "deposits": 0, "purchases": 0},
+                                           "monthlyTotals": {"withdrawals": 0, "deposits": 0, "purchases": 0}}}
+
+
+def test_breaker_opens_on_failure_rate_and_probes_when_half_open():
+    breaker = CircuitBreaker(failure_rate=0.5, minimum_calls=4, open_timeout=0.05, name="cards")
+
+    for status in [200, 503, 200, 503]:
+        breaker.before_call()
+        breaker.record(status)
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    time.sleep(0.06)
+    breaker.before_call()
+    assert breaker.state == HALF_OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+    breaker.record(200)
+    assert breaker.state == CLOSED
+
+
+def test_failed_trial_reopens_the_breaker():
+    breaker = CircuitBreaker(minimum_calls=1, open_timeout=0.01)
+    breaker.record(None)
+    time.sleep(0.02)
+
+    breaker.before_call()
+    breaker.record(500)
+    assert breaker.state == OPEN
+
+
+def test_cancelled_trial_is_given_back():
+    breaker = CircuitBreaker(minimum_calls=1, open_timeout=0.01)
+    breaker.record(None)
+    time.sleep(0.02)
+
+    breaker.before_call()
+    breaker.cancel()
+    assert breaker.state == HALF_OPEN
+    breaker.before_call()
+    breaker.record(200)
+    assert breaker.state == CLOSED
+
+
+def test_breaker_is_scoped_to_its_endpoint():
+    transport = StubTransport([503], {"data": limits})
+    c = Configuration("https://api.s.unit.sh", "token", transport=transport)
+    breaker = c.add_circuit_breaker("cards/*/limits", CircuitBreaker(minimum_calls=2, open_timeout=60))
+    client = Unit(configuration=c)
+
+    client.cards.limits("1")
+    client.cards.limits("2")
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError) as e:
+        client.cards.limits("3")
+    assert e.value.endpoint == "cards/*/limits"
+    assert len(transport.calls) == 2
+
+    client.cards.get("1")
+    client.payments.list()
+    assert len(transport.calls) == 4
+    assert c.get_circuit_breaker("GET", "https://api.s.unit.sh/cards/1") is None
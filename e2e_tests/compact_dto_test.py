@@ -0,0 +1,60 @@
+import json
+import pickle
+
+import pytest
+
+from unit.models import CompactDTO, decoder_classes
+from unit.models.codecs import DtoDecoder, encode
+from unit.models.transaction import BookTransactionDTO
+
+book_transaction = {
+    "type": "bookTransaction",
+    "id": "1",
+    "attributes": {
+        "createdAt": "2022-02-10T17:56:49.235Z",
+        "direction": "Credit",
+        "amount": 100,
+        "balance": 1000,
+        "summary": "Book transfer",
+        "counterparty": {"name": "April Oniel", "routingNumber": "812345678", "accountNumber": "1000000001",
+                         "accountType": "Checking"}
+    },
+    "relationships": {
+        "account": {"data": {"type": "account", "id": "10"}}
+    }
+}
+
+
+def test_compact_dtos_have_no_instance_dict():
+    compact = [cls for cls in decoder_classes.values() if issubclass(cls, CompactDTO)]
+    assert len(compact) >= 50
+
+    for cls in compact:
+        assert not hasattr(cls.__new__(cls), "__dict__"), cls.__name__
+
+
+def test_compact_dto_attributes():
+    dto = DtoDecoder.decode(book_transaction)
+
+    assert isinstance(dto, BookTransactionDTO)
+    assert dto.id == "1" and dto.type == "bookTransaction"
+    assert dto.attributes["amount"] == 100
+    assert dto.relationships["account"].id == "10"
+
+    dto.attributes["tags"] = {"purpose": "test"}
+    assert dto.attributes["tags"] == {"purpose": "test"}
+
+    with pytest.raises(AttributeError):
+        dto.unknown = 1
+
+
+def test_compact_dto_serialization():
+    dto = DtoDecoder.decode(book_transaction)
+
+    encoded = json.loads(encode(dto))
+    assert encoded["id"] == "1" and encoded["type"] == "bookTransaction"
+    assert encoded["attributes"]["counterparty"]["routingNumber"] == "812345678"
+    assert encoded["relationships"]["account"] == {"data": {"type": "account", "id": "10"}}
+
+    copy = pickle.loads(pickle.dumps(dto))
+    assert copy.id == dto.id and copy.attributes["amount"] == 100
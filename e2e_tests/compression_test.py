@@ -0,0 +1,138 @@
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from unit import Unit
+from unit.models.application import UploadDocumentRequest
+from unit.models.transaction import PatchTransactionRequest
+from unit.utils.compression import compress_body
+from unit.utils.configuration import Configuration
+from unit.utils.transport import RequestsTransport, Urllib3Transport
+
+transactions = [{
+    "type": "bookTransaction",
+    "id": str(i),
+    "attributes": {
+        "createdAt": "2022-02-10T17:56:49.235Z",
+        "amount": 200,
+        "direction": "Credit",
+        "balance": 1000,
+        "summary": "Book transfer",
+        "counterparty": {
+            "name": "April Oniel",
+            "routingNumber": "812345678",
+            "accountNumber": "1000000001",
+            "accountType": "Checking"
+        }
+    },
+    "relationships": {
+        "account": {"data": {"type": "account", "id": "10"}}
+    }
+} for i in range(100)]
+
+
+class Handler(BaseHTTPRequestHandler):
+    bodies = []
+    uploads = []
+
+    def do_GET(self):
+        self.respond({"data": transactions})
+
+    def do_PATCH(self):
+        body = self.rfile.read(int(self.headers["content-length"]))
+        if self.headers.get("content-encoding") == "gzip":
+            body = gzip.decompress(body)
+        Handler.bodies.append(json.loads(body))
+        self.respond({"data": transactions[0]})
+
+    def do_PUT(self):
+        body = self.rfile.read(int(self.headers["content-length"]))
+        Handler.uploads.append((body, self.headers.get("content-encoding")))
+        self.respond({"data": transactions[0]})
+
+    def respond(self, body):
+        content = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("content-type", "application/vnd.api+json")
+        if "gzip" in self.headers.get("accept-encoding", ""):
+            content = gzip.compress(content)
+            self.send_header("content-encoding", "gzip")
+        self.send_header("content-length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def api_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+
+
+@pytest.mark.parametrize("transport", [RequestsTransport, Urllib3Transport])
+def test_responses_are_negotiated_compressed(api_url, transport):
+    transfers = []
+    c = Configuration(api_url, "token", transport=transport(), on_transfer=transfers.append)
+    client = Unit(configuration=c)
+
+    response = client.transactions.list()
+
+    assert len(response.data) == 100
+    stats = transfers[0]
+    assert stats.method == "GET" and stats.status_code == 200
+    assert stats.response_wire_bytes < stats.response_bytes / 5
+    client.close()
+
+
+@pytest.mark.parametrize("transport", [RequestsTransport, Urllib3Transport])
+def test_compression_can_be_turned_off(api_url, transport):
+    transfers = []
+    c = Configuration(api_url, "token", transport=transport(), compression=False, on_transfer=transfers.append)
+    client = Unit(configuration=c)
+
+    assert len(client.transactions.list().data) == 100
+    assert transfers[0].response_wire_bytes == transfers[0].response_bytes
+    client.close()
+
+
+def test_large_request_bodies_are_compressed(api_url):
+    transfers = []
+    c = Configuration(api_url, "token", compress_requests_over=100, on_transfer=transfers.append)
+    client = Unit(configuration=c)
+
+    client.transactions.update(PatchTransactionRequest("10", "1", tags={"purpose": "x" * 1000}))
+
+    assert Handler.bodies[-1]["data"]["attributes"]["tags"]["purpose"] == "x" * 1000
+    assert transfers[0].request_wire_bytes < transfers[0].request_bytes
+    client.close()
+
+
+def test_uploads_are_sent_as_is(api_url):
+    jpeg = b"\xff\xd8\xff\xe0" + b"\x00" * 5000
+    c = Configuration(api_url, "token", compress_requests_over=100)
+    client = Unit(configuration=c)
+
+    client.applications.upload(UploadDocumentRequest("1", "2", jpeg, "jpeg"))
+
+    assert Handler.uploads[-1] == (jpeg, None)
+    client.close()
+
+
+def test_small_request_bodies_are_sent_as_is():
+    headers = {"content-type": "application/vnd.api+json"}
+    assert compress_body('{"data": {}}', headers, 1024) == ('{"data": {}}', headers)
+    assert compress_body(None, headers, 0) == (None, headers)
+
+    upload_headers = dict(headers, **{"Content-Type": "image/jpeg"})
+    assert compress_body(b"x" * 2048, upload_headers, 1024) == (b"x" * 2048, upload_headers)
+
+    body, compressed_headers = compress_body("x" * 2048, headers, 1024)
+    assert gzip.decompress(body) == b"x" * 2048
+    assert compressed_headers["content-encoding"] == "gzip" and "content-encoding" not in headers
@@ -0,0 +1,71 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from unit.utils.concurrency import AdaptiveConcurrencyLimiter
+
+
+def test_limit_grows_additively_while_healthy():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=4)
+
+    for _ in range(8):
+        limiter.release(limiter.acquire(), 200)
+
+    assert 5 < limiter.limit < 6
+    assert limiter.in_flight == 0
+    assert limiter.latency is not None
+
+
+def test_limit_is_cut_on_throttling_and_errors():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=16, min_limit=2)
+
+    limiter.release(limiter.acquire(), 429)
+    assert limiter.limit == 8
+
+    time.sleep(0.01)
+    limiter.release(limiter.acquire())
+    assert limiter.limit == 4
+
+    time.sleep(0.01)
+    limiter.release(limiter.acquire(), 503)
+    time.sleep(0.01)
+    limiter.release(limiter.acquire(), 503)
+    assert limiter.limit == 2
+
+
+def test_in_flight_requests_are_bounded():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=3, max_limit=3)
+    lock = threading.Lock()
+    peak = [0]
+
+    def call(_):
+        started_at = limiter.acquire()
+        with lock:
+            peak[0] = max(peak[0], limiter.in_flight)
+        time.sleep(0.01)
+        limiter.release(started_at, 200)
+
+    with ThreadPoolExecutor(10) as executor:
+        list(executor.map(call, range(30)))
+
+    assert peak[0] == 3
+    assert limiter.in_flight == 0
+
+
+def test_async_in_flight_requests_are_bounded():
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=2)
+    peak = [0]
+
+    async def call():
+        started_at = await limiter.acquire_async()
+        peak[0] = max(peak[0], limiter.in_flight)
+        await asyncio.sleep(0.01)
+        limiter.release(started_at, 200)
+
+    async def run():
+        await asyncio.gather(*[call() for _ in range(10)])
+
+    asyncio.run(run())
+    assert peak[0] == 2
+    assert limiter.in_flight == 0
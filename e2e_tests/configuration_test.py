@@ -0,0 +1,42 @@
+from unit import Unit
+from unit.utils.configuration import Configuration
+from unit.utils.transport import RequestsTransport, Urllib3Transport
+
+
+def test_transport_is_shared_between_resources():
+    client = Unit("https://api.s.unit.sh", "token")
+    transport = client.configuration.get_transport()
+
+    assert isinstance(transport, RequestsTransport)
+    assert client.accounts.configuration.get_transport() is transport
+    assert client.transactions.configuration.get_transport() is transport
+    client.close()
+
+
+def test_transport_pool_size():
+    c = Configuration("https://api.s.unit.sh", "token", pool_connections=2, pool_maxsize=20)
+    adapter = c.get_transport().session.get_adapter("https://api.s.unit.sh")
+
+    assert adapter._pool_connections == 2
+    assert adapter._pool_maxsize == 20
+    c.close()
+
+
+def test_close_releases_transport():
+    with Unit("https://api.s.unit.sh", "token") as client:
+        transport = client.configuration.get_transport()
+
+    assert client.configuration.get_transport() is not transport
+
+
+def test_select_transport_by_name():
+    c = Configuration("https://api.s.unit.sh", "token", transport="urllib3")
+    assert isinstance(c.get_transport(), Urllib3Transport)
+
+
+def test_unknown_transport():
+    try:
+        Configuration("https://api.s.unit.sh", "token", transport="curl")
+        assert False
+    except Exception as e:
+        assert "transport must be" in str(e)
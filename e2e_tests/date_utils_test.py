@@ -0,0 +1,18 @@
+from datetime import datetime, timezone, timedelta
+
+from unit.utils.date_utils import to_datetime, DATETIME_FORMAT
+
+
+def test_to_datetime_matches_strptime():
+    for value in ["2022-02-10T17:56:49.235Z", "2022-02-10T17:56:49.2Z", "2022-02-10T17:56:49.235123+02:00",
+                  "2022-02-10T17:56:49.235-0500"]:
+        parsed = to_datetime(value)
+        expected = datetime.strptime(value, DATETIME_FORMAT)
+        assert parsed == expected
+        assert parsed.utcoffset() == expected.utcoffset()
+
+
+def test_to_datetime():
+    assert to_datetime(None) is None
+    assert to_datetime("2022-02-10T17:56:49.235Z") == datetime(2022, 2, 10, 17, 56, 49, 235000, tzinfo=timezone.utc)
+    assert to_datetime("2022-02-10T17:56:49.235+01:00").utcoffset() == timedelta(hours=1)
@@ -0,0 +1,145 @@
+import asyncio
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from e2e_tests.helpers.transport import StubTransport
+from unit import Unit
+from unit.utils.concurrency import AdaptiveConcurrencyLimiter
+from unit.utils.configuration import Configuration
+from unit.utils.deadline import deadline, DeadlineExceeded
+from unit.utils.retry import RetryPolicy
+from unit.utils.transport import RequestsTransport, Urllib3Transport
+
+
+def test_socket_timeouts_are_passed_to_the_transport():
+    transport = StubTransport([404, 404])
+    c = Configuration("https://api.s.unit.sh", "token", transport=transport, connect_timeout=3, read_timeout=20)
+    client = Unit(configuration=c)
+
+    client.institutions.get("053285241")
+    with deadline(5):
+        client.institutions.get("053285241")
+
+    assert transport.timeouts[0] == (3, 20)
+    connect, read = transport.timeouts[1]
+    assert connect == 3 and 4 < read <= 5
+
+
+def test_socket_timeouts_are_validated():
+    c = Configuration("https://api.s.unit.sh", "token", read_timeout=None)
+    assert c.get_socket_timeouts() == (10, None)
+
+    with pytest.raises(Exception):
+        Configuration("https://api.s.unit.sh", "token", connect_timeout=0)
+
+
+def test_retries_stop_when_the_deadline_leaves_no_time():
+    transport = StubTransport([503, 503, 503], headers={"Retry-After": "1"})
+    c = Configuration("https://api.s.unit.sh", "token", transport=transport)
+    c.set_retry_policy(RetryPolicy(tries=3))
+    client = Unit(configuration=c)
+
+    started_at = time.monotonic()
+    with deadline(0.5):
+        response = client.institutions.get("053285241")
+
+    assert response.errors[0].status == "503"
+    assert len(transport.timeouts) == 1
+    assert time.monotonic() - started_at < 0.5
+
+
+def test_retry_after_wait_is_bounded_by_the_deadline():
+    transport = StubTransport([429, 200], headers={"Retry-After": "3"})
+    client = Unit(configuration=Configuration("https://api.s.unit.sh", "token", transport=transport))
+
+    assert client.institutions.get("053285241").errors[0].status == "429"
+
+    started_at = time.monotonic()
+    with pytest.raises(DeadlineExceeded):
+        with deadline(0.2):
+            client.institutions.get("053285241")
+
+    assert time.monotonic() - started_at < 0.5
+    assert len(transport.timeouts) == 1
+
+
+def test_async_retry_after_wait_is_bounded_by_the_deadline():
+    c = Configuration("https://api.s.unit.sh", "token")
+    c.rate_limiter.blocked_until = time.monotonic() + 3
+
+    async def acquire():
+        return await c.rate_limiter.acquire_async(0.2)
+
+    started_at = time.monotonic()
+    assert asyncio.run(acquire()) is False
+    assert time.monotonic() - started_at < 0.1
+
+
+def test_concurrency_wait_is_bounded_by_the_deadline():
+    transport = StubTransport([200])
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    client = Unit(configuration=Configuration("https://api.s.unit.sh", "token", transport=transport,
+                                              concurrency_limiter=limiter))
+    started_at = limiter.acquire()
+
+    with pytest.raises(DeadlineExceeded):
+        with deadline(0.1):
+            client.institutions.get("053285241")
+
+    assert transport.timeouts == [] and limiter.in_flight == 1
+
+    async def acquire():
+        return await limiter.acquire_async(0.05)
+
+    assert asyncio.run(acquire()) is None
+    limiter.release(started_at, 200)
+    assert limiter.in_flight == 0
+
+
+def test_expired_deadline_raises():
+    client = Unit(configuration=Configuration("https://api.s.unit.sh", "token", transport=StubTransport([200])))
+
+    with pytest.raises(DeadlineExceeded):
+        with deadline(0):
+            client.institutions.get("053285241")
+
+
+def test_nested_deadline_cannot_extend_the_enclosing_one():
+    transport = StubTransport([404])
+    client = Unit(configuration=Configuration("https://api.s.unit.sh", "token", transport=transport))
+
+    with deadline(1):
+        with deadline(30):
+            client.institutions.get("053285241")
+
+    assert transport.timeouts[0][1] <= 1
+
+
+class StalledHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        time.sleep(1)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.mark.parametrize("transport", [RequestsTransport, Urllib3Transport])
+def test_stalled_socket_is_bounded_by_the_deadline(transport):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StalledHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    c = Configuration(f"http://127.0.0.1:{server.server_port}", "token", transport=transport())
+    client = Unit(configuration=c)
+
+    started_at = time.monotonic()
+    try:
+        with pytest.raises(DeadlineExceeded):
+            with deadline(0.2):
+                client.institutions.get("053285241")
+    finally:
+        server.shutdown()
+        client.close()
+
+    assert time.monotonic() - started_at < 0.8
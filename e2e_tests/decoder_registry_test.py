@@ -0,0 +1,67 @@
+from unit.models import RawUnitObject, register_decoder, decoders
+from unit.models.card import PinStatusDTO
+from unit.models.codecs import DtoDecoder, mappings
+from unit.models.transaction import BookTransactionDTO, transactions_mapper
+
+book_transaction = {
+    "type": "bookTransaction",
+    "id": "1",
+    "attributes": {
+        "createdAt": "2022-02-10T17:56:49.235Z",
+        "direction": "Credit",
+        "amount": 100,
+        "balance": 1000,
+        "summary": "Book transfer",
+        "counterparty": {"name": "April Oniel", "routingNumber": "812345678", "accountNumber": "1000000001",
+                         "accountType": "Checking"}
+    },
+    "relationships": {
+        "account": {"data": {"type": "account", "id": "10"}}
+    }
+}
+
+
+def test_mappings_is_the_registry():
+    assert mappings is decoders
+    assert "achPayment" in decoders
+    assert "bookTransaction" in decoders
+
+
+def test_decode_transaction_through_registry():
+    dto = DtoDecoder.decode(book_transaction)
+    assert isinstance(dto, BookTransactionDTO)
+    assert dto.id == "1"
+
+    dto = transactions_mapper(book_transaction["id"], book_transaction["type"], book_transaction["attributes"],
+                              book_transaction["relationships"])
+    assert isinstance(dto, BookTransactionDTO)
+
+
+def test_unknown_type_decodes_to_raw_object():
+    dto = DtoDecoder.decode({"type": "somethingNew", "id": "7", "attributes": {"a": 1}})
+    assert isinstance(dto, RawUnitObject)
+    assert dto.type == "somethingNew"
+
+
+def test_decoder_with_partial_signature():
+    dto = DtoDecoder.decode({"type": "pinStatus", "attributes": {"status": "Set"}})
+    assert isinstance(dto, PinStatusDTO)
+
+
+def test_register_custom_decoder():
+    @register_decoder("testWidget")
+    class WidgetDTO(object):
+        def __init__(self, _id, name):
+            self.id = _id
+            self.name = name
+
+        @staticmethod
+        def from_json_api(_id, attributes):
+            return WidgetDTO(_id, attributes["name"])
+
+    try:
+        dto = DtoDecoder.decode({"type": "testWidget", "id": "3", "attributes": {"name": "w"}})
+        assert isinstance(dto, WidgetDTO)
+        assert dto.id == "3" and dto.name == "w"
+    finally:
+        del decoders["testWidget"]
@@ -0,0 +1,139 @@
+import asyncio
+import json
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+
+from e2e_tests.helpers.fixtures import book_transaction, client
+from unit import Unit, AsyncUnit
+from unit.models.transaction import ListTransactionParams
+from unit.utils import date_utils
+from unit.utils.configuration import Configuration
+from unit.utils.transport import Transport, TransportResponse, AsyncHttpxTransport
+
+start = datetime(2022, 1, 1, tzinfo=timezone.utc)
+end = start + timedelta(days=10)
+
+
+def timestamp(dt):
+    return dt.astimezone(timezone.utc).replace(tzinfo=None).isoformat(timespec="milliseconds") + "Z"
+
+
+
+# a quiet week followed by a busy day
+created = [start + timedelta(hours=7 * i) for i in range(24)] + \
+          [start + timedelta(days=8, seconds=17 * i) for i in range(3000)]
+transactions = [book_transaction(i, timestamp(c)) for i, c in enumerate(created)]
+
+
+def list_page(params, listed=None, exclusive=False):
+    since = date_utils.to_datetime(params.get("filter[since]", "2000-01-01T00:00:00.000Z"))
+    until = date_utils.to_datetime(params.get("filter[until]", "2100-01-01T00:00:00.000Z"))
+    limit, offset = int(params["page[limit]"]), int(params["page[offset]"])
+
+    # newest first, as the API lists them by default
+    listed = listed or list(zip(transactions, created))
+    matching = [t for t, c in listed if (since < c if exclusive else since <= c) and c < until][::-1]
+    return {"data": matching[offset:offset + limit],
+            "meta": {"pagination": {"total": len(matching), "limit": limit, "offset": offset}}}
+
+
+class ExportTransport(Transport):
+    def __init__(self, listed=None, exclusive=False):
+        self.params = []
+        self.listed = listed
+        self.exclusive = exclusive
+
+    def request(self, method, url, params=None, data=None, headers=None, timeout=None):
+        self.params.append(params)
+        return TransportResponse(200, {}, json.dumps(list_page(params, self.listed, self.exclusive)).encode())
+
+
+
+def test_export_yields_every_transaction_in_order():
+    transport = ExportTransport()
+    export = client(transport).transactions.export(start, end, ListTransactionParams(limit=100),
+                                                   window=timedelta(days=1), window_size=500)
+
+    assert [t.id for t in export] == [str(i) for i in range(len(created))]
+    assert export.exported == len(created)
+    assert max(int(p["page[offset]"]) for p in transport.params) < 500
+    assert all("filter[since]" in p and "filter[until]" in p for p in transport.params)
+
+
+def test_export_resumes_from_checkpoint(tmp_path):
+    checkpoint = str(tmp_path / "export.json")
+    unit = client(ExportTransport())
+
+    exported = []
+    with pytest.raises(RuntimeError):
+        for t in unit.transactions.export(start, end, window=timedelta(days=1), window_size=500,
+                                          checkpoint=checkpoint):
+            if len(exported) == 1500:
+                raise RuntimeError("crashed")
+            exported.append(t.id)
+
+    with open(checkpoint) as f:
+        state = json.load(f)
+    completed_until = date_utils.to_datetime(state["completed_until"])
+    done = [str(i) for i, c in enumerate(created) if c < completed_until]
+    assert 0 < len(done) <= 1500 and exported[:len(done)] == done and state["exported"] == len(done)
+
+    resumed = unit.transactions.export(start, end, window=timedelta(days=1), window_size=500,
+                                       checkpoint=checkpoint)
+    assert done + [t.id for t in resumed] == [str(i) for i in range(len(created))]
+    assert resumed.exported == len(created)
+
+    with pytest.raises(Exception):
+        list(unit.transactions.export(start, end - timedelta(days=1), checkpoint=checkpoint))
+
+
+def test_export_adapts_windows_to_density():
+    export = client(ExportTransport()).transactions.export(start, end, window=timedelta(days=1), window_size=500)
+    list(export)
+
+    # the busy day holds 3000 transactions, about 0.035 per second
+    assert 0.001 < export.density < 0.1
+    assert export.next_duration() < timedelta(days=1)
+
+
+def test_events_export_filters_by_time():
+    transport = ExportTransport()
+    list(client(transport).events.export(start, start + timedelta(hours=2), workers=1))
+
+    assert [(p["filter[since]"], p["filter[until]"]) for p in transport.params] == [
+        ("2021-12-31T23:59:59.999Z", "2022-01-01T01:00:00.001Z"),
+        ("2022-01-01T00:59:59.999Z", "2022-01-01T02:00:00.001Z")]
+
+
+def test_resources_on_window_boundaries_are_exported_once():
+    # on the bounds of both windows, on the bounds of the three pieces the second window is split into, on `end`
+    day = timedelta(days=1)
+    boundaries = [start, start + day, start + day + timedelta(hours=8), start + day + timedelta(hours=16)]
+    fillers = [start + timedelta(hours=12)] + \
+              [start + day + timedelta(hours=h) for h in (1, 2, 3, 9, 10, 11, 17, 18, 19)]
+    times = sorted(boundaries + fillers) + [start + 2 * day]
+    listed = [(book_transaction(i, timestamp(c)), c) for i, c in enumerate(times)]
+
+    # an API excluding both bounds of its filters
+    transport = ExportTransport(listed, exclusive=True)
+    export = client(transport).transactions.export(start, start + 2 * day, window=day, window_size=10)
+
+    assert [t.id for t in export] == [str(i) for i in range(len(times) - 1)]
+    assert ("2022-01-02T07:59:59.999Z", "2022-01-02T16:00:00.001Z") in \
+        [(p["filter[since]"], p["filter[until]"]) for p in transport.params]
+
+
+def test_async_export():
+    def handler(request):
+        return httpx.Response(200, content=json.dumps(list_page(dict(request.url.params))).encode())
+
+    async def export():
+        transport = AsyncHttpxTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        async with AsyncUnit(configuration=Configuration("https://api.s.unit.sh", "token",
+                                                         async_transport=transport)) as unit:
+            return [t.id async for t in unit.transactions.export(start, end, window=timedelta(days=1),
+                                                                 window_size=500)]
+
+    assert asyncio.run(export()) == [str(i) for i in range(len(created))]
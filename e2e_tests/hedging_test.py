@@ -0,0 +1,180 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+
+from unit import Unit, AsyncUnit
+from unit.utils.circuit_breaker import CircuitBreaker, CLOSED
+from unit.utils.concurrency import AdaptiveConcurrencyLimiter
+from unit.utils.configuration import Configuration
+from unit.utils.hedging import HedgingPolicy
+from unit.utils.transport import Transport, TransportResponse, AsyncHttpxTransport
+
+
+def warm_up(policy: HedgingPolicy, latency: float, requests: int = 100):
+    for _ in range(requests):
+        policy.record(latency)
+    policy.requests += requests
+
+
+def test_no_hedging_until_latencies_are_known():
+    policy = HedgingPolicy(min_samples=5)
+    assert policy.delay() is None
+
+    warm_up(policy, 0.01, 5)
+    assert policy.delay() == 0.01
+
+
+def test_slow_request_is_hedged():
+    policy = HedgingPolicy()
+    warm_up(policy, 0.01)
+    calls = []
+
+    def send(_):
+        calls.append(time.monotonic())
+        if len(calls) == 1:
+            time.sleep(0.5)
+            return "slow"
+        return "fast"
+
+    started_at = time.monotonic()
+    assert policy.call(send, None) == "fast"
+    assert time.monotonic() - started_at < 0.4
+    assert policy.hedged_requests == 1
+    policy.close()
+
+
+def test_budget_caps_hedged_requests():
+    policy = HedgingPolicy(budget=0.05)
+    warm_up(policy, 0.001, 20)
+
+    assert policy.spend()
+    assert not policy.spend()
+
+
+def test_failed_request_falls_back_to_the_other_one():
+    policy = HedgingPolicy()
+    warm_up(policy, 0.01)
+    calls = []
+
+    def send(_):
+        calls.append(1)
+        if len(calls) == 1:
+            time.sleep(0.05)
+            return "primary"
+        raise Exception("connection reset")
+
+    assert policy.call(send, None) == "primary"
+    policy.close()
+
+
+def test_time_waiting_for_a_thread_is_not_latency():
+    policy = HedgingPolicy(min_samples=100, max_workers=1)
+
+    def send(_):
+        time.sleep(0.1)
+        return "ok"
+
+    threads = [threading.Thread(target=policy.call, args=(send, None)) for _ in range(2)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # the second request waited 0.1s for the only thread before being sent
+    assert len(policy.latencies) == 2 and max(policy.latencies) < 0.18
+    policy.close()
+
+
+def test_async_slow_request_is_hedged():
+    policy = HedgingPolicy()
+    warm_up(policy, 0.01)
+    cancelled = []
+
+    async def send(i):
+        if not cancelled:
+            cancelled.append(False)
+            try:
+                await asyncio.sleep(0.5)
+            except asyncio.CancelledError:
+                cancelled[0] = True
+                raise
+            return "slow"
+        return "fast"
+
+    async def run():
+        result = await policy.call_async(send, None)
+        await asyncio.sleep(0)
+        return result
+
+    assert asyncio.run(run()) == "fast"
+    assert cancelled == [True]
+
+
+def test_async_cancelled_hedge_records_no_outcome():
+    institution = {"data": {"type": "institution", "id": "1",
+                            "attributes": {"routingNumber": "053285241", "name": "Bank", "isACHSupported": True,
+                                           "isWireSupported": False}}}
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            await asyncio.sleep(0.5)
+        return httpx.Response(200, content=json.dumps(institution).encode())
+
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10)
+    breaker = CircuitBreaker(minimum_calls=1)
+    policy = HedgingPolicy()
+    warm_up(policy, 0.01)
+
+    async def get():
+        transport = AsyncHttpxTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        c = Configuration("https://api.s.unit.sh", "token", async_transport=transport, concurrency_limiter=limiter)
+        c.add_circuit_breaker("institutions/*", breaker)
+        c.set_hedging_policy(policy, resource="institutions")
+        async with AsyncUnit(configuration=c) as unit:
+            response = await unit.institutions.get("053285241")
+            await asyncio.sleep(0.01)
+            return response
+
+    assert asyncio.run(get()).data.attributes["name"] == "Bank"
+    assert len(calls) == 2 and policy.hedged_requests == 1
+    # only the winner has an outcome
+    assert breaker.state == CLOSED and list(breaker.outcomes) == [False]
+    assert limiter.limit >= 10 and limiter.in_flight == 0
+
+
+class SlowTransport(Transport):
+    def __init__(self):
+        self.calls = 0
+        self.lock = threading.Lock()
+
+    def request(self, method, url, params=None, data=None, headers=None, timeout=None):
+        with self.lock:
+            self.calls += 1
+            call = self.calls
+        if call == 101:
+            time.sleep(0.5)
+        body = {"data": {"type": "pinStatus", "attributes": {"status": "Set"}}}
+        return TransportResponse(200, {}, json.dumps(body).encode())
+
+
+def test_gets_are_hedged_only_for_opted_in_resources():
+    transport = SlowTransport()
+    c = Configuration("https://api.s.unit.sh", "token", transport=transport)
+    policy = HedgingPolicy()
+    c.set_hedging_policy(policy, resource="cards")
+    client = Unit(configuration=c)
+
+    for _ in range(100):
+        client.cards.get_pin_status("1")
+
+    started_at = time.monotonic()
+    assert client.cards.get_pin_status("1").data.attributes["status"] == "Set"
+    assert time.monotonic() - started_at < 0.4
+    assert policy.hedged_requests == 1
+    assert c.get_hedging_policy("accounts") is None
+    client.close()
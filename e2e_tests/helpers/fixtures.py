@@ -0,0 +1,23 @@
+from unit import Unit
+from unit.utils.configuration import Configuration
+
+
+def book_transaction(i, created_at="2022-02-10T17:56:49.235Z", summary="Book transfer", direction="Credit",
+                     account_id="10", **relationships):
+    """
+    A bookTransaction resource with id and amount `i`, related to account `account_id` and to every extra
+    relationship given as a keyword argument.
+    """
+    return {
+        "type": "bookTransaction",
+        "id": str(i),
+        "attributes": {"createdAt": created_at, "amount": i, "direction": direction, "balance": 1000,
+                       "summary": summary,
+                       "counterparty": {"name": "April Oniel", "routingNumber": "812345678",
+                                        "accountNumber": "1000000001", "accountType": "Checking"}},
+        "relationships": {"account": {"data": {"type": "account", "id": account_id}}, **relationships}
+    }
+
+
+def client(transport, **kwargs):
+    return Unit(configuration=Configuration("https://api.s.unit.sh", "token", transport=transport, **kwargs))
@@ -0,0 +1,35 @@
+import json
+from typing import Dict, Iterable, Optional
+
+from unit.utils.transport import Transport, TransportResponse
+
+
+def error_body(status: int):
+    return {"errors": [{"title": "error", "status": str(status)}]}
+
+
+class StubTransport(Transport):
+    """
+    Scripted transport for the offline tests: answers every request with the next of `statuses`, repeating the last
+    one once they ran out, with `body` for 2xx statuses and `error` (a generic error document by default) otherwise.
+    Every response carries `headers`. The method and url of every request are recorded in `calls`, its timeout in
+    `timeouts`.
+    """
+    def __init__(self, statuses: Iterable[int] = (200,), body=None, error=None, headers: Optional[Dict] = None):
+        self.statuses = list(statuses)
+        self.body = body
+        self.error = error
+        self.headers = headers or {}
+        self.calls = []
+        self.timeouts = []
+
+    def request(self, method, url, params=None, data=None, headers=None, timeout=None):
+        self.calls.append((method, url))
+        self.timeouts.append(timeout)
+        status = self.statuses.pop(0) if len(self.statuses) > 1 else self.statuses[0]
+        if 200 <= status < 300:
+            body = self.body
+        else:
+            body = self.error if self.error is not None else error_body(status)
+
+        return TransportResponse(status, self.headers, json.dumps(body).encode())
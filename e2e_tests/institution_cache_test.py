@@ -0,0 +1,192 @@
+import asyncio
+import json
+import multiprocessing
+import os
+import threading
+import time
+
+import httpx
+import pytest
+
+from e2e_tests.helpers.fixtures import client
+from unit import Unit, AsyncUnit
+from unit.models import UnitError
+from unit.utils.configuration import Configuration
+from unit.utils.deadline import DeadlineExceeded, deadline
+from unit.utils.institution_cache import InstitutionCache
+from unit.utils.transport import Transport, TransportResponse, AsyncHttpxTransport
+
+
+def institution(routing_number):
+    return json.dumps({"data": {"type": "institution", "id": routing_number,
+                                "attributes": {"routingNumber": routing_number, "name": f"Bank {routing_number}",
+                                               "isACHSupported": True, "isWireSupported": False}}}).encode()
+
+
+not_found = json.dumps({"errors": [{"title": "Not Found", "status": "404"}]}).encode()
+
+
+class InstitutionTransport(Transport):
+    def __init__(self):
+        self.calls = []
+
+    def request(self, method, url, params=None, data=None, headers=None, timeout=None):
+        routing_number = url.rsplit("/", 1)[-1]
+        self.calls.append(routing_number)
+        if routing_number.startswith("0"):
+            return TransportResponse(404, {}, not_found)
+
+        return TransportResponse(200, {}, institution(routing_number))
+
+
+
+def test_get_is_cached_across_restarts(tmp_path):
+    path = str(tmp_path / "institutions.db")
+    transport = InstitutionTransport()
+
+    unit = client(transport, institution_cache=InstitutionCache(path))
+    assert unit.institutions.get("812345678").data.attributes["name"] == "Bank 812345678"
+
+    # a new process opening the same database
+    cache = InstitutionCache(path)
+    unit = client(transport, institution_cache=cache)
+    for _ in range(3):
+        assert unit.institutions.get("812345678").data.attributes["routingNumber"] == "812345678"
+
+    assert transport.calls == ["812345678"] and (cache.hits, cache.misses) == (3, 0)
+
+
+def test_errors_are_not_cached(tmp_path):
+    transport = InstitutionTransport()
+    unit = client(transport, institution_cache=InstitutionCache(str(tmp_path / "institutions.db")))
+
+    assert isinstance(unit.institutions.get("012345678"), UnitError)
+    assert isinstance(unit.institutions.get("012345678"), UnitError)
+    assert transport.calls == ["012345678", "012345678"]
+
+
+def test_expiry(tmp_path):
+    transport = InstitutionTransport()
+    cache = InstitutionCache(str(tmp_path / "institutions.db"), ttl=0.05)
+    unit = client(transport, institution_cache=cache)
+
+    unit.institutions.get("812345678")
+    unit.institutions.get("812345678")
+    time.sleep(0.06)
+    assert cache.missing(["812345678"]) == ["812345678"]
+    unit.institutions.get("812345678")
+    assert transport.calls == ["812345678", "812345678"]
+
+    time.sleep(0.06)
+    assert cache.purge_expired() == 1 and len(cache) == 0
+
+
+def test_warm_up(tmp_path):
+    transport = InstitutionTransport()
+    cache = InstitutionCache(str(tmp_path / "institutions.db"))
+    unit = client(transport, institution_cache=cache)
+    routing_numbers = [str(100000000 + i) for i in range(20)] + ["012345678"]
+
+    errors = unit.institutions.warm_up(routing_numbers + routing_numbers[:5], workers=4)
+    assert list(errors) == ["012345678"] and errors["012345678"].errors[0].status == "404"
+    assert sorted(transport.calls) == sorted(routing_numbers) and len(cache) == 20
+
+    # only the routing number that failed is fetched again
+    assert list(unit.institutions.warm_up(routing_numbers)) == ["012345678"]
+    assert len(transport.calls) == len(routing_numbers) + 1
+
+    unit.institutions.get("100000007")
+    cache.invalidate("100000007")
+    unit.institutions.get("100000007")
+    assert transport.calls[-1] == "100000007" and len(transport.calls) == len(routing_numbers) + 2
+
+
+def test_warm_up_requires_a_cache():
+    with pytest.raises(Exception, match="institution_cache"):
+        client(InstitutionTransport(), institution_cache=None).institutions.warm_up(["812345678"])
+
+
+def test_warm_up_runs_in_the_callers_context(tmp_path):
+    transport = InstitutionTransport()
+    unit = client(transport, institution_cache=InstitutionCache(str(tmp_path / "institutions.db")))
+
+    with deadline(0.001):
+        time.sleep(0.01)
+        with pytest.raises(DeadlineExceeded):
+            unit.institutions.warm_up(["812345678", "812345679"], workers=2)
+    assert transport.calls == []
+
+
+def test_in_memory_database_is_rejected():
+    for path in (":memory:", "", "file::memory:?cache=shared"):
+        with pytest.raises(Exception, match="database file"):
+            InstitutionCache(path)
+
+
+def open_files(path):
+    return sum(os.path.realpath(f"/proc/self/fd/{fd}") == os.path.realpath(path) for fd in os.listdir("/proc/self/fd"))
+
+
+def test_close_closes_the_connections_of_every_thread(tmp_path):
+    path = str(tmp_path / "institutions.db")
+    cache = InstitutionCache(path)
+    cache.put("1", institution("1"))
+    threads = [threading.Thread(target=cache.get, args=("1",)) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert open_files(path) == 5 and (cache.hits, cache.misses) == (4, 0)
+
+    cache.close()
+    assert open_files(path) == 0
+
+    # the cache reconnects when used again
+    assert cache.get("1") == institution("1") and open_files(path) == 1
+
+
+def fill(path, start):
+    cache = InstitutionCache(path)
+    for i in range(start, start + 50):
+        cache.put(str(i), institution(str(i)))
+        assert cache.get(str(i)) is not None
+
+
+def test_shared_across_processes(tmp_path):
+    path = str(tmp_path / "institutions.db")
+    cache = InstitutionCache(path)
+    cache.put("1", institution("1"))
+
+    context = multiprocessing.get_context("fork")
+    processes = [context.Process(target=fill, args=(path, 1000 * (i + 1))) for i in range(4)]
+    # the child inherits the parent's cache and must open its own connection
+    processes.append(context.Process(target=cache.put_many, args=({"2": institution("2")},)))
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join()
+
+    assert [process.exitcode for process in processes] == [0] * 5
+    assert len(cache) == 202 and cache.get("2") == institution("2")
+
+
+def test_async_warm_up(tmp_path):
+    calls = []
+
+    def handler(request):
+        routing_number = request.url.path.rsplit("/", 1)[-1]
+        calls.append(routing_number)
+        return httpx.Response(200, content=institution(routing_number))
+
+    async def warm_up():
+        transport = AsyncHttpxTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        cache = InstitutionCache(str(tmp_path / "institutions.db"))
+        async with AsyncUnit(configuration=Configuration("https://api.s.unit.sh", "token", async_transport=transport,
+                                                         institution_cache=cache)) as unit:
+            errors = await unit.institutions.warm_up([str(100000000 + i) for i in range(10)], workers=3)
+            response = await unit.institutions.get("100000003")
+            return errors, response
+
+    errors, response = asyncio.run(warm_up())
+    assert errors == {} and len(calls) == 10
+    assert response.data.attributes["name"] == "Bank 100000003"
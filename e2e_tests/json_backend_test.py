@@ -0,0 +1,89 @@
+import json
+
+import pytest
+
+from e2e_tests.helpers.transport import StubTransport
+from unit import Unit
+from unit.utils import json_backend
+from unit.utils.configuration import Configuration
+
+payment = {
+    "type": "achPayment",
+    "id": "1",
+    "attributes": {
+        "createdAt": "2022-02-10T17:56:49.235Z",
+        "status": "Pending",
+        "direction": "Credit",
+        "description": "Payment",
+        "amount": 100,
+        "sameDay": False,
+        "counterparty": {
+            "name": "April Oniel",
+            "routingNumber": "812345678",
+            "accountNumber": "1000000001",
+            "accountType": "Checking"
+        }
+    },
+    "relationships": {
+        "account": {"data": {"type": "account", "id": "10"}}
+    }
+}
+
+
+def counting_loads(monkeypatch):
+    calls = []
+
+    def loads(content):
+        calls.append(content)
+        return json.loads(content)
+
+    monkeypatch.setattr(json_backend, "loads", loads)
+    return calls
+
+
+def test_response_is_parsed_once(monkeypatch):
+    body = {"data": [payment], "included": [{"type": "account", "id": "10", "attributes": {}}],
+            "meta": {"pagination": {"total": 1, "limit": 100, "offset": 0}}}
+    client = Unit(configuration=Configuration("https://api.s.unit.sh", "token", transport=StubTransport([200], body)))
+    calls = counting_loads(monkeypatch)
+
+    response = client.payments.list()
+
+    assert len(calls) == 1
+    assert response.data[0].id == "1"
+    assert response.included[0].type == "account"
+    assert response.meta["pagination"]["total"] == 1
+
+
+def test_errors_are_parsed_once(monkeypatch):
+    body = {"errors": [{"title": "Not Found", "status": "404"}]}
+    transport = StubTransport([404], error=body)
+    client = Unit(configuration=Configuration("https://api.s.unit.sh", "token", transport=transport))
+    calls = counting_loads(monkeypatch)
+
+    response = client.payments.get("1")
+
+    assert len(calls) == 1
+    assert response.errors[0].title == "Not Found"
+
+
+def test_backend_selection(monkeypatch):
+    assert json_backend.load_backend("json")[:2] == ("json", json.loads)
+
+    monkeypatch.setenv("UNIT_JSON_BACKEND", "json")
+    assert json_backend.load_backend()[0] == "json"
+
+    monkeypatch.setenv("UNIT_JSON_BACKEND", "simplejson")
+    with pytest.raises(Exception):
+        json_backend.load_backend()
+
+
+def test_backends_parse_alike():
+    content = json.dumps({"data": [payment]}).encode()
+    for name in json_backend.BACKENDS:
+        try:
+            _, loads, _ = json_backend.load_backend(name)
+        except ImportError:
+            continue
+
+        assert loads(content) == json.loads(content)
@@ -0,0 +1,149 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from e2e_tests.helpers.transport import StubTransport
+from unit import Unit
+from unit.models import Counterparty, Relationship, RawUnitObject
+from unit.models.account import DepositAccountDTO
+from unit.models.card import PinStatusDTO
+from unit.models.codecs import DtoDecoder, LazyDTO, LazyAttributes, encode
+from unit.models.transaction import BookTransactionDTO
+from unit.utils.configuration import Configuration
+
+book_transaction = {
+    "type": "bookTransaction",
+    "id": "1",
+    "attributes": {
+        "createdAt": "2022-02-10T17:56:49.235Z",
+        "direction": "Credit",
+        "amount": 100,
+        "balance": 1000,
+        "summary": "Book transfer",
+        "counterparty": {"name": "April Oniel", "routingNumber": "812345678", "accountNumber": "1000000001",
+                         "accountType": "Checking"}
+    },
+    "relationships": {
+        "account": {"data": {"type": "account", "id": "10"}}
+    }
+}
+
+deposit_account = {
+    "type": "depositAccount",
+    "id": "10",
+    "attributes": {
+        "createdAt": "2022-02-10T17:56:49.235Z",
+        "name": "Peter Parker",
+        "depositProduct": "checking",
+        "routingNumber": "812345678",
+        "accountNumber": "1000000001",
+        "currency": "USD",
+        "balance": 1000,
+        "hold": 0,
+        "available": 1000,
+        "status": "Open"
+    },
+    "relationships": {
+        "customer": {"data": {"type": "customer", "id": "5"}}
+    }
+}
+
+purchase_transaction = {
+    "type": "purchaseTransaction",
+    "id": "2",
+    "attributes": {
+        "createdAt": "2022-02-10T17:56:49.235Z",
+        "direction": "Debit",
+        "amount": 2500,
+        "balance": 7500,
+        "summary": "Coffee",
+        "cardLast4Digits": "0001",
+        "merchant": {"name": "Coffee Shop", "type": 5814, "category": "Restaurants"},
+        "recurring": False
+    },
+    "relationships": {
+        "account": {"data": {"type": "account", "id": "10"}}
+    }
+}
+
+ach_payment = {
+    "type": "achPayment",
+    "id": "3",
+    "attributes": {
+        "createdAt": "2022-02-10T17:56:49.235Z",
+        "status": "Pending",
+        "counterparty": {"name": "April Oniel", "routingNumber": "812345678", "accountNumber": "1000000001",
+                         "accountType": "Checking"},
+        "direction": "Credit",
+        "description": "Rent",
+        "amount": 10000,
+        "sameDay": False
+    }
+}
+
+
+def test_lazy_attributes_are_converted_on_access():
+    dto = DtoDecoder.decode(book_transaction, lazy=True)
+
+    assert type(dto) is LazyDTO
+    assert isinstance(dto, BookTransactionDTO)
+    assert dto.id == "1" and dto.type == "bookTransaction"
+    assert isinstance(dto.attributes, LazyAttributes)
+    assert dto.attributes.pending.keys() == {"createdAt", "counterparty"}
+
+    assert dto.attributes["amount"] == 100
+    assert dto.attributes["createdAt"] == datetime(2022, 2, 10, 17, 56, 49, 235000, tzinfo=timezone.utc)
+    assert dto.attributes.pending.keys() == {"counterparty"}
+    assert isinstance(dto.attributes.get("counterparty"), Counterparty)
+    assert dto.attributes["tags"] is None
+    with pytest.raises(KeyError):
+        dto.attributes["cardNetwork"]
+
+    relationship = dto.relationships["account"]
+    assert isinstance(relationship, Relationship) and relationship.id == "10"
+
+
+def test_lazy_dto_matches_eager_dto():
+    for payload in [book_transaction, deposit_account]:
+        eager = DtoDecoder.decode(payload)
+        lazy = DtoDecoder.decode(payload, lazy=True)
+
+        assert isinstance(lazy, type(eager))
+        assert lazy.attributes.keys() == {k for k, v in eager.attributes.items() if v is not None}
+        assert json.loads(encode(lazy)) == json.loads(encode(eager))
+
+
+def test_lazy_attribute_access_matches_eager_access():
+    for payload in [book_transaction, deposit_account, purchase_transaction, ach_payment]:
+        eager = DtoDecoder.decode(payload)
+        lazy = DtoDecoder.decode(payload, lazy=True)
+
+        # every attribute the eager DTO sets, including the optional ones the response leaves out
+        for name, value in eager.attributes.items():
+            assert json.loads(encode({name: lazy.attributes[name]})) == json.loads(encode({name: value}))
+            assert json.loads(encode({name: lazy.attributes.get(name)})) == json.loads(encode({name: value}))
+
+
+def test_lazy_dto_without_lazy_attributes_is_materialized():
+    dto = DtoDecoder.decode({"type": "pinStatus", "attributes": {"status": "Set"}}, lazy=True)
+    assert isinstance(dto, PinStatusDTO)
+    assert dto.materialize() is dto.materialize()
+    assert dto.attributes == dto.materialize().attributes
+
+    dto = DtoDecoder.decode({"type": "somethingNew", "id": "7", "attributes": {"a": 1}}, lazy=True)
+    assert isinstance(dto, RawUnitObject)
+    assert dto.attributes == {"a": 1}
+
+
+def test_lazy_decoding_configuration():
+    body = {"data": [deposit_account]}
+    configuration = Configuration("https://api.s.unit.sh", "token", transport=StubTransport([200], body),
+                                  lazy_decoding=True)
+    response = Unit(configuration=configuration).accounts.list()
+
+    account = response.data[0]
+    assert type(account) is LazyDTO and isinstance(account, DepositAccountDTO)
+    assert account.attributes["balance"] == 1000
+    assert account.attributes["updatedAt"] is None
+    assert account.relationships["customer"].id == "5"
@@ -0,0 +1,177 @@
+import asyncio
+import json
+import random
+import threading
+import time
+
+import httpx
+import pytest
+
+from e2e_tests.helpers.fixtures import book_transaction, client
+from unit import Unit, AsyncUnit
+from unit.models.transaction import ListTransactionParams
+from unit.utils.configuration import Configuration
+from unit.utils.pagination import PaginationError
+from unit.utils.raw import raw_responses
+from unit.utils.transport import Transport, TransportResponse, AsyncHttpxTransport
+
+
+
+def page(total, limit, offset, meta=True):
+    body = {"data": [book_transaction(i) for i in range(offset, min(offset + limit, total))]}
+    if meta:
+        body["meta"] = {"pagination": {"total": total, "limit": limit, "offset": offset}}
+    return body
+
+
+class PagingTransport(Transport):
+    def __init__(self, total, meta=True, fail_at=None, delay=0):
+        self.total = total
+        self.meta = meta
+        self.fail_at = fail_at
+        self.delay = delay
+        self.offsets = []
+        self.threads = set()
+
+    def request(self, method, url, params=None, data=None, headers=None, timeout=None):
+        limit, offset = int(params["page[limit]"]), int(params["page[offset]"])
+        self.offsets.append(offset)
+        self.threads.add(threading.get_ident())
+        time.sleep(random.random() * self.delay)
+        if offset == self.fail_at:
+            body = {"errors": [{"title": "Bad Request", "status": "400"}]}
+            return TransportResponse(400, {}, json.dumps(body).encode())
+
+        return TransportResponse(200, {}, json.dumps(page(self.total, limit, offset, self.meta)).encode())
+
+
+
+def test_iter_all_walks_every_page():
+    transport = PagingTransport(250)
+    transactions = client(transport).transactions.iter_all(ListTransactionParams(limit=100))
+
+    assert next(transactions).id == "0"
+    assert transport.offsets == [0]
+    assert [t.id for t in transactions] == [str(i) for i in range(1, 250)]
+    assert transport.offsets == [0, 100, 200]
+
+
+def test_iter_all_stops_on_total():
+    transport = PagingTransport(200)
+    assert len(client(transport).transactions.list_all(ListTransactionParams(limit=100))) == 200
+    assert transport.offsets == [0, 100]
+
+
+def test_iter_all_stops_on_empty_page_without_meta():
+    transport = PagingTransport(200, meta=False)
+    assert len(client(transport).transactions.list_all(ListTransactionParams(limit=100))) == 200
+    assert transport.offsets == [0, 100, 200]
+
+
+def test_iter_all_defaults_and_offset():
+    transport = PagingTransport(150)
+    unit = client(transport)
+
+    assert len(unit.transactions.list_all()) == 150
+    assert transport.offsets == [0, 100]
+
+    params = ListTransactionParams(limit=50, offset=100)
+    assert [t.id for t in unit.transactions.iter_all(params)][0] == "100"
+    assert params.offset == 100
+
+
+def test_iter_all_raises_on_error():
+    transactions = client(PagingTransport(300, fail_at=100)).transactions.iter_all()
+
+    assert len([next(transactions) for _ in range(100)]) == 100
+    with pytest.raises(PaginationError) as e:
+        next(transactions)
+    assert e.value.offset == 100 and e.value.error.errors[0].status == "400"
+
+
+def test_iter_all_requires_list_params():
+    with pytest.raises(Exception):
+        client(PagingTransport(0)).institutions.iter_all()
+
+
+def test_prefetch_yields_in_order():
+    transport = PagingTransport(1050, delay=0.01)
+    transactions = client(transport).transactions.iter_all(ListTransactionParams(limit=100), prefetch_pages=4)
+
+    assert [t.id for t in transactions] == [str(i) for i in range(1050)]
+    assert sorted(transport.offsets) == list(range(0, 1100, 100))
+    assert len(transport.threads) > 1
+
+
+def test_prefetch_plans_from_total():
+    transport = PagingTransport(250)
+    assert len(client(transport).transactions.list_all(ListTransactionParams(limit=100), prefetch_pages=8)) == 250
+    assert sorted(transport.offsets) == [0, 100, 200]
+
+    transport = PagingTransport(30)
+    assert len(client(transport).transactions.list_all(prefetch_pages=8)) == 30
+    assert transport.offsets == [0]
+
+
+def test_prefetch_without_total_stops_at_end():
+    transport = PagingTransport(300, meta=False)
+    params = ListTransactionParams(limit=100)
+    assert len(client(transport).transactions.list_all(params, prefetch_pages=2, workers=1)) == 300
+    assert sorted(transport.offsets)[:4] == [0, 100, 200, 300] and len(transport.offsets) <= 6
+
+
+def test_prefetch_raises_on_error():
+    transactions = client(PagingTransport(1000, fail_at=300)).transactions.iter_all(prefetch_pages=3)
+
+    with pytest.raises(PaginationError) as e:
+        for _ in transactions:
+            pass
+    assert e.value.offset == 300
+
+
+def test_prefetch_keeps_raw_responses():
+    unit = client(PagingTransport(250))
+    with raw_responses():
+        transactions = unit.transactions.list_all(ListTransactionParams(limit=100), prefetch_pages=2)
+
+    assert [t["id"] for t in transactions] == [str(i) for i in range(250)]
+
+
+def test_async_iter_all():
+    offsets = []
+
+    def handler(request):
+        limit, offset = int(request.url.params["page[limit]"]), int(request.url.params["page[offset]"])
+        offsets.append(offset)
+        return httpx.Response(200, content=json.dumps(page(120, limit, offset)).encode())
+
+    async def list_all():
+        transport = AsyncHttpxTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        async with AsyncUnit(configuration=Configuration("https://api.s.unit.sh", "token",
+                                                         async_transport=transport)) as unit:
+            ids = [t.id async for t in unit.transactions.iter_all(ListTransactionParams(limit=50))]
+            return ids, await unit.transactions.list_all()
+
+    ids, transactions = asyncio.run(list_all())
+    assert ids == [str(i) for i in range(120)] and len(transactions) == 120
+    assert offsets == [0, 50, 100, 0, 100]
+
+
+def test_async_prefetch():
+    offsets = []
+
+    async def handler(request):
+        limit, offset = int(request.url.params["page[limit]"]), int(request.url.params["page[offset]"])
+        offsets.append(offset)
+        await asyncio.sleep(random.random() * 0.01)
+        return httpx.Response(200, content=json.dumps(page(420, limit, offset)).encode())
+
+    async def list_all():
+        transport = AsyncHttpxTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        async with AsyncUnit(configuration=Configuration("https://api.s.unit.sh", "token",
+                                                         async_transport=transport)) as unit:
+            return [t.id async for t in unit.transactions.iter_all(ListTransactionParams(limit=50),
+                                                                   prefetch_pages=4)]
+
+    assert asyncio.run(list_all()) == [str(i) for i in range(420)]
+    assert sorted(offsets) == list(range(0, 450, 50))
@@ -0,0 +1,64 @@
+from datetime import date
+
+from unit.models import Address, Counterparty, FullName, Phone, Relationship, Payload, UnitRequest
+from unit.models.application import CreateSoleProprietorApplicationRequest
+from unit.models.card import CreateBusinessDebitCard, CreateIndividualDebitCard
+from unit.models.payment import CreateBookPaymentRequest, CreateInlinePaymentRequest
+
+relationships = {"account": Relationship("depositAccount", "1")}
+
+
+def test_payment_payload():
+    request = CreateInlinePaymentRequest(100, "Rent", Counterparty("812345678", "1000000001", "Checking", "Bob"),
+                                         relationships, idempotency_key="1", same_day=False)
+
+    assert request.to_json_api() == {
+        "data": {
+            "type": "achPayment",
+            "attributes": {"amount": 100, "direction": "Credit", "description": "Rent",
+                           "counterparty": request.counterparty, "idempotencyKey": "1"},
+            "relationships": relationships
+        }
+    }
+
+
+def test_unset_optional_attributes_are_omitted():
+    assert CreateBookPaymentRequest(100, "Rent", relationships).to_json_api()["data"]["attributes"] == {
+        "amount": 100, "direction": "Credit", "description": "Rent"}
+    assert CreateIndividualDebitCard(relationships).to_json_api() == {
+        "data": {"type": "individualDebitCard", "attributes": {}, "relationships": relationships}}
+
+
+def test_not_none_attributes_are_sent_when_false():
+    card = CreateBusinessDebitCard(FullName("Peter", "Parker"), date(1990, 1, 2),
+                                   Address("20 Ingram St", "Forest Hills", "NY", "11375", "US"),
+                                   Phone("1", "2025550108"), "peter@oscorp.com", relationships,
+                                   print_only_business_name=False)
+
+    payload = card.to_json_api()
+    assert payload["data"]["type"] == "businessDebitCard"
+    assert payload["data"]["attributes"]["printOnlyBusinessName"] is False
+    assert payload["data"]["attributes"]["dateOfBirth"] == date(1990, 1, 2)
+
+
+def test_extended_payload_includes_parent_attributes():
+    request = CreateSoleProprietorApplicationRequest(
+        FullName("Peter", "Parker"), date(1990, 1, 2), Address("20 Ingram St", "Forest Hills", "NY", "11375", "US"),
+        "peter@oscorp.com", Phone("1", "2025550108"), ssn="721074426", annual_revenue="UpTo250k")
+
+    payload = request.to_json_api()
+    assert "relationships" not in payload["data"]
+    assert payload["data"]["attributes"]["ssn"] == "721074426"
+    assert payload["data"]["attributes"]["annualRevenue"] == "UpTo250k"
+
+
+def test_payload_builder_is_generated_per_class():
+    class CreateTagRequest(UnitRequest):
+        payload = Payload("tag", required=["tag_name"], optional=["tag_color"], relationships=False)
+
+        def __init__(self, tag_name, tag_color=None):
+            self.tag_name = tag_name
+            self.tag_color = tag_color
+
+    assert CreateTagRequest("a").to_json_api() == {"data": {"type": "tag", "attributes": {"tagName": "a"}}}
+    assert CreateTagRequest("a", "red").to_json_api()["data"]["attributes"] == {"tagName": "a", "tagColor": "red"}
@@ -0,0 +1,60 @@
+from unit.utils.rate_limit import RateLimiter, parse_retry_after
+from unit.utils.retry import RetryPolicy
+from unit.utils.transport import TransportResponse
+
+
+def response(status, headers):
+    return TransportResponse(status, headers, b"{}")
+
+
+def test_unlimited_until_limits_are_known():
+    limiter = RateLimiter()
+
+    assert all(limiter.reserve() == 0 for _ in range(100))
+
+
+def test_token_bucket_paces_requests():
+    limiter = RateLimiter(rate=10, burst=2)
+    waits = [limiter.reserve() for _ in range(4)]
+
+    assert waits[:2] == [0, 0]
+    assert 0.05 < waits[2] <= 0.1
+    assert 0.15 < waits[3] <= 0.2
+
+
+def test_reserve_gives_the_token_back_past_timeout():
+    limiter = RateLimiter(rate=10, burst=1)
+
+    assert limiter.reserve(0.5) == 0
+    assert limiter.reserve(0.05) is None
+    assert 0.05 < limiter.reserve(0.5) <= 0.1
+
+
+def test_learns_rate_from_headers():
+    limiter = RateLimiter(burst=1)
+    limiter.update(response(200, {"X-RateLimit-Limit": "100", "X-RateLimit-Remaining": "20",
+                                  "X-RateLimit-Reset": "10"}))
+
+    assert limiter.rate == 2
+    assert limiter.reserve() == 0
+    assert 0.4 < limiter.reserve() <= 0.5
+
+
+def test_retry_after_holds_all_requests():
+    limiter = RateLimiter()
+    limiter.update(response(429, {"Retry-After": "3"}))
+
+    assert 2.9 < limiter.reserve() <= 3
+
+
+def test_retry_policy_honors_retry_after():
+    policy = RetryPolicy(tries=3, max_time=60)
+
+    assert policy.next_wait(policy.waits(), response(429, {"Retry-After": "7"}), 0) == 7
+    assert policy.next_wait(policy.waits(), response(429, {"Retry-After": "7"}), 55) == 5
+    assert 1 <= policy.next_wait(policy.waits(), response(503, {}), 0) <= 2
+
+
+def test_parse_retry_after_http_date():
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0
+    assert parse_retry_after("not a date") is None
@@ -0,0 +1,112 @@
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from e2e_tests.helpers.fixtures import book_transaction, client
+from e2e_tests.helpers.transport import StubTransport
+from unit import Unit, AsyncUnit
+from unit.models import UnitError
+from unit.models.transaction import BookTransactionDTO
+from unit.utils.configuration import Configuration
+from unit.utils.raw import raw_responses
+from unit.utils.retry import RetryPolicy
+from unit.utils.transport import AsyncHttpxTransport
+
+
+
+page = {"data": [book_transaction(i) for i in range(3)],
+        "included": [{"type": "account", "id": "10", "attributes": {}}],
+        "meta": {"pagination": {"total": 3, "limit": 100, "offset": 0}}}
+
+
+
+def test_raw_json_configuration():
+    response = client(StubTransport([200], page), raw_responses="json").transactions.list()
+
+    assert response.data == page["data"]
+    assert response.included == page["included"]
+    assert response.meta == page["meta"]
+
+
+def test_raw_responses_context():
+    unit = client(StubTransport([200], page))
+
+    with raw_responses():
+        response = unit.transactions.list()
+    assert response.data == page["data"]
+
+    with raw_responses("bytes"):
+        response = unit.transactions.list()
+    assert json.loads(response.data) == page
+
+    response = unit.transactions.list()
+    assert isinstance(response.data[0], BookTransactionDTO)
+
+
+def test_raw_context_overrides_configuration():
+    unit = client(StubTransport([200], page), raw_responses="bytes")
+
+    with raw_responses("json"):
+        assert unit.transactions.list().data == page["data"]
+    assert isinstance(unit.transactions.list().data, bytes)
+
+
+def test_raw_errors_are_decoded():
+    for raw_format in ("json", "bytes"):
+        response = client(StubTransport([404], page), raw_responses=raw_format).transactions.list()
+        assert isinstance(response, UnitError)
+        assert response.errors[0].status == "404"
+
+
+def test_raw_responses_are_retried():
+    transport = StubTransport([503, 200], page)
+    c = Configuration("https://api.s.unit.sh", "token", transport=transport, raw_responses="bytes")
+    c.set_retry_policy(RetryPolicy(tries=2, jitter=None, factor=0.001))
+
+    response = Unit(configuration=c).transactions.list()
+    assert json.loads(response.data) == page
+    assert len(transport.calls) == 2
+
+
+def test_raw_stream():
+    unit = client(StubTransport([200], page))
+
+    with raw_responses():
+        with unit.transactions.stream() as response:
+            assert list(response.data) == page["data"]
+            assert response.included == page["included"]
+            assert response.meta == page["meta"]
+
+    with raw_responses("bytes"):
+        with unit.transactions.stream() as response:
+            assert json.loads(b"".join(response.data)) == page
+
+
+def test_async_raw_responses():
+    def handler(request):
+        return httpx.Response(200, content=json.dumps(page).encode())
+
+    async def list_transactions():
+        transport = AsyncHttpxTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        async with AsyncUnit(configuration=Configuration("https://api.s.unit.sh", "token",
+                                                         async_transport=transport)) as unit:
+            with raw_responses():
+                response = await unit.transactions.list()
+                async with await unit.transactions.stream() as stream:
+                    streamed = [t async for t in stream.data]
+            return response, streamed
+
+    response, streamed = asyncio.run(list_transactions())
+    assert response.data == page["data"] and response.included == page["included"]
+    assert streamed == page["data"]
+
+
+def test_invalid_raw_format():
+    with pytest.raises(Exception):
+        Configuration("https://api.s.unit.sh", "token", raw_responses="xml")
+
+    with pytest.raises(Exception):
+        with raw_responses("xml"):
+            pass
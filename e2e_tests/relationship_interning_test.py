@@ -0,0 +1,56 @@
+import copy
+import pickle
+
+import pytest
+
+from e2e_tests.helpers.fixtures import book_transaction
+from unit.models import Relationship
+from unit.models.codecs import DtoDecoder
+
+
+customers = {"data": [{"type": "customer", "id": "5"}, {"type": "customer", "id": "6"}]}
+
+
+def transaction(_id, account_id, direction="Credit"):
+    # a freshly built direction string, so that decoding has to intern it
+    return book_transaction(_id, direction="".join(direction), account_id=account_id, customers=customers)
+
+
+def test_relationships_are_shared_within_a_page():
+    for lazy in (False, True):
+        first, second, third = DtoDecoder.decode([transaction("1", "10"), transaction("2", "10"),
+                                                  transaction("3", "11")], lazy)
+
+        assert first.relationships["account"] is second.relationships["account"]
+        assert first.relationships["account"] is not third.relationships["account"]
+        assert first.relationships["customers"].data[0] is third.relationships["customers"].data[0]
+
+
+def test_relationships_are_shared_across_calls():
+    interned = {}
+    first = DtoDecoder.decode(transaction("1", "10"), interned=interned)
+    second = DtoDecoder.decode(transaction("2", "10"), interned=interned)
+    assert first.relationships["account"] is second.relationships["account"]
+
+    assert DtoDecoder.decode(transaction("3", "10")).relationships["account"] is not first.relationships["account"]
+
+
+def test_enum_like_strings_are_interned():
+    first, second = DtoDecoder.decode([transaction("1", "10", ["De", "bit"]), transaction("2", "10", ["De", "bit"])])
+    assert first.attributes["direction"] == "Debit"
+    assert first.attributes["direction"] is second.attributes["direction"]
+
+
+def test_relationship_is_immutable_and_hashable():
+    relationship = Relationship("depositAccount", "1")
+
+    assert relationship == Relationship("depositAccount", "1")
+    assert relationship != Relationship("depositAccount", "2")
+    assert len({relationship, Relationship("depositAccount", "1")}) == 1
+    assert relationship.to_dict() == {"data": {"type": "depositAccount", "id": "1"}}
+
+    with pytest.raises(AttributeError):
+        relationship.id = "2"
+
+    assert pickle.loads(pickle.dumps(relationship)) == relationship
+    assert copy.deepcopy(relationship) == relationship
@@ -0,0 +1,171 @@
+import asyncio
+import json
+import threading
+import time
+
+import httpx
+
+from e2e_tests.helpers.fixtures import client
+from unit import Unit, AsyncUnit
+from unit.api.base_resource import BaseResource
+from unit.models import UnitError
+from unit.utils.cache import ResponseCache
+from unit.utils.configuration import Configuration
+from unit.utils.transport import Transport, TransportResponse, AsyncHttpxTransport
+
+
+def institution(routing_number):
+    return {"data": {"type": "institution", "id": routing_number,
+                     "attributes": {"routingNumber": routing_number, "name": "Bank", "isACHSupported": True,
+                                    "isWireSupported": False}}}
+
+
+class CountingTransport(Transport):
+    def __init__(self, delay=0):
+        self.delay = delay
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def request(self, method, url, params=None, data=None, headers=None, timeout=None):
+        with self.lock:
+            self.calls.append((method, url))
+        time.sleep(self.delay)
+        routing_number = url.rsplit("/", 1)[-1]
+        if routing_number == "missing":
+            body = {"errors": [{"title": "Not Found", "status": "404"}]}
+            return TransportResponse(404, {}, json.dumps(body).encode())
+
+        return TransportResponse(200, {}, json.dumps(institution(routing_number)).encode())
+
+
+
+def test_cache_hits():
+    transport, cache = CountingTransport(), ResponseCache({"institutions/*": 60})
+    unit = client(transport, response_cache=cache)
+
+    for _ in range(3):
+        assert unit.institutions.get("053285241").data.attributes["name"] == "Bank"
+
+    assert len(transport.calls) == 1
+    assert (cache.hits, cache.misses, len(cache)) == (2, 1, 1)
+    assert unit.institutions.get("053285241").data is not unit.institutions.get("053285241").data
+
+
+def test_uncached_paths_and_errors():
+    transport, cache = CountingTransport(), ResponseCache({"institutions/*": 60})
+    unit = client(transport, response_cache=cache)
+
+    assert isinstance(unit.institutions.get("missing"), UnitError)
+    assert isinstance(unit.institutions.get("missing"), UnitError)
+    BaseResource.get(unit.accounts, "accounts/1")
+    BaseResource.get(unit.accounts, "accounts/1")
+
+    assert len(transport.calls) == 4 and len(cache) == 0
+
+
+def test_ttl_expiry_and_lru_eviction():
+    transport, cache = CountingTransport(), ResponseCache({"institutions/1*": 0.05, "institutions/*": 60},
+                                                          max_entries=2)
+    unit = client(transport, response_cache=cache)
+
+    unit.institutions.get("100")
+    time.sleep(0.06)
+    unit.institutions.get("100")
+    assert len(transport.calls) == 2
+
+    for routing_number in ("200", "300", "200", "400"):
+        unit.institutions.get(routing_number)
+    # 300 was the least recently used
+    unit.institutions.get("200")
+    unit.institutions.get("300")
+    assert [url.rsplit("/", 1)[-1] for _, url in transport.calls[2:]] == ["200", "300", "400", "300"]
+    assert cache.evictions == 3
+
+
+def test_single_flight():
+    transport, cache = CountingTransport(delay=0.1), ResponseCache({"institutions/*": 60})
+    unit = client(transport, response_cache=cache)
+    barrier = threading.Barrier(8)
+    names = []
+
+    def get():
+        barrier.wait()
+        names.append(unit.institutions.get("053285241").data.attributes["name"])
+
+    threads = [threading.Thread(target=get) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert names == ["Bank"] * 8
+    assert len(transport.calls) == 1 and cache.misses == 1 and cache.coalesced + cache.hits == 7
+
+
+def test_invalidation():
+    transport, cache = CountingTransport(), ResponseCache({"institutions/*": 60, "cards/*/limits": 60})
+    unit = client(transport, response_cache=cache)
+
+    unit.institutions.get("100")
+    unit.institutions.get("200")
+    cache.invalidate("institutions/100")
+    unit.institutions.get("100")
+    unit.institutions.get("200")
+    assert len(transport.calls) == 3
+
+    cache.invalidate()
+    assert len(cache) == 0
+
+    BaseResource.get(unit.cards, "cards/1/limits")
+    BaseResource.get(unit.cards, "cards/2/limits")
+    unit.cards.freeze("1")
+    BaseResource.get(unit.cards, "cards/1/limits")
+    BaseResource.get(unit.cards, "cards/2/limits")
+    assert [url for _, url in transport.calls[3:]] == [
+        "https://api.s.unit.sh/cards/1/limits", "https://api.s.unit.sh/cards/2/limits",
+        "https://api.s.unit.sh/cards/1/freeze", "https://api.s.unit.sh/cards/1/limits"]
+
+
+def test_write_during_an_in_flight_get():
+    class SlowReadTransport(CountingTransport):
+        def request(self, method, url, params=None, data=None, headers=None, timeout=None):
+            self.delay = 0.2 if method == "GET" else 0
+            return super().request(method, url, params, data, headers, timeout)
+
+    transport, cache = SlowReadTransport(), ResponseCache({"cards/*/limits": 60})
+    unit = client(transport, response_cache=cache)
+    get = threading.Thread(target=BaseResource.get, args=(unit.cards, "cards/1/limits"))
+    get.start()
+    time.sleep(0.05)
+    unit.cards.freeze("1")
+
+    # the read sent before the write is neither waited for nor cached
+    BaseResource.get(unit.cards, "cards/1/limits")
+    get.join()
+    BaseResource.get(unit.cards, "cards/1/limits")
+    assert [url for _, url in transport.calls] == [
+        "https://api.s.unit.sh/cards/1/limits", "https://api.s.unit.sh/cards/1/freeze",
+        "https://api.s.unit.sh/cards/1/limits"]
+    assert cache.misses == 2 and cache.coalesced == 0 and cache.hits == 1
+
+
+def test_async_single_flight():
+    calls = []
+
+    async def handler(request):
+        calls.append(request.url.path)
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, content=json.dumps(institution("053285241")).encode())
+
+    async def get_all():
+        transport = AsyncHttpxTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        cache = ResponseCache({"institutions/*": 60})
+        async with AsyncUnit(configuration=Configuration("https://api.s.unit.sh", "token", async_transport=transport,
+                                                         response_cache=cache)) as unit:
+            responses = await asyncio.gather(*[unit.institutions.get("053285241") for _ in range(5)])
+            responses.append(await unit.institutions.get("053285241"))
+            return responses, cache
+
+    responses, cache = asyncio.run(get_all())
+    assert [r.data.attributes["routingNumber"] for r in responses] == ["053285241"] * 6
+    assert len(calls) == 1 and (cache.misses, cache.coalesced, cache.hits) == (1, 4, 1)
@@ -0,0 +1,70 @@
+from e2e_tests.helpers.transport import StubTransport
+from unit import Unit
+from unit.utils.configuration import Configuration
+from unit.utils.retry import RetryPolicy
+
+
+institution = {
+    "type": "institution",
+    "id": "053285241",
+    "attributes": {
+        "routingNumber": "053285241",
+        "name": "Bank",
+        "isACHSupported": True,
+        "isWireSupported": False
+    }
+}
+
+
+def fast_policy(tries):
+    return RetryPolicy(tries=tries, jitter=None, factor=0.001)
+
+
+def test_policy_is_built_once_per_configuration():
+    c = Configuration("https://api.s.unit.sh", "token", retries=2, timeout=30)
+
+    assert c.get_retry_policy() is c.get_retry_policy("transactions", "GET")
+    assert (c.retry_policy.tries, c.retry_policy.max_time) == (3, 30)
+    assert 429 in c.retry_policy.retry_status_codes and 404 not in c.retry_policy.retry_status_codes
+
+    c.set_retries(4)
+    assert c.get_retry_policy().tries == 5
+
+
+def test_retries_until_success():
+    transport = StubTransport([503, 429, 200], {"data": institution})
+    c = Configuration("https://api.s.unit.sh", "token", transport=transport)
+    c.set_retry_policy(fast_policy(3))
+
+    response = Unit(configuration=c).institutions.get("053285241")
+    assert response.data.attributes["name"] == "Bank"
+    assert len(transport.calls) == 3
+
+
+def test_gives_up_after_tries():
+    transport = StubTransport([503, 503, 200], {"data": institution})
+    c = Configuration("https://api.s.unit.sh", "token", transport=transport)
+    c.set_retry_policy(fast_policy(2))
+
+    response = Unit(configuration=c).institutions.get("053285241")
+    assert response.errors[0].status == "503"
+    assert len(transport.calls) == 2
+
+
+def test_per_resource_override():
+    transport = StubTransport([503, 503, 503, 200], {"data": institution})
+    c = Configuration("https://api.s.unit.sh", "token", transport=transport)
+    c.set_retry_policy(fast_policy(1))
+    c.set_retry_policy(fast_policy(4), resource="institutions", method="GET")
+
+    assert c.get_retry_policy("cards", "GET").tries == 1
+    response = Unit(configuration=c).institutions.get("053285241")
+    assert response.data.attributes["name"] == "Bank"
+    assert len(transport.calls) == 4
+
+
+def test_override_keeps_other_parameters():
+    policy = fast_policy(3).with_overrides(retry_status_codes=[503])
+
+    assert policy.tries == 3
+    assert policy.retry_status_codes == frozenset([503])
@@ -0,0 +1,63 @@
+import json
+from datetime import date, datetime
+
+import pytest
+
+from unit.models import Address, FullName, Phone, Relationship, RelationshipArray
+from unit.models.application import CreateIndividualApplicationRequest
+from unit.models.codecs import UnitEncoder, encode, register_serializer, serializers
+
+
+def individual_application():
+    return CreateIndividualApplicationRequest(
+        FullName("Peter", "Parker"), date(1990, 1, 2),
+        Address("20 Ingram St", "Forest Hills", "NY", "11375", "US"), "peter@oscorp.com", Phone("1", "2025550108"),
+        ssn="721074426", tags={"purpose": "checking"})
+
+
+def test_payload_is_encoded_with_camel_case_keys():
+    payload = json.loads(encode(individual_application().to_json_api()))
+
+    attributes = payload["data"]["attributes"]
+    assert attributes["fullName"] == {"first": "Peter", "last": "Parker"}
+    assert attributes["dateOfBirth"] == "1990-01-02"
+    assert attributes["address"] == {"street": "20 Ingram St", "city": "Forest Hills", "state": "NY",
+                                     "postalCode": "11375", "country": "US"}
+    assert attributes["phone"] == {"countryCode": "1", "number": "2025550108"}
+
+
+def test_encoders_agree():
+    payload = {"data": {"attributes": {"address": Address("1 Main St", "Austin", "TX", "73301", "US"),
+                                       "createdAt": datetime(2022, 2, 10, 17, 56, 49)},
+                        "relationships": {"account": Relationship("account", "1"),
+                                          "cards": RelationshipArray.from_ids_array("card", ["2", "3"])}}}
+
+    assert json.loads(encode(payload)) == json.loads(json.dumps(payload, cls=UnitEncoder))
+    assert json.loads(encode(payload))["data"]["relationships"] == {
+        "account": {"data": {"type": "account", "id": "1"}},
+        "cards": {"data": [{"type": "card", "id": "2"}, {"type": "card", "id": "3"}]}}
+
+
+def test_plain_objects_are_encoded_as_objects():
+    class Coordinates(object):
+        def __init__(self, longitude, latitude):
+            self.longitude = longitude
+            self.latitude = latitude
+
+    assert json.loads(encode({"coordinates": Coordinates(1.5, 2.5)})) == {
+        "coordinates": {"longitude": 1.5, "latitude": 2.5}}
+
+    with pytest.raises(TypeError):
+        encode({"value": object()})
+
+
+def test_registered_serializer_is_used():
+    class Money(object):
+        def __init__(self, cents):
+            self.cents = cents
+
+    register_serializer(Money)(lambda money: money.cents)
+    try:
+        assert json.loads(encode({"amount": Money(100)})) == {"amount": 100}
+    finally:
+        serializers.pop(Money)
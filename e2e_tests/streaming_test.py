@@ -0,0 +1,176 @@
+import asyncio
+import gzip
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import httpx
+import pytest
+
+from e2e_tests.helpers.fixtures import book_transaction
+from unit import Unit, AsyncUnit
+from unit.models import UnitError, UnitStreamResponse
+from unit.models.transaction import BookTransactionDTO, ListTransactionParams
+from unit.utils.configuration import Configuration
+from unit.utils.json_stream import JsonApiStreamParser
+from unit.utils.transport import RequestsTransport, Urllib3Transport, Http2Transport, AsyncHttpxTransport
+
+
+
+count = 500
+page = json.dumps({"data": [book_transaction(i, summary="Book transfer ✓") for i in range(count)],
+                   "included": [{"type": "account", "id": "10", "attributes": {}}],
+                   "meta": {"pagination": {"total": count, "limit": count, "offset": 0}}}).encode()
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        if "missing" in self.path:
+            return self.respond(404, json.dumps({"errors": [{"title": "Not Found", "status": "404"}]}).encode())
+
+        content = page
+        self.send_response(200)
+        self.send_header("content-type", "application/vnd.api+json")
+        if "gzip" in self.headers.get("accept-encoding", ""):
+            content = gzip.compress(content)
+            self.send_header("content-encoding", "gzip")
+        self.send_header("transfer-encoding", "chunked")
+        self.end_headers()
+
+        for i in range(0, len(content), 1000):
+            chunk = content[i:i + 1000]
+            self.wfile.write(b"%x\r\n%s\r\n" % (len(chunk), chunk))
+        self.wfile.write(b"0\r\n\r\n")
+
+    def respond(self, status, content):
+        self.send_response(status)
+        self.send_header("content-type", "application/vnd.api+json")
+        self.send_header("content-length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def api_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+transports = [
+    lambda: RequestsTransport(),
+    lambda: Urllib3Transport(),
+    lambda: Http2Transport(client=httpx.Client(timeout=None)),
+]
+
+
+@pytest.mark.parametrize("create_transport", transports)
+@pytest.mark.parametrize("compression", [True, False])
+def test_stream_transactions(api_url, create_transport, compression):
+    configuration = Configuration(api_url, "token", transport=create_transport(), compression=compression)
+    with Unit(configuration=configuration) as client:
+        with client.transactions.stream(ListTransactionParams(limit=count)) as response:
+            assert isinstance(response, UnitStreamResponse)
+
+            amounts = []
+            for t in response.data:
+                assert isinstance(t, BookTransactionDTO)
+                assert t.attributes["summary"] == "Book transfer ✓"
+                amounts.append(t.attributes["amount"])
+
+            assert amounts == list(range(count))
+            assert response.meta["pagination"]["total"] == count
+            assert response.included[0].type == "account"
+
+
+@pytest.mark.parametrize("create_transport", transports)
+def test_stream_closed_early(api_url, create_transport):
+    with Unit(configuration=Configuration(api_url, "token", transport=create_transport())) as client:
+        for _ in range(3):
+            response = client.transactions.stream()
+            assert next(iter(response.data)).id == "0"
+            response.close()
+
+        with client.transactions.stream() as response:
+            assert len(list(response.data)) == count
+
+
+@pytest.mark.parametrize("create_transport", transports)
+def test_stream_error(api_url, create_transport):
+    with Unit(configuration=Configuration(api_url, "token", transport=create_transport())) as client:
+        response = client.transactions.stream(ListTransactionParams(account_id="missing"))
+
+        assert isinstance(response, UnitError)
+        assert response.errors[0].title == "Not Found"
+
+
+def feed(parser, body, size):
+    resources = []
+    for i in range(0, len(body), size):
+        resources.extend(parser.feed(body[i:i + size]))
+
+    return resources + parser.close()
+
+
+def test_parser_values_split_anywhere():
+    included = [{"type": "account", "id": str(i), "attributes": {"name": 'a "{quoted}" [name] \\', "tags": {}}}
+                for i in range(20)]
+    document = {"included": included[:3], "data": [book_transaction(i) for i in range(5)], "x": [[1], {"a": [2]}, []],
+                "meta": {"pagination": {"total": 5}, "note": "}]\\\""}, "included2": included}
+    body = json.dumps(document).encode()
+
+    for size in range(1, 12):
+        parser = JsonApiStreamParser()
+        assert feed(parser, body, size) == document["data"]
+        assert parser.members == {k: v for k, v in document.items() if k != "data"}
+
+
+def test_parser_decodes_large_members_once(monkeypatch):
+    decoded = []
+    raw_decode = json.JSONDecoder.raw_decode
+
+    def counting_raw_decode(self, s, idx=0):
+        try:
+            value, end = raw_decode(self, s, idx)
+        except json.JSONDecodeError:
+            # a value cut by the end of the chunk was read up to there
+            decoded.append(len(s) - idx)
+            raise
+        decoded.append(end - idx)
+        return value, end
+
+    monkeypatch.setattr(json.JSONDecoder, "raw_decode", counting_raw_decode)
+    included = [{"type": "account", "id": str(i), "attributes": {"name": "Peter Parker"}} for i in range(500)]
+    body = json.dumps({"data": [], "included": included, "meta": {"included": included}}).encode()
+
+    parser = JsonApiStreamParser()
+    assert feed(parser, body, 256) == []
+    assert parser.members["included"] == included and parser.members["meta"]["included"] == included
+    # rather than reading each member again after every chunk
+    assert sum(decoded) < 3 * len(body)
+
+
+def test_async_stream_transactions():
+    async def body():
+        for i in range(0, len(page), 1000):
+            yield page[i:i + 1000]
+
+    def handler(request):
+        return httpx.Response(200, content=body())
+
+    async def stream():
+        transport = AsyncHttpxTransport(client=httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+        async with AsyncUnit(configuration=Configuration("https://api.s.unit.sh", "token",
+                                                         async_transport=transport)) as client:
+            async with await client.transactions.stream() as response:
+                return [t.attributes["amount"] async for t in response.data], response.meta
+
+    amounts, meta = asyncio.run(stream())
+    assert amounts == list(range(count))
+    assert meta["pagination"]["total"] == count
@@ -0,0 +1,94 @@
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlparse, parse_qs
+
+import httpx
+import pytest
+
+from unit import Unit
+from unit.models.transaction import ListTransactionParams, PatchTransactionRequest
+from unit.utils.configuration import Configuration
+from unit.utils.transport import RequestsTransport, Urllib3Transport, Http2Transport
+
+transaction = {
+    "type": "bookTransaction",
+    "id": "1",
+    "attributes": {
+        "createdAt": "2022-02-10T17:56:49.235Z",
+        "amount": 200,
+        "direction": "Credit",
+        "balance": 1000,
+        "summary": "Book transfer",
+        "counterparty": {
+            "name": "April Oniel",
+            "routingNumber": "812345678",
+            "accountNumber": "1000000001",
+            "accountType": "Checking"
+        }
+    },
+    "relationships": {
+        "account": {"data": {"type": "account", "id": "10"}}
+    }
+}
+
+
+class Handler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        Handler.requests.append((self.command, url.path, parse_qs(url.query), dict(self.headers), None))
+        self.respond(200, {"data": [transaction]})
+
+    def do_PATCH(self):
+        body = self.rfile.read(int(self.headers["content-length"]))
+        Handler.requests.append((self.command, self.path, {}, dict(self.headers), json.loads(body)))
+        self.respond(200, {"data": transaction})
+
+    def respond(self, status, body):
+        content = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("content-type", "application/vnd.api+json")
+        self.send_header("content-length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def api_url():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+
+
+transports = [
+    lambda: RequestsTransport(),
+    lambda: Urllib3Transport(),
+    lambda: Http2Transport(client=httpx.Client(timeout=None)),
+]
+
+
+@pytest.mark.parametrize("create_transport", transports)
+def test_transports_send_the_same_request(api_url, create_transport):
+    Handler.requests.clear()
+
+    with Unit(configuration=Configuration(api_url, "token", transport=create_transport())) as client:
+        response = client.transactions.list(ListTransactionParams(10, account_id="10", exclude_fees=True))
+        assert response.data[0].id == "1"
+
+        response = client.transactions.update(PatchTransactionRequest("10", "1", {"purpose": "test"}))
+        assert response.data.attributes["amount"] == 200
+
+    (method, path, query, headers, _), (_, patch_path, _, _, body) = Handler.requests
+    assert (method, path) == ("GET", "/transactions")
+    assert query == {"page[limit]": ["10"], "page[offset]": ["0"], "filter[accountId]": ["10"],
+                     "filter[excludeFees]": ["True"]}
+    assert headers["authorization"] == "Bearer token"
+    assert headers["content-type"] == "application/vnd.api+json"
+    assert patch_path == "/accounts/10/transactions/1"
+    assert body["data"]["attributes"]["tags"] == {"purpose": "test"}
@@ -15,6 +15,11 @@ setup(
     install_requires=[
         'requests', 'backoff', 'typing_extensions'
     ],
+    extras_require={
+        'async': ['httpx'],
+        'http2': ['httpx[http2]'],
+        'orjson': ['orjson'],
+    },
     classifiers=[
         'Development Status :: 4 - Beta',
         'Intended Audience :: Developers',
@@ -1,30 +1,30 @@
-from unit.api.application_resource import ApplicationResource
-from unit.api.customer_resource import CustomerResource
-from unit.api.account_resource import AccountResource
-from unit.api.card_resource import CardResource
-from unit.api.transaction_resource import TransactionResource
-from unit.api.payment_resource import PaymentResource
-from unit.api.received_payment_resource import ReceivedPaymentResource
-from unit.api.statement_resource import StatementResource
-from unit.api.customerToken_resource import CustomerTokenResource
-from unit.api.counterparty_resource import CounterpartyResource
-from unit.api.returnAch_resource import ReturnAchResource
-from unit.api.applicationForm_resource import ApplicationFormResource
-from unit.api.fee_resource import FeeResource
-from unit.api.event_resource import EventResource
-from unit.api.webhook_resource import WebhookResource
-from unit.api.institution_resource import InstitutionResource
-from unit.api.atmLocation_resource import AtmLocationResource
-from unit.api.bill_pay_resource import BillPayResource
-from unit.api.api_token_resource import APITokenResource
-from unit.api.authorization_resource import AuthorizationResource
-from unit.api.authorization_request_resource import AuthorizationRequestResource
-from unit.api.account_end_of_day_resource import AccountEndOfDayResource
-from unit.api.checkDeposit_resource import CheckDepositResource
-from unit.api.dispute_resource import DisputeResource
-from unit.api.reward_resource import RewardResource
-from unit.api.recurring_payment_resource import RecurringPaymentResource
-from unit.api.repayment_resource import RepaymentResource
+from unit.api.application_resource import ApplicationResource, AsyncApplicationResource
+from unit.api.customer_resource import CustomerResource, AsyncCustomerResource
+from unit.api.account_resource import AccountResource, AsyncAccountResource
+from unit.api.card_resource import CardResource, AsyncCardResource
+from unit.api.transaction_resource import TransactionResource, AsyncTransactionResource
+from unit.api.payment_resource import PaymentResource, AsyncPaymentResource
+from unit.api.received_payment_resource import ReceivedPaymentResource, AsyncReceivedPaymentResource
+from unit.api.statement_resource import StatementResource, AsyncStatementResource
+from unit.api.customerToken_resource import CustomerTokenResource, AsyncCustomerTokenResource
+from unit.api.counterparty_resource import CounterpartyResource, AsyncCounterpartyResource
+from unit.api.returnAch_resource import ReturnAchResource, AsyncReturnAchResource
+from unit.api.applicationForm_resource import ApplicationFormResource, AsyncApplicationFormResource
+from unit.api.fee_resource import FeeResource, AsyncFeeResource
+from unit.api.event_resource import EventResource, AsyncEventResource
+from unit.api.webhook_resource import WebhookResource, AsyncWebhookResource
+from unit.api.institution_resource import InstitutionResource, AsyncInstitutionResource
+from unit.api.atmLocation_resource import AtmLocationResource, AsyncAtmLocationResource
+from unit.api.bill_pay_resource import BillPayResource, AsyncBillPayResource
+from unit.api.api_token_resource import APITokenResource, AsyncAPITokenResource
+from unit.api.authorization_resource import AuthorizationResource, AsyncAuthorizationResource
+from unit.api.authorization_request_resource import AuthorizationRequestResource, AsyncAuthorizationRequestResource
+from unit.api.account_end_of_day_resource import AccountEndOfDayResource, AsyncAccountEndOfDayResource
+from unit.api.checkDeposit_resource import CheckDepositResource, AsyncCheckDepositResource
+from unit.api.dispute_resource import DisputeResource, AsyncDisputeResource
+from unit.api.reward_resource import RewardResource, AsyncRewardResource
+from unit.api.recurring_payment_resource import RecurringPaymentResource, AsyncRecurringPaymentResource
+from unit.api.repayment_resource import RepaymentResource, AsyncRepaymentResource
 from unit.utils.configuration import Configuration
 
 __all__ = ["api", "models", "utils"]
@@ -36,6 +36,7 @@ class Unit(object):
             raise Exception("use only configuration")
 
         c = configuration if configuration else Configuration(api_url, token, retries, timeout)
+        self.configuration = c
 
         self.applications = ApplicationResource(c)
         self.customers = CustomerResource(c)
@@ -65,3 +66,58 @@ class Unit(object):
         self.repayments = RepaymentResource(c)
         self.recurring_payments = RecurringPaymentResource(c)
 
+
+    def close(self):
+        self.configuration.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+
+class AsyncUnit(object):
+    def __init__(self, api_url=None, token=None, retries=0, timeout=120, configuration: Configuration = None):
+        if (api_url is not None or token is not None) and configuration is not None:
+            raise Exception("use only configuration")
+
+        c = configuration if configuration else Configuration(api_url, token, retries, timeout)
+        self.configuration = c
+
+        self.applications = AsyncApplicationResource(c)
+        self.customers = AsyncCustomerResource(c)
+        self.accounts = AsyncAccountResource(c)
+        self.cards = AsyncCardResource(c)
+        self.transactions = AsyncTransactionResource(c)
+        self.payments = AsyncPaymentResource(c)
+        self.statements = AsyncStatementResource(c)
+        self.customerTokens = AsyncCustomerTokenResource(c)
+        self.counterparty = AsyncCounterpartyResource(c)
+        self.returnAch = AsyncReturnAchResource(c)
+        self.applicationForms = AsyncApplicationFormResource(c)
+        self.fees = AsyncFeeResource(c)
+        self.events = AsyncEventResource(c)
+        self.webhooks = AsyncWebhookResource(c)
+        self.institutions = AsyncInstitutionResource(c)
+        self.atmLocations = AsyncAtmLocationResource(c)
+        self.billPays = AsyncBillPayResource(c)
+        self.api_tokens = AsyncAPITokenResource(c)
+        self.authorizations = AsyncAuthorizationResource(c)
+        self.authorization_requests = AsyncAuthorizationRequestResource(c)
+        self.account_end_of_day = AsyncAccountEndOfDayResource(c)
+        self.checkDeposits = AsyncCheckDepositResource(c)
+        self.disputes = AsyncDisputeResource(c)
+        self.rewards = AsyncRewardResource(c)
+        self.received_payments = AsyncReceivedPaymentResource(c)
+        self.repayments = AsyncRepaymentResource(c)
+        self.recurring_payments = AsyncRecurringPaymentResource(c)
+
+    async def close(self):
+        await self.configuration.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
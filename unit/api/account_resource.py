@@ -1,131 +1,147 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.account import *
-from unit.models.codecs import DtoDecoder
 
 
 class AccountResource(BaseResource):
+    list_params = ListAccountParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("accounts", configuration)
 
     def create(self, request: CreateAccountRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post_create(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AccountDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def close_account(self, request: CloseAccountRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{request.account_id}/close", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AccountDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def reopen_account(self, account_id: str, reason: AccountCloseReason = "ByCustomer") ->\
             Union[UnitResponse[AccountDTO], UnitError]:
         response = super().post(f"{self.resource}/{account_id}/reopen", {'reason': reason})
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AccountDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def freeze_account(self, request: FreezeAccountRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{request.account_id}/freeze", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AccountDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def unfreeze_account(self, account_id: str) -> Union[UnitResponse[AccountDTO], UnitError]:
         response = super().post(f"{self.resource}/{account_id}/unfreeze")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AccountDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def enter_daca(self, account_id: str) -> Union[UnitResponse[AccountDTO], UnitError]:
         response = super().post(f"{self.resource}/{account_id}/enter-daca")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AccountDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def activate_daca(self, account_id: str) -> Union[UnitResponse[AccountDTO], UnitError]:
         response = super().post(f"{self.resource}/{account_id}/activate-daca")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AccountDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def get(self, account_id: str, include: Optional[str] = "") -> Union[UnitResponse[AccountDTO], UnitError]:
         response = super().get(f"{self.resource}/{account_id}", {"include": include})
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[AccountDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
 
     def list(self, params: ListAccountParams = None) -> Union[UnitResponse[List[AccountDTO]], UnitError]:
         params = params or ListAccountParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[AccountDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
 
     def update(self, request: PatchAccountRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
         payload = request.to_json_api()
         response = super().patch(f"{self.resource}/{request.account_id}", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AccountDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def limits(self, account_id: str) -> Union[UnitResponse[AccountLimitsDTO], UnitError]:
         response = super().get(f"{self.resource}/{account_id}/limits", None)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AccountLimitsDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def get_deposit_products(self, account_id: str) -> Union[UnitResponse[List[AccountDepositProductDTO]], UnitError]:
         response = super().get(f"{self.resource}/{account_id}/deposit-products")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[List[AccountDepositProductDTO]](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def add_owners(self, request: AccountOwnersRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{request.account_id}/relationships/customers", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AccountDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def remove_owners(self, request: AccountOwnersRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
         payload = request.to_json_api()
         response = super().delete(f"{self.resource}/{request.account_id}/relationships/customers", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AccountDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
\ No newline at end of file
+        return super().decode(response)
+
+
+class AsyncAccountResource(AsyncBaseResource):
+    list_params = ListAccountParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("accounts", configuration)
+
+    async def create(self, request: CreateAccountRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().decode(response)
+
+    async def close_account(self, request: CloseAccountRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.account_id}/close", payload)
+        return super().decode(response)
+
+    async def reopen_account(self, account_id: str, reason: AccountCloseReason = "ByCustomer") ->\
+            Union[UnitResponse[AccountDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{account_id}/reopen", {'reason': reason})
+        return super().decode(response)
+
+    async def freeze_account(self, request: FreezeAccountRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.account_id}/freeze", payload)
+        return super().decode(response)
+
+    async def unfreeze_account(self, account_id: str) -> Union[UnitResponse[AccountDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{account_id}/unfreeze")
+        return super().decode(response)
+
+    async def enter_daca(self, account_id: str) -> Union[UnitResponse[AccountDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{account_id}/enter-daca")
+        return super().decode(response)
+
+    async def activate_daca(self, account_id: str) -> Union[UnitResponse[AccountDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{account_id}/activate-daca")
+        return super().decode(response)
+
+    async def get(self, account_id: str, include: Optional[str] = "") -> Union[UnitResponse[AccountDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{account_id}", {"include": include})
+        return super().decode(response, included=True)
+
+    async def list(self, params: ListAccountParams = None) -> Union[UnitResponse[List[AccountDTO]], UnitError]:
+        params = params or ListAccountParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response, included=True)
+
+    async def update(self, request: PatchAccountRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.account_id}", payload)
+        return super().decode(response)
+
+    async def limits(self, account_id: str) -> Union[UnitResponse[AccountLimitsDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{account_id}/limits", None)
+        return super().decode(response)
+
+    async def get_deposit_products(self, account_id: str) ->\
+            Union[UnitResponse[List[AccountDepositProductDTO]], UnitError]:
+        response = await super().get(f"{self.resource}/{account_id}/deposit-products")
+        return super().decode(response)
+
+    async def add_owners(self, request: AccountOwnersRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.account_id}/relationships/customers", payload)
+        return super().decode(response)
+
+    async def remove_owners(self, request: AccountOwnersRequest) -> Union[UnitResponse[AccountDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().delete(f"{self.resource}/{request.account_id}/relationships/customers", payload)
+        return super().decode(response)
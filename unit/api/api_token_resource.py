@@ -1,7 +1,7 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.api_token import *
-from unit.models.codecs import DtoDecoder
 
 
 class APITokenResource(BaseResource):
@@ -11,24 +11,36 @@ class APITokenResource(BaseResource):
     def create(self, request: CreateAPITokenRequest) -> Union[UnitResponse[APITokenDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{request.user_id}/api-tokens", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[APITokenDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def list(self, user_id: str) -> Union[UnitResponse[List[APITokenDTO]], UnitError]:
         response = super().get(f"{self.resource}/{user_id}/api-tokens")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[APITokenDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def revoke(self, user_id: str, token_id: str) -> Union[UnitResponse, UnitError]:
         response = super().delete(f"{self.resource}/{user_id}/api-tokens/{token_id}")
         if super().is_20x(response.status_code):
             return UnitResponse([], None)
         else:
-            return UnitError.from_json_api(response.json())
+            return UnitError.from_json_api(super().decode_json(response))
+
+
+class AsyncAPITokenResource(AsyncBaseResource):
+    def __init__(self, configuration: Configuration):
+        super().__init__("users", configuration)
+
+    async def create(self, request: CreateAPITokenRequest) -> Union[UnitResponse[APITokenDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.user_id}/api-tokens", payload)
+        return super().decode(response)
+
+    async def list(self, user_id: str) -> Union[UnitResponse[List[APITokenDTO]], UnitError]:
+        response = await super().get(f"{self.resource}/{user_id}/api-tokens")
+        return super().decode(response)
 
+    async def revoke(self, user_id: str, token_id: str) -> Union[UnitResponse, UnitError]:
+        response = await super().delete(f"{self.resource}/{user_id}/api-tokens/{token_id}")
+        if super().is_20x(response.status_code):
+            return UnitResponse([], None)
+        else:
+            return UnitError.from_json_api(super().decode_json(response))
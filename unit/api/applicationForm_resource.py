@@ -1,37 +1,46 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.applicationForm import *
-from unit.models.codecs import DtoDecoder
 
 
 class ApplicationFormResource(BaseResource):
+    list_params = ListApplicationFormParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("application-forms", configuration)
 
     def create(self, request: CreateApplicationFormRequest) -> Union[UnitResponse[ApplicationFormDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[ApplicationFormDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def get(self, application_form_id: str, include: Optional[str] = "") -> Union[UnitResponse[ApplicationFormDTO], UnitError]:
         response = super().get(f"{self.resource}/{application_form_id}", {"include": include})
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[ApplicationFormDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
 
     def list(self, params: ListApplicationFormParams = None) -> Union[UnitResponse[List[ApplicationFormDTO]], UnitError]:
         params = params or ListApplicationFormParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[ApplicationFormDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
+
+
+class AsyncApplicationFormResource(AsyncBaseResource):
+    list_params = ListApplicationFormParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("application-forms", configuration)
+
+    async def create(self, request: CreateApplicationFormRequest) -> Union[UnitResponse[ApplicationFormDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(self.resource, payload)
+        return super().decode(response)
 
+    async def get(self, application_form_id: str, include: Optional[str] = "") -> Union[UnitResponse[ApplicationFormDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{application_form_id}", {"include": include})
+        return super().decode(response, included=True)
+
+    async def list(self, params: ListApplicationFormParams = None) -> Union[UnitResponse[List[ApplicationFormDTO]], UnitError]:
+        params = params or ListApplicationFormParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response)
@@ -0,0 +1,194 @@
+import asyncio
+from typing import AsyncIterator, Optional, Dict, List, Union
+
+from unit.utils.configuration import Configuration
+from unit.utils.circuit_breaker import CircuitBreaker
+from unit.utils.compression import compress_body
+from unit.utils.deadline import current_deadline, remaining, DeadlineExceeded
+from unit.utils.hedging import HedgingPolicy
+from unit.utils.retry import RetryPolicy, NO_RETRY
+from unit.utils.json_stream import JsonApiStreamParser
+from unit.utils.pagination import paginate_async, prefetch_async
+from unit.utils.transport import TransportResponse
+from unit.models import AsyncUnitStreamResponse, UnitError
+from unit.models.codecs import encode
+from unit.api.base_resource import BaseResource, idempotency_key_is_present
+
+
+class AsyncBaseResource(BaseResource):
+    def __init__(self, resource: str, configuration: Configuration):
+        super().__init__(resource, configuration)
+
+    def iter_all(self, params=None, prefetch_pages: int = 0, workers: Optional[int] = None) -> AsyncIterator:
+        if prefetch_pages > 0:
+            return prefetch_async(self.list, self.first_page(params), prefetch_pages, workers)
+
+        return paginate_async(self.list, self.first_page(params))
+
+    async def list_all(self, params=None, prefetch_pages: int = 0, workers: Optional[int] = None) -> List:
+        return [resource async for resource in self.iter_all(params, prefetch_pages, workers)]
+
+    async def get(self, resource: str, params: Dict = None, headers: Optional[Dict[str, str]] = None):
+        cache = self.configuration.response_cache
+        if cache is not None:
+            url = f"{self.configuration.api_url}/{resource}"
+            return await cache.call_async(resource, params, headers, self._send, "GET", url, params, None, headers,
+                                          None, self.configuration.get_hedging_policy(self.resource))
+
+        return await self._send("GET", f"{self.configuration.api_url}/{resource}", params=params, headers=headers,
+                                hedging_policy=self.configuration.get_hedging_policy(self.resource))
+
+    async def get_stream(self, resource: str, params: Dict = None, headers: Optional[Dict[str, str]] = None):
+        return await self._send("GET", f"{self.configuration.api_url}/{resource}", params=params, headers=headers,
+                                stream=True)
+
+    async def post(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        data = encode(data) if data is not None else None
+        return await self._send("POST", f"{self.configuration.api_url}/{resource}", data=data, headers=headers)
+
+    async def post_create(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        retry_policy = None if idempotency_key_is_present(data) else NO_RETRY
+        data = encode(data) if data is not None else None
+        return await self._send("POST", f"{self.configuration.api_url}/{resource}", data=data, headers=headers,
+                                retry_policy=retry_policy)
+
+    async def post_full_path(self, path: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        data = encode(data) if data is not None else None
+        return await self._send("POST", path, data=data, headers=headers)
+
+    async def patch(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        data = encode(data) if data is not None else None
+        return await self._send("PATCH", f"{self.configuration.api_url}/{resource}", data=data, headers=headers)
+
+    async def delete(self, resource: str, data: Dict = None, headers: Optional[Dict[str, str]] = None):
+        data = encode(data) if data is not None else None
+        return await self._send("DELETE", f"{self.configuration.api_url}/{resource}", data=data, headers=headers)
+
+    async def put(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        return await self._send("PUT", f"{self.configuration.api_url}/{resource}", data=data, headers=headers)
+
+    async def _send(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                    headers: Optional[Dict[str, str]] = None, retry_policy: Optional[RetryPolicy] = None,
+                    hedging_policy: Optional[HedgingPolicy] = None, stream: bool = False):
+        retry_policy = retry_policy or self.configuration.get_retry_policy(self.resource, method)
+        headers = self._merge_headers(headers)
+        # only the JSON:API documents built by encode() are compressed, never the files uploaded with put()
+        compress_over = self.configuration.compress_requests_over if method != "PUT" else None
+        body, headers = compress_body(data, headers, compress_over)
+        circuit_breaker = self.configuration.get_circuit_breaker(method, url)
+        deadline = current_deadline.get()
+        if hedging_policy is None:
+            response = await retry_policy.call_async(self._request, method, url, params, body, headers,
+                                                     circuit_breaker, deadline, stream, deadline=deadline)
+        else:
+            response = await retry_policy.call_async(hedging_policy.call_async, self._request, method, url, params,
+                                                     body, headers, circuit_breaker, deadline, deadline=deadline)
+
+        if self.configuration.response_cache is not None and method != "GET":
+            self._invalidate_cache(url)
+
+        if self.configuration.on_transfer is not None and not stream:
+            self._report_transfer(self.configuration.get_async_transport(), method, url, data, body, response)
+
+        return response
+
+    async def _request(self, method: str, url: str, params: Optional[Dict], data, headers: Dict[str, str],
+                       circuit_breaker: Optional[CircuitBreaker] = None, deadline: Optional[float] = None,
+                       stream: bool = False):
+        rate_limiter = self.configuration.rate_limiter
+        concurrency_limiter = self.configuration.concurrency_limiter
+        status_code = None
+
+        if deadline is not None and remaining(deadline) <= 0:
+            raise DeadlineExceeded(method, url)
+
+        # the waits for the rate and concurrency limiters count against the deadline too
+        if not await rate_limiter.acquire_async(remaining(deadline)):
+            raise DeadlineExceeded(method, url)
+
+        started_at = None
+        if concurrency_limiter is not None:
+            started_at = await concurrency_limiter.acquire_async(remaining(deadline))
+            if started_at is None:
+                raise DeadlineExceeded(method, url)
+
+        self._admit(method, url, circuit_breaker, deadline, started_at)
+        cancelled = False
+        try:
+            timeout = self.configuration.get_socket_timeouts(deadline)
+            transport = self.configuration.get_async_transport()
+            if stream:
+                response = await transport.stream(method, url, params, data, headers, timeout)
+                if not self.is_20x(response.status_code):
+                    response = await self._read_stream_async(transport, response)
+            else:
+                response = await transport.request(method, url, params, data, headers, timeout)
+            status_code = response.status_code
+        except asyncio.CancelledError:
+            # a hedge that lost or a caller that gave up: the request has no outcome, it only gives its slots back
+            cancelled = True
+            raise
+        except Exception as e:
+            if deadline is not None and remaining(deadline) <= 0:
+                raise DeadlineExceeded(method, url) from e
+            raise
+        finally:
+            if concurrency_limiter is not None:
+                if cancelled:
+                    concurrency_limiter.cancel()
+                else:
+                    concurrency_limiter.release(started_at, status_code)
+            if circuit_breaker is not None:
+                if cancelled:
+                    circuit_breaker.cancel()
+                else:
+                    circuit_breaker.record(status_code)
+
+        rate_limiter.update(response)
+        return response
+
+    @staticmethod
+    async def _read_stream_async(transport, response) -> TransportResponse:
+        try:
+            content = b"".join([chunk async for chunk in transport.iter_content(response)])
+        finally:
+            await transport.close_response(response)
+
+        return TransportResponse(response.status_code, response.headers, content)
+
+    def decode_stream(self, response, included: bool = False) -> Union[AsyncUnitStreamResponse, UnitError]:
+        if not self.is_20x(response.status_code):
+            return self.decode(response)
+
+        transport = self.configuration.get_async_transport()
+
+        async def aclose():
+            await stream.data.aclose()
+            await transport.close_response(response)
+
+        stream = AsyncUnitStreamResponse(None, aclose)
+        stream.data = self._stream_resources(transport, response, stream, included, self.raw_format())
+        return stream
+
+    async def _stream_resources(self, transport, response, stream: AsyncUnitStreamResponse, included: bool,
+                                raw_format: Optional[str]):
+        parser = JsonApiStreamParser()
+        decode = self._resource_decoder(raw_format)
+        try:
+            async for chunk in transport.iter_content(response):
+                if raw_format == "bytes":
+                    yield chunk
+                    continue
+
+                for resource in parser.feed(chunk):
+                    yield decode(resource)
+
+                self._update_stream(parser, stream, included, decode)
+
+            if raw_format != "bytes":
+                for resource in parser.close():
+                    yield decode(resource)
+
+                self._update_stream(parser, stream, included, decode)
+        finally:
+            await transport.close_response(response)
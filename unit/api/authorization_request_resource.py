@@ -1,46 +1,58 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.authorization_request import *
-from unit.models.codecs import DtoDecoder
 
 
 class AuthorizationRequestResource(BaseResource):
+    list_params = ListPurchaseAuthorizationRequestParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("authorization-requests", configuration)
 
     def get(self, authorization_id: str) -> Union[UnitResponse[PurchaseAuthorizationRequestDTO], UnitError]:
         response = super().get(f"{self.resource}/{authorization_id}")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PurchaseAuthorizationRequestDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def list(self, params: ListPurchaseAuthorizationRequestParams = None) \
             -> Union[UnitResponse[List[PurchaseAuthorizationRequestDTO]], UnitError]:
         params = params or ListPurchaseAuthorizationRequestParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PurchaseAuthorizationRequestDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def approve(self, request: ApproveAuthorizationRequest) -> Union[UnitResponse[PurchaseAuthorizationRequestDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{request.authorization_id}/approve", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PurchaseAuthorizationRequestDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def decline(self, request: DeclineAuthorizationRequest) -> Union[UnitResponse[PurchaseAuthorizationRequestDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{request.authorization_id}/decline", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PurchaseAuthorizationRequestDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
+
+
+class AsyncAuthorizationRequestResource(AsyncBaseResource):
+    list_params = ListPurchaseAuthorizationRequestParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("authorization-requests", configuration)
+
+    async def get(self, authorization_id: str) -> Union[UnitResponse[PurchaseAuthorizationRequestDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{authorization_id}")
+        return super().decode(response)
 
+    async def list(self, params: ListPurchaseAuthorizationRequestParams = None) \
+            -> Union[UnitResponse[List[PurchaseAuthorizationRequestDTO]], UnitError]:
+        params = params or ListPurchaseAuthorizationRequestParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response)
+
+    async def approve(self, request: ApproveAuthorizationRequest) -> Union[UnitResponse[PurchaseAuthorizationRequestDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.authorization_id}/approve", payload)
+        return super().decode(response)
+
+    async def decline(self, request: DeclineAuthorizationRequest) -> Union[UnitResponse[PurchaseAuthorizationRequestDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.authorization_id}/decline", payload)
+        return super().decode(response)
@@ -1,10 +1,12 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.authorization import *
-from unit.models.codecs import DtoDecoder
 
 
 class AuthorizationResource(BaseResource):
+    list_params = ListAuthorizationParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("authorizations", configuration)
 
@@ -12,17 +14,28 @@ class AuthorizationResource(BaseResource):
         params = {"filter[includeNonAuthorized]": include_non_authorized}
 
         response = super().get(f"{self.resource}/{authorization_id}", params)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AuthorizationDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def list(self, params: ListAuthorizationParams = None) -> Union[UnitResponse[List[AuthorizationDTO]], UnitError]:
         params = params or ListAuthorizationParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[AuthorizationDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
+
+
+class AsyncAuthorizationResource(AsyncBaseResource):
+    list_params = ListAuthorizationParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("authorizations", configuration)
+
+    async def get(self, authorization_id: str, include_non_authorized: Optional[bool] = False) -> Union[UnitResponse[AuthorizationDTO], UnitError]:
+        params = {"filter[includeNonAuthorized]": include_non_authorized}
+
+        response = await super().get(f"{self.resource}/{authorization_id}", params)
+        return super().decode(response)
+
+    async def list(self, params: ListAuthorizationParams = None) ->\
+            Union[UnitResponse[List[AuthorizationDTO]], UnitError]:
+        params = params or ListAuthorizationParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response)
@@ -1,135 +1,294 @@
-import json
-import requests
-import backoff
-from typing import Optional, Dict
+from typing import Optional, Dict, Iterator, List, Union
 
 from unit.utils.configuration import Configuration
-from unit.models.codecs import UnitEncoder
-
-
-def backoff_idempotency_key_handler(e):
-    return backoff_handler(e) and idempotency_key_is_present(e)
-
-
-def backoff_handler(e):
-    code = e.status_code
-    return is_timeout(code) or is_rate_limit(code) or is_server_error(code)
-
-
-def is_timeout(code):
-    return code == 408
-
-
-def is_rate_limit(code):
-    return code == 429
-
-
-def is_server_error(code):
-    return 500 <= code <= 599
-
-
-def idempotency_key_is_present(e):
-    body = json.loads(e.request.body)
-    if body is None:
+from unit.utils.circuit_breaker import CircuitBreaker
+from unit.utils.compression import TransferStats, body_size, compress_body
+from unit.utils.deadline import current_deadline, remaining, DeadlineExceeded
+from unit.utils.hedging import HedgingPolicy
+from unit.utils.retry import RetryPolicy, NO_RETRY
+from unit.utils import json_backend
+from unit.utils.json_stream import JsonApiStreamParser
+from unit.utils.pagination import paginate, prefetch
+from unit.utils.raw import current_raw_format
+from unit.utils.transport import TransportResponse
+from unit.models import UnitResponse, UnitError, UnitStreamResponse
+from unit.models.codecs import DtoDecoder, encode
+
+
+def idempotency_key_is_present(data: Optional[Dict]):
+    if not data:
         return False
 
-    return body["data"]["attributes"].get("idempotencyKey") is not None
+    return data["data"]["attributes"].get("idempotencyKey") is not None
 
 
 class BaseResource(object):
+    # the params class of list(), for resources that can be listed page by page
+    list_params = None
+
     def __init__(self, resource: str, configuration: Configuration):
         self.resource = resource
         self.configuration = configuration
 
-    def get(self, resource: str, params: Dict = None, headers: Optional[Dict[str, str]] = None):
+    def iter_all(self, params=None, prefetch_pages: int = 0, workers: Optional[int] = None) -> Iterator:
+        """
+        Yields the resources of every page of list(params) one at a time, starting at params.offset. A page is only
+        requested once the previous one was consumed, so memory is bounded by params.limit however many resources
+        there are. With prefetch_pages, up to that many following pages are fetched concurrently on `workers` threads
+        while a page is being consumed. Raises a PaginationError when listing a page fails.
+        """
+        if prefetch_pages > 0:
+            return prefetch(self.list, self.first_page(params), prefetch_pages, workers)
 
-        @backoff.on_predicate(backoff.expo,
-                              backoff_handler,
-                              max_tries=self.configuration.get_tries,
-                              max_time=self.configuration.get_timeout,
-                              jitter=backoff.random_jitter)
-        def get_with_backoff(path: str, p: Dict, h: Dict[str, str]):
-            return requests.get(path, params=p, headers=h)
+        return paginate(self.list, self.first_page(params))
 
-        return get_with_backoff(f"{self.configuration.api_url}/{resource}", params, self.__merge_headers(headers))
+    def list_all(self, params=None, prefetch_pages: int = 0, workers: Optional[int] = None) -> List:
+        return list(self.iter_all(params, prefetch_pages, workers))
 
-    def post(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
-        data = json.dumps(data, cls=UnitEncoder) if data is not None else None
+    def first_page(self, params=None):
+        if params is not None:
+            return params
 
-        @backoff.on_predicate(backoff.expo,
-                              backoff_handler,
-                              max_tries=self.configuration.get_tries,
-                              max_time=self.configuration.get_timeout,
-                              jitter=backoff.random_jitter)
-        def post_with_backoff(path: str, d: Dict, h: Dict[str, str]):
-            return requests.post(path, data=d, headers=h)
+        if self.list_params is None:
+            raise Exception(f"{self.resource} cannot be listed page by page")
 
-        return post_with_backoff(f"{self.configuration.api_url}/{resource}", data, self.__merge_headers(headers))
+        return self.list_params()
 
-    def post_create(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
-        data = json.dumps(data, cls=UnitEncoder) if data is not None else None
+    def get(self, resource: str, params: Dict = None, headers: Optional[Dict[str, str]] = None):
+        cache = self.configuration.response_cache
+        if cache is not None:
+            url = f"{self.configuration.api_url}/{resource}"
+            return cache.call(resource, params, headers, self._send, "GET", url, params, None, headers, None,
+                              self.configuration.get_hedging_policy(self.resource))
+
+        return self._send("GET", f"{self.configuration.api_url}/{resource}", params=params, headers=headers,
+                          hedging_policy=self.configuration.get_hedging_policy(self.resource))
+
+    def get_stream(self, resource: str, params: Dict = None, headers: Optional[Dict[str, str]] = None):
+        """
+        Sends a GET request whose response body is left to be read while decoding it, see decode_stream().
+        """
+        return self._send("GET", f"{self.configuration.api_url}/{resource}", params=params, headers=headers,
+                          stream=True)
 
-        @backoff.on_predicate(backoff.expo,
-                              backoff_idempotency_key_handler,
-                              max_tries=self.configuration.get_tries,
-                              max_time=self.configuration.get_timeout,
-                              jitter=backoff.random_jitter)
-        def post_create_with_backoff(path: str, d, h):
-            return requests.post(path, data=d, headers=h)
+    def post(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        data = encode(data) if data is not None else None
+        return self._send("POST", f"{self.configuration.api_url}/{resource}", data=data, headers=headers)
 
-        return post_create_with_backoff(f"{self.configuration.api_url}/{resource}", data, self.__merge_headers(headers))
+    def post_create(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        retry_policy = None if idempotency_key_is_present(data) else NO_RETRY
+        data = encode(data) if data is not None else None
+        return self._send("POST", f"{self.configuration.api_url}/{resource}", data=data, headers=headers,
+                          retry_policy=retry_policy)
 
     def post_full_path(self, path: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
-        data = json.dumps(data, cls=UnitEncoder) if data is not None else None
-
-        @backoff.on_predicate(backoff.expo,
-                              backoff_handler,
-                              max_tries=self.configuration.get_tries,
-                              max_time=self.configuration.get_timeout,
-                              jitter=backoff.random_jitter)
-        def post_full_path_with_backoff(p, d, h):
-            return requests.post(p, data=d, headers=h)
-
-        return post_full_path_with_backoff(path, data, self.__merge_headers(headers))
+        data = encode(data) if data is not None else None
+        return self._send("POST", path, data=data, headers=headers)
 
     def patch(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
-        data = json.dumps(data, cls=UnitEncoder) if data is not None else None
+        data = encode(data) if data is not None else None
+        return self._send("PATCH", f"{self.configuration.api_url}/{resource}", data=data, headers=headers)
 
-        @backoff.on_predicate(backoff.expo,
-                              backoff_handler,
-                              max_tries=self.configuration.get_tries,
-                              max_time=self.configuration.get_timeout,
-                              jitter=backoff.random_jitter)
-        def patch_with_backoff(p, d, h):
-            return requests.patch(p, data=d, headers=h)
+    def delete(self, resource: str, data: Dict = None, headers: Optional[Dict[str, str]] = None):
+        data = encode(data) if data is not None else None
+        return self._send("DELETE", f"{self.configuration.api_url}/{resource}", data=data, headers=headers)
 
-        return patch_with_backoff(f"{self.configuration.api_url}/{resource}", data, self.__merge_headers(headers))
+    def put(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
+        return self._send("PUT", f"{self.configuration.api_url}/{resource}", data=data, headers=headers)
+
+    def _send(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+              headers: Optional[Dict[str, str]] = None, retry_policy: Optional[RetryPolicy] = None,
+              hedging_policy: Optional[HedgingPolicy] = None, stream: bool = False):
+        retry_policy = retry_policy or self.configuration.get_retry_policy(self.resource, method)
+        headers = self._merge_headers(headers)
+        # only the JSON:API documents built by encode() are compressed, never the files uploaded with put()
+        compress_over = self.configuration.compress_requests_over if method != "PUT" else None
+        body, headers = compress_body(data, headers, compress_over)
+        circuit_breaker = self.configuration.get_circuit_breaker(method, url)
+        deadline = current_deadline.get()
+        if hedging_policy is None:
+            response = retry_policy.call(self._request, method, url, params, body, headers, circuit_breaker, deadline,
+                                         stream, deadline=deadline)
+        else:
+            response = retry_policy.call(hedging_policy.call, self._request, method, url, params, body, headers,
+                                         circuit_breaker, deadline, deadline=deadline)
+
+        if self.configuration.response_cache is not None and method != "GET":
+            self._invalidate_cache(url)
+
+        # the size of a streamed body is only known once it was read
+        if self.configuration.on_transfer is not None and not stream:
+            self._report_transfer(self.configuration.get_transport(), method, url, data, body, response)
+
+        return response
+
+    def _request(self, method: str, url: str, params: Optional[Dict], data, headers: Dict[str, str],
+                 circuit_breaker: Optional[CircuitBreaker] = None, deadline: Optional[float] = None,
+                 stream: bool = False):
+        rate_limiter = self.configuration.rate_limiter
+        concurrency_limiter = self.configuration.concurrency_limiter
+        status_code = None
+
+        if deadline is not None and remaining(deadline) <= 0:
+            raise DeadlineExceeded(method, url)
+
+        # the waits for the rate and concurrency limiters count against the deadline too
+        if not rate_limiter.acquire(remaining(deadline)):
+            raise DeadlineExceeded(method, url)
+
+        started_at = None
+        if concurrency_limiter is not None:
+            started_at = concurrency_limiter.acquire(remaining(deadline))
+            if started_at is None:
+                raise DeadlineExceeded(method, url)
+
+        self._admit(method, url, circuit_breaker, deadline, started_at)
+        try:
+            timeout = self.configuration.get_socket_timeouts(deadline)
+            transport = self.configuration.get_transport()
+            if stream:
+                response = transport.stream(method, url, params, data, headers, timeout)
+                if not self.is_20x(response.status_code):
+                    # error bodies are small: read them so retries and decode() see a complete response
+                    response = self._read_stream(transport, response)
+            else:
+                response = transport.request(method, url, params, data, headers, timeout)
+            status_code = response.status_code
+        except Exception as e:
+            if deadline is not None and remaining(deadline) <= 0:
+                raise DeadlineExceeded(method, url) from e
+            raise
+        finally:
+            if concurrency_limiter is not None:
+                concurrency_limiter.release(started_at, status_code)
+            if circuit_breaker is not None:
+                circuit_breaker.record(status_code)
+
+        rate_limiter.update(response)
+        return response
+
+    def _admit(self, method: str, url: str, circuit_breaker: Optional[CircuitBreaker], deadline: Optional[float],
+               started_at: Optional[float]):
+        """
+        Raises when the deadline passed while waiting for the limiters, or the circuit breaker rejects the request,
+        giving its concurrency slot back.
+        """
+        try:
+            if deadline is not None and remaining(deadline) <= 0:
+                raise DeadlineExceeded(method, url)
+
+            if circuit_breaker is not None:
+                circuit_breaker.before_call()
+        except Exception:
+            if started_at is not None:
+                self.configuration.concurrency_limiter.cancel()
+            raise
+
+    def _invalidate_cache(self, url: str):
+        if url.startswith(self.configuration.api_url):
+            # a write to cards/1/freeze changes cards/1 and what is below it, e.g. cards/1/limits
+            path = url[len(self.configuration.api_url) + 1:].split("?")[0]
+            self.configuration.response_cache.invalidate_path("/".join(path.split("/")[:2]))
+
+    def _report_transfer(self, transport, method: str, url: str, data, body, response):
+        stats = TransferStats(method, url, response.status_code, body_size(data), body_size(body),
+                              len(response.content), transport.response_size(response))
+        self.configuration.on_transfer(stats)
 
-    def delete(self, resource: str, data: Dict = None, headers: Optional[Dict[str, str]] = None):
-        data = json.dumps(data, cls=UnitEncoder) if data is not None else None
+    @staticmethod
+    def _read_stream(transport, response) -> TransportResponse:
+        try:
+            content = b"".join(transport.iter_content(response))
+        finally:
+            transport.close_response(response)
 
-        @backoff.on_predicate(backoff.expo,
-                              backoff_handler,
-                              max_tries=self.configuration.get_tries,
-                              max_time=self.configuration.get_timeout,
-                              jitter=backoff.random_jitter)
-        def delete_with_backoff(p, d, h):
-            return requests.delete(p, data=d, headers=h)
+        return TransportResponse(response.status_code, response.headers, content)
 
-        return delete_with_backoff(f"{self.configuration.api_url}/{resource}", data, self.__merge_headers(headers))
+    @staticmethod
+    def decode_json(response) -> Dict:
+        return json_backend.loads(response.content)
+
+    def decode(self, response, included: bool = False) -> Union[UnitResponse, UnitError]:
+        """
+        Parses the response body once and decodes its data (and included resources when asked for) into DTOs, or
+        LazyDTOs with Configuration(lazy_decoding=True), or its errors into a UnitError. With raw responses (see
+        unit.utils.raw) the parsed JSON, or the body itself, is returned instead of DTOs.
+        """
+        raw_format = self.raw_format()
+        if raw_format == "bytes" and self.is_20x(response.status_code):
+            return UnitResponse(response.content, None)
+
+        body = self.decode_json(response)
+        if not self.is_20x(response.status_code):
+            return UnitError.from_json_api(body)
+
+        if raw_format == "json":
+            return UnitResponse(body.get("data"), body.get("included") if included else None, body.get("meta"))
+
+        lazy, interned = self.configuration.lazy_decoding, {}
+        return UnitResponse(DtoDecoder.decode(body.get("data"), lazy, interned),
+                            DtoDecoder.decode(body.get("included"), lazy, interned) if included else None,
+                            body.get("meta"))
+
+    def decode_stream(self, response, included: bool = False) -> Union[UnitStreamResponse, UnitError]:
+        """
+        Decodes a response of get_stream(): the resources of its data array are decoded one at a time while the body
+        is read, so only one chunk of the body is held in memory instead of the whole page. With raw "json" responses
+        the resources are the parsed dicts, with raw "bytes" responses `data` yields the chunks of the body.
+        """
+        if not self.is_20x(response.status_code):
+            return self.decode(response)
+
+        transport = self.configuration.get_transport()
+
+        def close():
+            stream.data.close()
+            transport.close_response(response)
+
+        stream = UnitStreamResponse(None, close)
+        stream.data = self._stream_resources(transport, response, stream, included, self.raw_format())
+        return stream
+
+    def _stream_resources(self, transport, response, stream: UnitStreamResponse, included: bool,
+                          raw_format: Optional[str]):
+        parser = JsonApiStreamParser()
+        decode = self._resource_decoder(raw_format)
+        try:
+            for chunk in transport.iter_content(response):
+                if raw_format == "bytes":
+                    yield chunk
+                    continue
+
+                for resource in parser.feed(chunk):
+                    yield decode(resource)
+
+                self._update_stream(parser, stream, included, decode)
+
+            if raw_format != "bytes":
+                for resource in parser.close():
+                    yield decode(resource)
+
+                self._update_stream(parser, stream, included, decode)
+        finally:
+            transport.close_response(response)
+
+    def _resource_decoder(self, raw_format: Optional[str]):
+        if raw_format is not None:
+            return lambda payload: payload
+
+        lazy, interned = self.configuration.lazy_decoding, {}
+        return lambda payload: DtoDecoder.decode(payload, lazy, interned)
 
-    def put(self, resource: str, data: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None):
-        @backoff.on_predicate(backoff.expo,
-                              backoff_handler,
-                              max_tries=self.configuration.get_tries,
-                              max_time=self.configuration.get_timeout,
-                              jitter=backoff.random_jitter)
-        def put_with_backoff(p, d, h):
-            return requests.put(p, data=d, headers=h)
+    @staticmethod
+    def _update_stream(parser: JsonApiStreamParser, stream, included: bool, decode):
+        stream.meta = parser.members.get("meta")
+        if included and stream.included is None and "included" in parser.members:
+            stream.included = decode(parser.members["included"])
 
-        return put_with_backoff(f"{self.configuration.api_url}/{resource}", data, self.__merge_headers(headers))
+    def raw_format(self) -> Optional[str]:
+        return current_raw_format.get() or self.configuration.raw_responses
 
-    def __merge_headers(self, headers: Optional[Dict[str, str]] = None):
+    def _merge_headers(self, headers: Optional[Dict[str, str]] = None):
         if not headers:
             return self.configuration.get_headers()
         else:
@@ -1,133 +1,150 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.card import *
-from unit.models.codecs import DtoDecoder
 
 
 class CardResource(BaseResource):
+    list_params = ListCardParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("cards", configuration)
 
     def create(self, request: CreateCardRequest) -> Union[UnitResponse[Card], UnitError]:
         payload = request.to_json_api()
         response = super().post_create(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[Card](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def report_stolen(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
         response = super().post(f"{self.resource}/{card_id}/report-stolen")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[Card](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def report_lost(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
         response = super().post(f"{self.resource}/{card_id}/report-lost")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[Card](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def close(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
         response = super().post(f"{self.resource}/{card_id}/close")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[Card](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def freeze(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
         response = super().post(f"{self.resource}/{card_id}/freeze")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[Card](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def unfreeze(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
         response = super().post(f"{self.resource}/{card_id}/unfreeze")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[Card](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def replace(self, card_id: str, shipping_address: Optional[Address]) -> Union[UnitResponse[Card], UnitError]:
         request = ReplaceCardRequest(shipping_address)
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{card_id}/replace", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[Card](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def update(self, request: PatchCardRequest) -> Union[UnitResponse[Card], UnitError]:
         payload = request.to_json_api()
         response = super().patch(f"{self.resource}/{request.card_id}", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[Card](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def get(self, card_id: str, include: Optional[str] = "") -> Union[UnitResponse[Card], UnitError]:
         response = super().get(f"{self.resource}/{card_id}", {"include": include})
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[Card](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
 
     def list(self, params: ListCardParams = None) -> Union[UnitResponse[List[Card]], UnitError]:
         params = params or ListCardParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[Card](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
 
     def get_pin_status(self, card_id: str) -> Union[UnitResponse[PinStatusDTO], UnitError]:
         response = super().get(f"{self.resource}/{card_id}/secure-data/pin/status")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PinStatusDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def limits(self, card_id: str) -> Union[UnitResponse[CardLimitsDTO], UnitError]:
         response = super().get(f"{self.resource}/{card_id}/limits")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CardLimitsDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def mobile_wallet_payload(self, request: GetMobileWalletPayloadRequest) -> Union[UnitResponse[MobileWalletPayloadDTO],
                                                                                      UnitError]:
         payload = request.to_json_api()
         response = super().post_full_path(
             f"{request.secure_path}/{self.resource}/{request.card_id}/mobile-wallet-payload", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[MobileWalletPayloadDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def enable_card_to_card_payment(self, request: EnableCardToCardPaymentsRequest) ->\
             Union[UnitResponse[CardToCardPaymentDTO], UnitError]:
         payload = request.to_json_api()
         response = super().patch(f"{self.resource}/{request.card_id}", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CardToCardPaymentDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
+
+
+class AsyncCardResource(AsyncBaseResource):
+    list_params = ListCardParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("cards", configuration)
+
+    async def create(self, request: CreateCardRequest) -> Union[UnitResponse[Card], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().decode(response)
+
+    async def report_stolen(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
+        response = await super().post(f"{self.resource}/{card_id}/report-stolen")
+        return super().decode(response)
+
+    async def report_lost(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
+        response = await super().post(f"{self.resource}/{card_id}/report-lost")
+        return super().decode(response)
+
+    async def close(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
+        response = await super().post(f"{self.resource}/{card_id}/close")
+        return super().decode(response)
+
+    async def freeze(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
+        response = await super().post(f"{self.resource}/{card_id}/freeze")
+        return super().decode(response)
+
+    async def unfreeze(self, card_id: str) -> Union[UnitResponse[Card], UnitError]:
+        response = await super().post(f"{self.resource}/{card_id}/unfreeze")
+        return super().decode(response)
+
+    async def replace(self, card_id: str, shipping_address: Optional[Address]) -> Union[UnitResponse[Card], UnitError]:
+        request = ReplaceCardRequest(shipping_address)
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{card_id}/replace", payload)
+        return super().decode(response)
+
+    async def update(self, request: PatchCardRequest) -> Union[UnitResponse[Card], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.card_id}", payload)
+        return super().decode(response)
+
+    async def get(self, card_id: str, include: Optional[str] = "") -> Union[UnitResponse[Card], UnitError]:
+        response = await super().get(f"{self.resource}/{card_id}", {"include": include})
+        return super().decode(response, included=True)
+
+    async def list(self, params: ListCardParams = None) -> Union[UnitResponse[List[Card]], UnitError]:
+        params = params or ListCardParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response, included=True)
+
+    async def get_pin_status(self, card_id: str) -> Union[UnitResponse[PinStatusDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{card_id}/secure-data/pin/status")
+        return super().decode(response)
+
+    async def limits(self, card_id: str) -> Union[UnitResponse[CardLimitsDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{card_id}/limits")
+        return super().decode(response)
+
+    async def mobile_wallet_payload(self, request: GetMobileWalletPayloadRequest) -> Union[UnitResponse[MobileWalletPayloadDTO],
+                                                                                     UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_full_path(
+            f"{request.secure_path}/{self.resource}/{request.card_id}/mobile-wallet-payload", payload)
+        return super().decode(response)
+
+    async def enable_card_to_card_payment(self, request: EnableCardToCardPaymentsRequest) ->\
+            Union[UnitResponse[CardToCardPaymentDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.card_id}", payload)
+        return super().decode(response)
@@ -1,21 +1,19 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.check_deposit import *
-from unit.models.codecs import DtoDecoder
 
 
 class CheckDepositResource(BaseResource):
+    list_params = ListCheckDepositParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("check-deposits", configuration)
 
     def create(self, request: CreateCheckDepositRequest) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post_create(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CheckDepositDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def get(self, check_deposit_id: str, include: Optional[str] = None) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
         params = {}
@@ -24,31 +22,17 @@ class CheckDepositResource(BaseResource):
             params["include"] = include
 
         response = super().get(f"{self.resource}/{check_deposit_id}", params)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[CheckDepositDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
 
     def list(self, params: ListCheckDepositParams = None) -> Union[UnitResponse[List[CheckDepositDTO]], UnitError]:
         params = params or ListCheckDepositParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[CheckDepositDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
 
     def update(self, request: PatchCheckDepositRequest) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
         payload = request.to_json_api()
         response = super().patch(f"{self.resource}/{request.check_deposit_id}", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CheckDepositDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def upload(self, request: UploadCheckDepositDocumentRequest) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
         url = f"{self.resource}/{request.check_deposit_id}/{request.side}"
@@ -56,17 +40,55 @@ class CheckDepositResource(BaseResource):
         headers = {"Content-Type": "image/jpeg"}
 
         response = super().put(url, request.file, headers)
-        if response.status_code == 200:
-            data = response.json().get("data")
-            return UnitResponse[CheckDepositDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def confirm(self, check_deposit_id: str) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
         response = super().post(f"{self.resource}/{check_deposit_id}/confirm")
 
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CheckDepositDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
+
+
+class AsyncCheckDepositResource(AsyncBaseResource):
+    list_params = ListCheckDepositParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("check-deposits", configuration)
+
+    async def create(self, request: CreateCheckDepositRequest) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().decode(response)
+
+    async def get(self, check_deposit_id: str, include: Optional[str] = None) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
+        params = {}
+
+        if include:
+            params["include"] = include
+
+        response = await super().get(f"{self.resource}/{check_deposit_id}", params)
+        return super().decode(response, included=True)
+
+    async def list(self, params: ListCheckDepositParams = None) ->\
+            Union[UnitResponse[List[CheckDepositDTO]], UnitError]:
+        params = params or ListCheckDepositParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response, included=True)
+
+    async def update(self, request: PatchCheckDepositRequest) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.check_deposit_id}", payload)
+        return super().decode(response)
+
+    async def upload(self, request: UploadCheckDepositDocumentRequest) ->\
+            Union[UnitResponse[CheckDepositDTO], UnitError]:
+        url = f"{self.resource}/{request.check_deposit_id}/{request.side}"
+
+        headers = {"Content-Type": "image/jpeg"}
+
+        response = await super().put(url, request.file, headers)
+        return super().decode(response)
+
+    async def confirm(self, check_deposit_id: str) -> Union[UnitResponse[CheckDepositDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{check_deposit_id}/confirm")
+
+        return super().decode(response)
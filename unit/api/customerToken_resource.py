@@ -1,7 +1,7 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.customerToken import *
-from unit.models.codecs import DtoDecoder
 
 
 class CustomerTokenResource(BaseResource):
@@ -12,18 +12,27 @@ class CustomerTokenResource(BaseResource):
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{request.customer_id}/token", payload)
 
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CustomerTokenDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def create_token_verification(self, request: CreateCustomerTokenVerification) -> Union[UnitResponse[CustomerVerificationTokenDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{request.customer_id}/token/verification", payload)
 
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CustomerVerificationTokenDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
+
+
+class AsyncCustomerTokenResource(AsyncBaseResource):
+    def __init__(self, configuration: Configuration):
+        super().__init__("customers", configuration)
+
+    async def create_token(self, request: CreateCustomerToken) -> Union[UnitResponse[CustomerTokenDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.customer_id}/token", payload)
+
+        return super().decode(response)
+
+    async def create_token_verification(self, request: CreateCustomerTokenVerification) -> Union[UnitResponse[CustomerVerificationTokenDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.customer_id}/token/verification", payload)
+
+        return super().decode(response)
@@ -1,10 +1,12 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.customer import *
-from unit.models.codecs import DtoDecoder
 
 
 class CustomerResource(BaseResource):
+    list_params = ListCustomerParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("customers", configuration)
 
@@ -12,53 +14,66 @@ class CustomerResource(BaseResource):
         payload = request.to_json_api()
         response = super().patch(f"{self.resource}/{request.customer_id}", payload)
 
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CustomerDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def get(self, customer_id: str) -> Union[UnitResponse[CustomerDTO], UnitError]:
         response = super().get(f"{self.resource}/{customer_id}")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CustomerDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def list(self, params: ListCustomerParams = None) -> Union[UnitResponse[List[CustomerDTO]], UnitError]:
         params = params or ListCustomerParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CustomerDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def archive(self, request: ArchiveCustomerRequest) -> Union[UnitResponse[CustomerDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{request.customer_id}/archive", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CustomerDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def add_authorized_users(self, request: AddAuthorizedUsersRequest) -> Union[UnitResponse[CustomerDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(f"{self.resource}/{request.customer_id}/authorized-users", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CustomerDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def remove_authorized_users(self, request: RemoveAuthorizedUsersRequest) -> Union[UnitResponse[CustomerDTO], UnitError]:
         payload = request.to_json_api()
         response = super().delete(f"{self.resource}/{request.customer_id}/authorized-users", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[CustomerDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
+
+
+class AsyncCustomerResource(AsyncBaseResource):
+    list_params = ListCustomerParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("customers", configuration)
+
+    async def update(self, request: PatchCustomerRequest) -> Union[UnitResponse[CustomerDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.customer_id}", payload)
+
+        return super().decode(response)
 
+    async def get(self, customer_id: str) -> Union[UnitResponse[CustomerDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{customer_id}")
+        return super().decode(response)
+
+    async def list(self, params: ListCustomerParams = None) -> Union[UnitResponse[List[CustomerDTO]], UnitError]:
+        params = params or ListCustomerParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response)
+
+    async def archive(self, request: ArchiveCustomerRequest) -> Union[UnitResponse[CustomerDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.customer_id}/archive", payload)
+        return super().decode(response)
+
+    async def add_authorized_users(self, request: AddAuthorizedUsersRequest) ->\
+            Union[UnitResponse[CustomerDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(f"{self.resource}/{request.customer_id}/authorized-users", payload)
+        return super().decode(response)
+
+    async def remove_authorized_users(self, request: RemoveAuthorizedUsersRequest) -> Union[UnitResponse[CustomerDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().delete(f"{self.resource}/{request.customer_id}/authorized-users", payload)
+        return super().decode(response)
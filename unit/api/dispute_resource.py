@@ -1,28 +1,36 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.dispute import *
-from unit.models.codecs import DtoDecoder
 
 
 class DisputeResource(BaseResource):
+    list_params = ListDisputeParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("disputes", configuration)
 
     def get(self, dispute_id: str) -> Union[UnitResponse[DisputeDTO], UnitError]:
         response = super().get(f"{self.resource}/{dispute_id}")
-        if response.status_code == 200:
-            data = response.json().get("data")
-            return UnitResponse[DisputeDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def list(self, params: ListDisputeParams = None) -> Union[UnitResponse[List[DisputeDTO]], UnitError]:
         params = params or ListDisputeParams()
         response = super().get(self.resource, params.to_dict())
-        if response.status_code == 200:
-            data = response.json().get("data")
-            return UnitResponse[DisputeDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
+
 
+class AsyncDisputeResource(AsyncBaseResource):
+    list_params = ListDisputeParams
 
+    def __init__(self, configuration: Configuration):
+        super().__init__("disputes", configuration)
+
+    async def get(self, dispute_id: str) -> Union[UnitResponse[DisputeDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{dispute_id}")
+        return super().decode(response)
+
+    async def list(self, params: ListDisputeParams = None) -> Union[UnitResponse[List[DisputeDTO]], UnitError]:
+        params = params or ListDisputeParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response)
@@ -1,33 +1,67 @@
+from datetime import datetime, timedelta
+
 from unit.utils.configuration import Configuration
+from unit.utils.export import ShardedExport
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.event import *
-from unit.models.codecs import DtoDecoder
 
 
 class EventResource(BaseResource):
+    list_params = ListEventParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("events", configuration)
 
     def get(self, event_id: str) -> Union[UnitResponse[EventDTO], UnitError]:
         response = super().get(f"{self.resource}/{event_id}")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[EventDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def list(self, params: ListEventParams = None) -> Union[UnitResponse[List[EventDTO]], UnitError]:
         params = params or ListEventParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[EventDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
+
+    def export(self, since: datetime, until: datetime, params: ListEventParams = None,
+               window: timedelta = timedelta(hours=1), window_size: int = 10000, workers: int = 4,
+               checkpoint: Optional[str] = None) -> ShardedExport:
+        """
+        Iterates over the events created in [since, until), scanned concurrently in time windows and yielded in
+        createdAt order; see ShardedExport.
+        """
+        return ShardedExport(self, since, until, params, window, window_size, workers, checkpoint)
 
     def fire(self, event_id: str) -> Union[UnitResponse, UnitError]:
         response = super().post(f"{self.resource}/{event_id}")
         if super().is_20x(response.status_code):
             return UnitResponse([], None)
         else:
-            return UnitError.from_json_api(response.json())
+            return UnitError.from_json_api(super().decode_json(response))
+
+
+class AsyncEventResource(AsyncBaseResource):
+    list_params = ListEventParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("events", configuration)
+
+    async def get(self, event_id: str) -> Union[UnitResponse[EventDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{event_id}")
+        return super().decode(response)
+
+    async def list(self, params: ListEventParams = None) -> Union[UnitResponse[List[EventDTO]], UnitError]:
+        params = params or ListEventParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response)
+
+    def export(self, since: datetime, until: datetime, params: ListEventParams = None,
+               window: timedelta = timedelta(hours=1), window_size: int = 10000, workers: int = 4,
+               checkpoint: Optional[str] = None) -> ShardedExport:
+        return ShardedExport(self, since, until, params, window, window_size, workers, checkpoint)
+
+    async def fire(self, event_id: str) -> Union[UnitResponse, UnitError]:
+        response = await super().post(f"{self.resource}/{event_id}")
+        if super().is_20x(response.status_code):
+            return UnitResponse([], None)
+        else:
+            return UnitError.from_json_api(super().decode_json(response))
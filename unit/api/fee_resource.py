@@ -1,7 +1,7 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.fee import *
-from unit.models.codecs import DtoDecoder
 
 
 class FeeResource(BaseResource):
@@ -11,18 +11,24 @@ class FeeResource(BaseResource):
     def create(self, request: CreateFeeRequest) -> Union[UnitResponse[FeeDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post_create(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[FeeDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def reverse(self, request: ReverseFeeRequest) -> Union[UnitResponse[FeeDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post_create(f"{self.resource}/reverse", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[FeeDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
+
+class AsyncFeeResource(AsyncBaseResource):
+    def __init__(self, configuration: Configuration):
+        super().__init__("fees", configuration)
+
+    async def create(self, request: CreateFeeRequest) -> Union[UnitResponse[FeeDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().decode(response)
+
+    async def reverse(self, request: ReverseFeeRequest) -> Union[UnitResponse[FeeDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(f"{self.resource}/reverse", payload)
+        return super().decode(response)
@@ -1,7 +1,40 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import Iterable
+
 from unit.utils.configuration import Configuration
+from unit.utils.transport import TransportResponse
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.institution import *
-from unit.models.codecs import DtoDecoder
+
+
+def store_institutions(resource: BaseResource, cache, routing_numbers: List[str], responses: List) -> \
+        Dict[str, UnitError]:
+    contents, errors = {}, {}
+    for routing_number, response in zip(routing_numbers, responses):
+        if resource.is_20x(response.status_code):
+            contents[routing_number] = response.content
+        else:
+            errors[routing_number] = UnitError.from_json_api(resource.decode_json(response))
+
+    if contents:
+        cache.put_many(contents)
+
+    return errors
+
+
+def warm_up_cache(configuration: Configuration):
+    if configuration.institution_cache is None:
+        raise Exception("warm_up requires Configuration(institution_cache=...)")
+
+    return configuration.institution_cache
+
+
+async def in_thread(function, *args):
+    # SQLite calls block, keep them off the event loop
+    return await asyncio.get_running_loop().run_in_executor(None, function, *args)
 
 
 class InstitutionResource(BaseResource):
@@ -9,9 +42,57 @@ class InstitutionResource(BaseResource):
         super().__init__("institutions", configuration)
 
     def get(self, routing_number: str) -> Union[UnitResponse[InstitutionDTO], UnitError]:
+        cache = self.configuration.institution_cache
+        content = cache.get(routing_number) if cache is not None else None
+        if content is not None:
+            return super().decode(TransportResponse(200, {}, content))
+
         response = super().get(f"{self.resource}/{routing_number}", None)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[InstitutionDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        if cache is not None and super().is_20x(response.status_code):
+            cache.put(routing_number, response.content)
+
+        return super().decode(response)
+
+    def warm_up(self, routing_numbers: Iterable[str], workers: int = 8) -> Dict[str, UnitError]:
+        """
+        Fetches the institutions missing from Configuration(institution_cache=...), or expired, `workers` at a time
+        and stores them at once. Returns the errors of the routing numbers that could not be fetched.
+        """
+        cache = warm_up_cache(self.configuration)
+        missing = cache.missing(routing_numbers)
+        with ThreadPoolExecutor(workers, thread_name_prefix="unit-institutions") as executor:
+            # every request runs in a copy of the caller's context, so deadlines and raw responses still apply
+            futures = [executor.submit(copy_context().run, BaseResource.get, self, f"{self.resource}/{routing_number}")
+                       for routing_number in missing]
+            responses = [future.result() for future in futures]
+
+        return store_institutions(self, cache, missing, responses)
+
+
+class AsyncInstitutionResource(AsyncBaseResource):
+    def __init__(self, configuration: Configuration):
+        super().__init__("institutions", configuration)
+
+    async def get(self, routing_number: str) -> Union[UnitResponse[InstitutionDTO], UnitError]:
+        cache = self.configuration.institution_cache
+        content = await in_thread(cache.get, routing_number) if cache is not None else None
+        if content is not None:
+            return super().decode(TransportResponse(200, {}, content))
+
+        response = await super().get(f"{self.resource}/{routing_number}", None)
+        if cache is not None and super().is_20x(response.status_code):
+            await in_thread(cache.put, routing_number, response.content)
+
+        return super().decode(response)
+
+    async def warm_up(self, routing_numbers: Iterable[str], workers: int = 8) -> Dict[str, UnitError]:
+        cache = warm_up_cache(self.configuration)
+        missing = await in_thread(cache.missing, list(routing_numbers))
+        semaphore = asyncio.Semaphore(workers)
+
+        async def fetch(routing_number: str):
+            async with semaphore:
+                return await AsyncBaseResource.get(self, f"{self.resource}/{routing_number}")
+
+        responses = await asyncio.gather(*[fetch(routing_number) for routing_number in missing])
+        return await in_thread(store_institutions, self, cache, missing, responses)
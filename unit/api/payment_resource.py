@@ -1,47 +1,56 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.payment import *
-from unit.models.codecs import DtoDecoder
 
 
 class PaymentResource(BaseResource):
+    list_params = ListPaymentParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("payments", configuration)
 
     def create(self, request: CreatePaymentRequest) -> Union[UnitResponse[PaymentDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post_create(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PaymentDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def update(self, request: PatchPaymentRequest) -> Union[UnitResponse[PaymentDTO], UnitError]:
         payload = request.to_json_api()
         response = super().patch(f"{self.resource}/{request.payment_id}", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[PaymentDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def get(self, payment_id: str, include: Optional[str] = "") -> Union[UnitResponse[PaymentDTO], UnitError]:
         response = super().get(f"{self.resource}/{payment_id}", {"include": include})
-        if response.status_code == 200:
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[PaymentDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
 
     def list(self, params: ListPaymentParams = None) -> Union[UnitResponse[List[PaymentDTO]], UnitError]:
         params = params or ListPaymentParams()
         response = super().get(self.resource, params.to_dict())
-        if response.status_code == 200:
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[PaymentDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
+
+
+class AsyncPaymentResource(AsyncBaseResource):
+    list_params = ListPaymentParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("payments", configuration)
 
+    async def create(self, request: CreatePaymentRequest) -> Union[UnitResponse[PaymentDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().decode(response)
+
+    async def update(self, request: PatchPaymentRequest) -> Union[UnitResponse[PaymentDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.payment_id}", payload)
+        return super().decode(response)
+
+    async def get(self, payment_id: str, include: Optional[str] = "") -> Union[UnitResponse[PaymentDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{payment_id}", {"include": include})
+        return super().decode(response, included=True)
+
+    async def list(self, params: ListPaymentParams = None) -> Union[UnitResponse[List[PaymentDTO]], UnitError]:
+        params = params or ListPaymentParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response, included=True)
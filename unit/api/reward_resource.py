@@ -2,39 +2,48 @@ from typing import Union, List, Optional
 
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models import UnitResponse, UnitError
 from unit.models.reward import RewardDTO, ListRewardsParams, CreateRewardRequest
-from unit.models.codecs import DtoDecoder
 
 
 class RewardResource(BaseResource):
+    list_params = ListRewardsParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("rewards", configuration)
 
     def create(self, request: CreateRewardRequest) -> Union[UnitResponse[RewardDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post_create(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[RewardDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def get(self, reward_id: str, include: Optional[str] = "") -> Union[UnitResponse[RewardDTO], UnitError]:
         response = super().get(f"{self.resource}/{reward_id}", {"include": include})
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[RewardDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
 
     def list(self, params: ListRewardsParams = None) -> Union[UnitResponse[List[RewardDTO]], UnitError]:
         params = params or ListRewardsParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[List[RewardDTO]](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
+
+
+class AsyncRewardResource(AsyncBaseResource):
+    list_params = ListRewardsParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("rewards", configuration)
+
+    async def create(self, request: CreateRewardRequest) -> Union[UnitResponse[RewardDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post_create(self.resource, payload)
+        return super().decode(response)
+
+    async def get(self, reward_id: str, include: Optional[str] = "") -> Union[UnitResponse[RewardDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{reward_id}", {"include": include})
+        return super().decode(response, included=True)
+
+    async def list(self, params: ListRewardsParams = None) -> Union[UnitResponse[List[RewardDTO]], UnitError]:
+        params = params or ListRewardsParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response, included=True)
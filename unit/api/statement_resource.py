@@ -1,10 +1,12 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.statement import *
-from unit.models.codecs import DtoDecoder
 
 
 class StatementResource(BaseResource):
+    list_params = ListStatementParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("statements", configuration)
 
@@ -17,7 +19,7 @@ class StatementResource(BaseResource):
         if response.status_code == 200:
             return UnitResponse[str](response.text, None)
         else:
-            return UnitError.from_json_api(response.json())
+            return UnitError.from_json_api(super().decode_json(response))
 
     def get_bank_verification(self, account_id: str, include_proof_of_funds: Optional[bool] = False) -> Union[UnitResponse[str], UnitError]:
         response = super().get(f"{self.resource}/{account_id}/bank/pdf",
@@ -25,14 +27,40 @@ class StatementResource(BaseResource):
         if response.status_code == 200:
             return UnitResponse[str](response.text, None)
         else:
-            return UnitError.from_json_api(response.json())
+            return UnitError.from_json_api(super().decode_json(response))
 
     def list(self, params: ListStatementParams = None) -> Union[UnitResponse[List[StatementDTO]], UnitError]:
         params = params or ListStatementParams()
         response = super().get(self.resource, params.to_dict())
+        return super().decode(response)
+
+
+class AsyncStatementResource(AsyncBaseResource):
+    list_params = ListStatementParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("statements", configuration)
+
+    async def get(self, params: GetStatementParams) -> Union[UnitResponse[str], UnitError]:
+        parameters = {"language": params.language}
+        if params.customer_id:
+            parameters["filter[customerId]"] = params.customer_id
+
+        response = await super().get(f"{self.resource}/{params.statement_id}/{params.output_type}", parameters)
+        if response.status_code == 200:
+            return UnitResponse[str](response.text, None)
+        else:
+            return UnitError.from_json_api(super().decode_json(response))
+
+    async def get_bank_verification(self, account_id: str, include_proof_of_funds: Optional[bool] = False) -> Union[UnitResponse[str], UnitError]:
+        response = await super().get(f"{self.resource}/{account_id}/bank/pdf",
+                                     {"includeProofOfFunds": include_proof_of_funds})
         if response.status_code == 200:
-            data = response.json().get("data")
-            return UnitResponse[StatementDTO](DtoDecoder.decode(data), None)
+            return UnitResponse[str](response.text, None)
         else:
-            return UnitError.from_json_api(response.json())
+            return UnitError.from_json_api(super().decode_json(response))
 
+    async def list(self, params: ListStatementParams = None) -> Union[UnitResponse[List[StatementDTO]], UnitError]:
+        params = params or ListStatementParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response)
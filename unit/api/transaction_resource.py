@@ -1,48 +1,88 @@
+from datetime import datetime, timedelta
+
 from unit.utils.configuration import Configuration
+from unit.utils.export import ShardedExport
 from unit.api.base_resource import BaseResource
-from unit.models.codecs import DtoDecoder
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.transaction import *
 
 
 class TransactionResource(BaseResource):
+    list_params = ListTransactionParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("transactions", configuration)
 
     def get(self, transaction_id: str, include: Optional[str] = "") -> Union[UnitResponse[TransactionDTO], UnitError]:
         response = super().get(f"{self.resource}/{transaction_id}", {"include": include})
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[TransactionDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
 
     def list(self, params: ListTransactionParams = None) -> Union[UnitResponse[List[TransactionDTO]], UnitError]:
         params = params or ListTransactionParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[TransactionDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
+
+    def stream(self, params: ListTransactionParams = None) -> Union[UnitStreamResponse[TransactionDTO], UnitError]:
+        """
+        Like list(), but decodes the transactions one at a time while the response is read.
+        """
+        params = params or ListTransactionParams()
+        response = super().get_stream(self.resource, params.to_dict())
+        return super().decode_stream(response, included=True)
+
+    def export(self, since: datetime, until: datetime, params: ListTransactionParams = None,
+               window: timedelta = timedelta(hours=1), window_size: int = 10000, workers: int = 4,
+               checkpoint: Optional[str] = None) -> ShardedExport:
+        """
+        Iterates over the transactions created in [since, until), scanned concurrently in time windows and yielded in
+        createdAt order; see ShardedExport.
+        """
+        return ShardedExport(self, since, until, params, window, window_size, workers, checkpoint)
 
     def update(self, request: PatchTransactionRequest) -> Union[UnitResponse[TransactionDTO], UnitError]:
         payload = request.to_json_api()
         response = super().patch(f"accounts/{request.account_id}/{self.resource}/{request.transaction_id}", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[TransactionDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
 
     def get_by_id_and_account(self, transaction_id: str, account_id: str, include: Optional[str] = "") ->\
             Union[UnitResponse[TransactionDTO], UnitError]:
         response = super().get(f"accounts/{account_id}/{self.resource}/{transaction_id}", {"include": include})
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            included = response.json().get("included")
-            return UnitResponse[TransactionDTO](DtoDecoder.decode(data), DtoDecoder.decode(included))
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response, included=True)
+
+
+class AsyncTransactionResource(AsyncBaseResource):
+    list_params = ListTransactionParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("transactions", configuration)
+
+    async def get(self, transaction_id: str, include: Optional[str] = "") ->\
+            Union[UnitResponse[TransactionDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{transaction_id}", {"include": include})
+        return super().decode(response, included=True)
+
+    async def list(self, params: ListTransactionParams = None) -> Union[UnitResponse[List[TransactionDTO]], UnitError]:
+        params = params or ListTransactionParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response, included=True)
+
+    async def stream(self, params: ListTransactionParams = None) ->\
+            Union[AsyncUnitStreamResponse[TransactionDTO], UnitError]:
+        params = params or ListTransactionParams()
+        response = await super().get_stream(self.resource, params.to_dict())
+        return super().decode_stream(response, included=True)
+
+    def export(self, since: datetime, until: datetime, params: ListTransactionParams = None,
+               window: timedelta = timedelta(hours=1), window_size: int = 10000, workers: int = 4,
+               checkpoint: Optional[str] = None) -> ShardedExport:
+        return ShardedExport(self, since, until, params, window, window_size, workers, checkpoint)
+
+    async def update(self, request: PatchTransactionRequest) -> Union[UnitResponse[TransactionDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"accounts/{request.account_id}/{self.resource}/{request.transaction_id}", payload)
+        return super().decode(response, included=True)
+
+    async def get_by_id_and_account(self, transaction_id: str, account_id: str, include: Optional[str] = "") ->\
+            Union[UnitResponse[TransactionDTO], UnitError]:
+        response = await super().get(f"accounts/{account_id}/{self.resource}/{transaction_id}", {"include": include})
+        return super().decode(response, included=True)
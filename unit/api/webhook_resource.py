@@ -1,66 +1,87 @@
 from unit.utils.configuration import Configuration
 from unit.api.base_resource import BaseResource
+from unit.api.async_base_resource import AsyncBaseResource
 from unit.models.webhook import *
-from unit.models.codecs import DtoDecoder
 import hmac
 from hashlib import sha1
 import base64
 
 
 class WebhookResource(BaseResource):
+    list_params = ListWebhookParams
+
     def __init__(self, configuration: Configuration):
         super().__init__("webhooks", configuration)
 
     def create(self, request: CreateWebhookRequest) -> Union[UnitResponse[WebhookDTO], UnitError]:
         payload = request.to_json_api()
         response = super().post(self.resource, payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[WebhookDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def get(self, webhook_id: str) -> Union[UnitResponse[WebhookDTO], UnitError]:
         response = super().get(f"{self.resource}/{webhook_id}")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[WebhookDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def list(self, params: ListWebhookParams = None) -> Union[UnitResponse[List[WebhookDTO]], UnitError]:
         params = params or ListWebhookParams()
         response = super().get(self.resource, params.to_dict())
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[WebhookDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def update(self, request: PatchWebhookRequest) -> Union[UnitResponse[WebhookDTO], UnitError]:
         payload = request.to_json_api()
         response = super().patch(f"{self.resource}/{request.webhook_id}", payload)
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[WebhookDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def enable(self, webhook_id: str) -> Union[UnitResponse[WebhookDTO], UnitError]:
         response = super().post(f"{self.resource}/{webhook_id}/enable")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[WebhookDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
 
     def disable(self, webhook_id: str) -> Union[UnitResponse[WebhookDTO], UnitError]:
         response = super().post(f"{self.resource}/{webhook_id}/disable")
-        if super().is_20x(response.status_code):
-            data = response.json().get("data")
-            return UnitResponse[WebhookDTO](DtoDecoder.decode(data), None)
-        else:
-            return UnitError.from_json_api(response.json())
+        return super().decode(response)
+
+    def verify(self, signature: str, secret: str, payload):
+        mac = hmac.new(
+            secret.encode(),
+            msg=json.dumps(payload, separators=(',', ':'), ensure_ascii=False).encode('utf-8'),
+            digestmod=sha1,
+        )
+        res = base64.encodebytes(mac.digest()).decode().rstrip('\n')
+        return res == signature
+
+
+class AsyncWebhookResource(AsyncBaseResource):
+    list_params = ListWebhookParams
+
+    def __init__(self, configuration: Configuration):
+        super().__init__("webhooks", configuration)
+
+    async def create(self, request: CreateWebhookRequest) -> Union[UnitResponse[WebhookDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().post(self.resource, payload)
+        return super().decode(response)
+
+    async def get(self, webhook_id: str) -> Union[UnitResponse[WebhookDTO], UnitError]:
+        response = await super().get(f"{self.resource}/{webhook_id}")
+        return super().decode(response)
+
+    async def list(self, params: ListWebhookParams = None) -> Union[UnitResponse[List[WebhookDTO]], UnitError]:
+        params = params or ListWebhookParams()
+        response = await super().get(self.resource, params.to_dict())
+        return super().decode(response)
+
+    async def update(self, request: PatchWebhookRequest) -> Union[UnitResponse[WebhookDTO], UnitError]:
+        payload = request.to_json_api()
+        response = await super().patch(f"{self.resource}/{request.webhook_id}", payload)
+        return super().decode(response)
+
+    async def enable(self, webhook_id: str) -> Union[UnitResponse[WebhookDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{webhook_id}/enable")
+        return super().decode(response)
+
+    async def disable(self, webhook_id: str) -> Union[UnitResponse[WebhookDTO], UnitError]:
+        response = await super().post(f"{self.resource}/{webhook_id}/disable")
+        return super().decode(response)
 
     def verify(self, signature: str, secret: str, payload):
         mac = hmac.new(
@@ -1,9 +1,13 @@
+import inspect
 import json
+from functools import lru_cache
 
 try:
-    from typing import TypeVar, Generic, Union, Optional, Literal, List, Dict
+    from typing import TypeVar, Generic, Union, Optional, Literal, List, Dict, Sequence, Callable, Iterator, \
+        AsyncIterator, Awaitable
 except ImportError:
-    from typing import TypeVar, Generic, Union, Optional, List, Dict
+    from typing import TypeVar, Generic, Union, Optional, List, Dict, Sequence, Callable, Iterator, AsyncIterator, \
+        Awaitable
     from typing_extensions import Literal
 
 from datetime import datetime, date
@@ -26,6 +30,7 @@ EntityType = Literal["Corporation", "LLC", "Partnership"]
 UseSelfieVerification = Literal["Never", "ReplaceIdentification"]
 
 
+@lru_cache(maxsize=None)
 def to_camel_case(snake_str):
     components = snake_str.lstrip('_').split('_')
     # We capitalize the first letter of each component except the first one
@@ -42,7 +47,49 @@ def extract_attributes(list_of_attributes, attributes):
     return extracted_attributes
 
 
+decoders: Dict[str, Callable[[str, str, Dict, Optional[Dict]], object]] = {}
+decoder_classes: Dict[str, type] = {}
+decoder_arguments = {"_id": 0, "id": 0, "_type": 1, "type": 1, "attributes": 2, "relationships": 3}
+
+
+def make_decoder(target):
+    """
+    Returns a decoder(_id, _type, attributes, relationships) calling `target` (a DTO class or a function), whose
+    from_json_api may take any of those arguments, in that order.
+    """
+    decode = target.from_json_api if isinstance(target, type) else target
+    indexes = [decoder_arguments[name] for name in inspect.signature(decode).parameters]
+    if indexes == [0, 1, 2, 3]:
+        return decode
+
+    def adapter(*args):
+        return decode(*[args[i] for i in indexes])
+
+    return adapter
+
+
+def register_decoder(*types: str):
+    """
+    Decorator registering the DTO class (or decoding function) for the given JSON:API resource types, e.g.
+    @register_decoder("achPayment"). Registering a type again replaces its decoder.
+    """
+    def register(target):
+        decoder = make_decoder(target)
+        for _type in types:
+            decoders[_type] = decoder
+            if isinstance(target, type):
+                decoder_classes[_type] = target
+            else:
+                decoder_classes.pop(_type, None)
+
+        return target
+
+    return register
+
+
 class UnitDTO(object):
+    __slots__ = ()
+
     def to_dict(self):
         if type(self) is dict:
             return self
@@ -51,10 +98,42 @@ class UnitDTO(object):
             return dict((to_camel_case(k), val) for k, val in v.items() if val is not None)
 
 
+class CompactDTO(object):
+    """
+    Base of the high-volume DTOs (transactions, events, authorizations, account end of day balances), keeping their
+    id, type, attributes and relationships in slots instead of a per-instance __dict__. Subclasses declare
+    `__slots__ = ()` to stay compact.
+    """
+    __slots__ = ("id", "type", "attributes", "relationships")
+
+
 class Relationship(UnitDTO):
+    """
+    Immutable and hashable reference to a resource, so equal relationships can be shared (see DtoDecoder.decode).
+    """
+    __slots__ = ("type", "id")
+
     def __init__(self, _type: str, _id: str):
-        self.type = _type
-        self.id = _id
+        object.__setattr__(self, "type", _type)
+        object.__setattr__(self, "id", _id)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"Relationship is immutable, cannot set {name}")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"Relationship is immutable, cannot delete {name}")
+
+    def __eq__(self, other):
+        return self is other or (isinstance(other, Relationship) and self.type == other.type and self.id == other.id)
+
+    def __hash__(self):
+        return hash((self.type, self.id))
+
+    def __reduce__(self):
+        return Relationship, (self.type, self.id)
+
+    def __repr__(self):
+        return f"Relationship({self.type!r}, {self.id!r})"
 
     def to_dict(self, nested: Optional[bool] = True):
         if nested:
@@ -85,16 +164,107 @@ class RelationshipArray(Generic[T], UnitDTO):
 
 
 class UnitResponse(Generic[T]):
-    def __init__(self, data: Union[T, List[T]], included):
+    def __init__(self, data: Union[T, List[T]], included, meta: Optional[Dict] = None):
         self.data = data
         self.included = included
+        self.meta = meta
 
     @staticmethod
     def from_json_api(data: str):
         pass
 
 
+class UnitStreamResponse(UnitResponse[T]):
+    """
+    A list response whose `data` is an iterator of DTOs decoded while the response body is read. `included` and
+    `meta` are set as soon as the body was read past them, at the latest once `data` is exhausted. Close it (or use it
+    as a context manager) when not reading `data` to the end.
+    """
+    def __init__(self, data: Iterator[T], close: Callable[[], None]):
+        super().__init__(data, None)
+        self.__close = close
+
+    def close(self):
+        self.__close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+
+class AsyncUnitStreamResponse(UnitResponse[T]):
+    """
+    UnitStreamResponse of the async client: iterate `data` with `async for` and close it with `await aclose()`.
+    """
+    def __init__(self, data: AsyncIterator[T], aclose: Callable[[], Awaitable[None]]):
+        super().__init__(data, None)
+        self.__aclose = aclose
+
+    async def aclose(self):
+        await self.__aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        await self.aclose()
+
+
+class Payload(object):
+    """
+    Declares the JSON:API payload of a request class: `required` attributes are always sent, `optional` ones only
+    when set and `not_none` ones whenever they are not None. The resource type is `_type`, or the instance's `type`
+    attribute when omitted. A to_json_api method with the camelCase keys baked in is generated for every request class
+    declaring a `payload`.
+    """
+    def __init__(self, _type: Optional[str] = None, required: Sequence[str] = (), optional: Sequence[str] = (),
+                 not_none: Sequence[str] = (), relationships: bool = True):
+        self.type = _type
+        self.required = tuple(required)
+        self.optional = tuple(optional)
+        self.not_none = tuple(not_none)
+        self.relationships = relationships
+
+    def extend(self, _type: Optional[str] = None, required: Sequence[str] = (), optional: Sequence[str] = (),
+               not_none: Sequence[str] = ()) -> "Payload":
+        return Payload(_type or self.type, self.required + tuple(required), self.optional + tuple(optional),
+                       self.not_none + tuple(not_none), self.relationships)
+
+    def compile(self, name: str):
+        lines = ["def to_json_api(self):",
+                 "    attributes = {%s}" % ", ".join(f"{to_camel_case(a)!r}: self.{a}" for a in self.required)]
+
+        if self.optional or self.not_none:
+            # a request without any optional attribute set skips the per-attribute checks
+            conditions = [f"self.{a}" for a in self.optional] + [f"self.{a} is not None" for a in self.not_none]
+            lines.append(f"    if {' or '.join(conditions)}:")
+            for a in self.optional:
+                lines += [f"        if self.{a}:", f"            attributes[{to_camel_case(a)!r}] = self.{a}"]
+            for a in self.not_none:
+                lines += [f"        if self.{a} is not None:",
+                          f"            attributes[{to_camel_case(a)!r}] = self.{a}"]
+
+        _type = repr(self.type) if self.type else "self.type"
+        lines.append(f"    data = {{'type': {_type}, 'attributes': attributes}}")
+        if self.relationships:
+            lines += ["    if self.relationships is not None:", "        data['relationships'] = self.relationships"]
+        lines.append("    return {'data': data}")
+
+        namespace = {}
+        exec(compile("\n".join(lines), f"<{name}.to_json_api>", "exec"), namespace)
+        return namespace["to_json_api"]
+
+
 class UnitRequest(object):
+    payload: Optional[Payload] = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.__dict__.get("payload") is not None:
+            cls.to_json_api = cls.payload.compile(cls.__name__)
+
     def to_json_api(self) -> Dict:
         pass
 
@@ -326,6 +496,7 @@ class BeneficialOwner(UnitDTO):
             return BeneficialOwner.create(l)
 
 
+@register_decoder("beneficialOwner")
 class BeneficialOwnerDTO(UnitDTO):
     def __init__(self, _id: str, _type: str, attributes: BeneficialOwner, relationships: Dict[str, Relationship]):
         self.id = _id
@@ -11,7 +11,11 @@ DepositAccountType = "depositAccount"
 AccountTypes = Literal[CreditAccountType, DepositAccountType]
 
 
+@register_decoder("depositAccount")
 class DepositAccountDTO(object):
+    lazy_attributes = {"createdAt": date_utils.to_datetime, "updatedAt": date_utils.to_datetime}
+    optional_attributes = frozenset({"updatedAt", "tags", "closeReason"})
+
     def __init__(self, _id: str, created_at: datetime, updated_at: Optional[datetime], name: str, deposit_product: str,
                  routing_number: str, account_number: str, currency: str, balance: int, hold: int, available: int,
                  status: AccountStatus, tags: Optional[Dict[str, str]], close_reason: Optional[CloseReason],
@@ -35,7 +39,12 @@ class DepositAccountDTO(object):
         )
 
 
+@register_decoder("creditAccount")
 class CreditAccountDTO(object):
+    lazy_attributes = {"createdAt": date_utils.to_datetime, "updatedAt": date_utils.to_datetime}
+    optional_attributes = frozenset({"updatedAt", "tags", "freezeReason", "closeReason", "closeReasonText",
+                                     "fraudReason"})
+
     def __init__(self, _id: str, created_at: datetime, updated_at: Optional[datetime], name: str, credit_terms: str,
                  currency: str, credit_limit: int, balance: int, hold: int, available: int,
                  tags: Optional[Dict[str, str]], status: AccountStatus, freeze_reason: Optional[str],
@@ -312,6 +321,7 @@ class DepositAccountLimitsDTO(AccountLimitsDTO):
                                            attributes.get("checkDeposit")), _id, _type)
 
 
+@register_decoder("creditLimits")
 class CreditAccountLimitsDTO(AccountLimitsDTO):
     @staticmethod
     def from_json_api(_id, _type, attributes):
@@ -398,6 +408,7 @@ class AccountOwnersRequest(UnitRequest):
         return json.dumps(self.to_json_api())
 
 
+@register_decoder("accountDepositProduct")
 class AccountDepositProductDTO(object):
     def __init__(self, name: str):
         self.type = "accountDepositProduct"
@@ -3,7 +3,10 @@ from typing import Optional
 from unit.models import *
 
 
-class AccountEndOfDayDTO(object):
+@register_decoder("accountEndOfDay")
+class AccountEndOfDayDTO(CompactDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, date: str, balance: int, hold: int, available: int,
                  relationships: Optional[Dict[str, Relationship]]):
         self.id = id
@@ -2,6 +2,7 @@ from unit.models import *
 from unit.utils import date_utils
 
 
+@register_decoder("apiToken")
 class APITokenDTO(object):
     def __init__(self, id: str, created_at: datetime, description: str, expiration: datetime, token: Optional[str],
                  source_ip: Optional[str]):
@@ -51,6 +51,7 @@ class BaseApplication(UnitDTO):
         self.relationships = relationships
 
 
+@register_decoder("individualApplication")
 class IndividualApplicationDTO(BaseApplication):
     def __init__(self, id: str, created_at: datetime, full_name: FullName, address: Address, date_of_birth: date,
                  email: str, phone: Phone, status: ApplicationStatus, ssn: Optional[str], message: str,
@@ -82,6 +83,7 @@ class IndividualApplicationDTO(BaseApplication):
             date_utils.to_datetime(attributes.get("updatedAt")))
 
 
+@register_decoder("businessApplication")
 class BusinessApplicationDTO(BaseApplication):
     def __init__(self, id: str, created_at: datetime, name: str, address: Address, phone: Phone,
                  status: ApplicationStatus, state_of_incorporation: str, entity_type: EntityType,
@@ -109,6 +111,7 @@ class BusinessApplicationDTO(BaseApplication):
         )
 
 
+@register_decoder("trustApplication")
 class TrustApplicationDTO(BaseApplication):
     def __init__(self, id: str, created_at: datetime, name: str, message: Optional[str],
                  status: ApplicationStatus, state_of_incorporation: str, revocability: Revocability,
@@ -135,6 +138,12 @@ ApplicationDTO = Union[IndividualApplicationDTO, BusinessApplicationDTO, TrustAp
 
 
 class BaseCreateIndividualApplicationRequest(UnitRequest):
+    payload = Payload("individualApplication", optional=[
+        "full_name", "date_of_birth", "address", "email", "phone", "ip", "ein", "dba", "sole_proprietorship", "ssn",
+        "passport", "nationality", "device_fingerprints", "idempotency_key", "tags", "jwt_subject",
+        "power_of_attorney_agent", "evaluation_params", "occupation", "annual_income", "source_of_income"],
+        relationships=False)
+
     def __init__(self, full_name: FullName, date_of_birth: date, address: Address, email: str, phone: Phone,
                  ip: Optional[str] = None, ein: Optional[str] = None, dba: Optional[str] = None,
                  sole_proprietorship: Optional[bool] = None, passport: Optional[str] = None,
@@ -166,9 +175,6 @@ class BaseCreateIndividualApplicationRequest(UnitRequest):
         self.annual_income = annual_income
         self.source_of_income = source_of_income
 
-    def to_json_api(self) -> Dict:
-        return super().to_payload("individualApplication")
-
     def __repr__(self):
         return json.dumps(self.to_json_api())
 
@@ -178,6 +184,12 @@ class CreateIndividualApplicationRequest(BaseCreateIndividualApplicationRequest)
 
 
 class CreateBusinessApplicationRequest(UnitRequest):
+    payload = Payload("businessApplication", optional=[
+        "name", "address", "phone", "state_of_incorporation", "ein", "contact", "officer", "beneficial_owners",
+        "entity_type", "dba", "ip", "website", "industry", "annual_revenue", "number_of_employees", "cash_flow",
+        "year_of_incorporation", "countries_of_operation", "stock_symbol", "business_vertical",
+        "device_fingerprints"], relationships=False)
+
     def __init__(self, name: str, address: Address, phone: Phone, state_of_incorporation: str, ein: str,
                  contact: BusinessContact, officer: Officer, beneficial_owners: [BeneficialOwner],
                  entity_type: EntityType, dba: Optional[str] = None, ip: Optional[str] = None,
@@ -211,14 +223,15 @@ class CreateBusinessApplicationRequest(UnitRequest):
         self.business_vertical = business_vertical
         self.device_fingerprints = device_fingerprints
 
-    def to_json_api(self) -> Dict:
-        return super().to_payload("businessApplication")
-
     def __repr__(self):
         return json.dumps(self.to_json_api())
 
 
 class CreateTrustApplicationRequest(UnitRequest):
+    payload = Payload("trustApplication", optional=[
+        "name", "state_of_incorporation", "revocability", "source_of_funds", "tax_id", "grantor", "trustees",
+        "beneficiaries", "contact", "ip", "tags", "idempotency_key", "device_fingerprints"], relationships=False)
+
     def __init__(self, name: str, state_of_incorporation: str, revocability: Revocability,
                  source_of_funds: SourceOfFunds, tax_id: str, grantor: Grantor, trustees: List[Trustee],
                  beneficiaries: List[Beneficiary], contact: TrustContact, ip: Optional[str] = None,
@@ -237,14 +250,14 @@ class CreateTrustApplicationRequest(UnitRequest):
         self.idempotency_key = idempotency_key
         self.device_fingerprints = device_fingerprints
 
-    def to_json_api(self) -> Dict:
-        return super().to_payload("trustApplication")
-
     def __repr__(self):
         json.dumps(self.to_json_api())
 
 
 class CreateSoleProprietorApplicationRequest(BaseCreateIndividualApplicationRequest):
+    payload = BaseCreateIndividualApplicationRequest.payload.extend(
+        optional=["annual_revenue", "number_of_employees", "business_vertical"])
+
     def __init__(self, full_name: FullName, date_of_birth: date, address: Address, email: str, phone: Phone,
                  ip: Optional[str] = None, ein: Optional[str] = None, dba: Optional[str] = None,
                  sole_proprietorship: Optional[bool] = None, passport: Optional[str] = None,
@@ -268,6 +281,7 @@ CreateApplicationRequest = Union[CreateIndividualApplicationRequest, CreateBusin
                                  CreateTrustApplicationRequest, CreateSoleProprietorApplicationRequest]
 
 
+@register_decoder("document")
 class ApplicationDocumentDTO(object):
     def __init__(self, id: str, status: ApplicationStatus, document_type: DocumentType, description: str,
                  name: Optional[str], address: Optional[Address], date_of_birth: Optional[date],
@@ -34,6 +34,7 @@ class ApplicationFormPrefill(UnitDTO):
         self.phone = phone
 
 
+@register_decoder("applicationForm")
 class ApplicationFormDTO(UnitDTO):
     def __init__(self, id: str, url: str, stage: ApplicationFormStage, applicant_details: ApplicationFormPrefill,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
@@ -2,6 +2,7 @@ import json
 from unit.models import *
 
 
+@register_decoder("atmLocation")
 class AtmLocationDTO(object):
     def __init__(self, network: int, location_name: str, coordinates: Coordinates, address: Address, distance: float,
                  surcharge_free: bool, accept_deposits: bool):
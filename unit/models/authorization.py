@@ -6,7 +6,10 @@ from unit.utils import date_utils
 AuthorizationStatus = Literal["Authorized", "Completed", "Canceled", "Declined"]
 
 
-class AuthorizationDTO(object):
+@register_decoder("authorization")
+class AuthorizationDTO(CompactDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, amount: int, card_last_4_digits: str, status: AuthorizationStatus,
                  merchant_name: str,
                  merchant_type: int, merchant_category: str, merchant_location: Optional[str], recurring: bool,
@@ -12,6 +12,7 @@ DeclineReason = Literal["AccountClosed", "CardExceedsAmountLimit", "DoNotHonor",
                         "ReferToCardIssuer", "RestrictedCard", "Timeout", "TransactionNotPermittedToCardholder"]
 
 
+@register_decoder("purchaseAuthorizationRequest")
 class PurchaseAuthorizationRequestDTO(object):
     def __init__(self, id: str, created_at: datetime, amount: int, status: PurchaseAuthorizationRequestStatus,
                  partial_approval_allowed: str, approved_amount: Optional[int], decline_reason: Optional[DeclineReason],
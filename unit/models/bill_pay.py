@@ -3,6 +3,7 @@ from typing import Optional
 from unit.models import *
 
 
+@register_decoder("biller")
 class BillerDTO(object):
     def __init__(self, id: str, name: int, category: str):
         self.id = id
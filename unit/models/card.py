@@ -4,6 +4,7 @@ from unit.models import *
 CardStatus = Literal["Inactive", "Active", "Stolen", "Lost", "Frozen", "ClosedByCustomer", "SuspectedFraud"]
 
 
+@register_decoder("individualDebitCard")
 class IndividualDebitCardDTO(object):
     def __init__(self, id: str, created_at: datetime, last_4_digits: str, expiration_date: str, status: CardStatus,
                  shipping_address: Optional[Address], design: Optional[str],
@@ -51,6 +52,7 @@ class BusinessCardDTO(object):
         )
 
 
+@register_decoder("businessDebitCard")
 class BusinessDebitCardDTO(BusinessCardDTO):
     def __init__(self, card: BusinessCardDTO):
         self.id = card.id
@@ -63,6 +65,7 @@ class BusinessDebitCardDTO(BusinessCardDTO):
         return BusinessDebitCardDTO(BusinessCardDTO.from_json_api(_id, _type, attributes, relationships))
 
 
+@register_decoder("businessCreditCard")
 class BusinessCreditCardDTO(BusinessCardDTO):
     def __init__(self, card: BusinessCardDTO):
         self.id = card.id
@@ -75,6 +78,7 @@ class BusinessCreditCardDTO(BusinessCardDTO):
         return BusinessCreditCardDTO(BusinessCardDTO.from_json_api(_id, _type, attributes, relationships))
 
 
+@register_decoder("individualVirtualDebitCard")
 class IndividualVirtualDebitCardDTO(object):
     def __init__(self, _id: str, created_at: datetime, last_4_digits: str, expiration_date: str, status: CardStatus,
                  relationships: Optional[Dict[str, Relationship]], tags: Optional[Dict[str, str]]):
@@ -115,6 +119,7 @@ class BusinessVirtualCardDTO(object):
             attributes.get("passport"), attributes.get("nationality"), relationships, attributes.get("tags"))
 
 
+@register_decoder("businessVirtualDebitCard")
 class BusinessVirtualDebitCardDTO(BusinessVirtualCardDTO):
     def __init__(self, card: BusinessVirtualCardDTO):
         self.id = card.id
@@ -127,6 +132,7 @@ class BusinessVirtualDebitCardDTO(BusinessVirtualCardDTO):
         return BusinessVirtualDebitCardDTO(BusinessVirtualCardDTO.from_json_api(_id, _type, attributes, relationships))
 
 
+@register_decoder("businessVirtualCreditCard")
 class BusinessVirtualCreditCardDTO(BusinessVirtualCardDTO):
     def __init__(self, card: BusinessVirtualCardDTO):
         self.id = card.id
@@ -143,7 +149,9 @@ Card = Union[IndividualDebitCardDTO, BusinessDebitCardDTO, IndividualVirtualDebi
              BusinessVirtualCreditCardDTO, BusinessCreditCardDTO]
 
 
-class CreateIndividualDebitCard(object):
+class CreateIndividualDebitCard(UnitRequest):
+    payload = Payload("individualDebitCard", optional=["shipping_address", "design", "idempotency_key", "tags"])
+
     def __init__(self, relationships: Dict[str, Relationship], shipping_address: Optional[Address] = None,
                  design: Optional[str] = None, idempotency_key: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None):
@@ -153,34 +161,13 @@ class CreateIndividualDebitCard(object):
         self.tags = tags
         self.relationships = relationships
 
-    def to_json_api(self) -> Dict:
-        payload = {
-            "data": {
-                "type": "individualDebitCard",
-                "attributes": {},
-                "relationships": self.relationships
-            }
-        }
-
-        if self.shipping_address:
-            payload["data"]["attributes"]["shippingAddress"] = self.shipping_address
-
-        if self.design:
-            payload["data"]["attributes"]["design"] = self.design
-
-        if self.idempotency_key:
-            payload["data"]["attributes"]["idempotencyKey"] = self.idempotency_key
 
-        if self.tags:
-            payload["data"]["attributes"]["tags"] = self.tags
+class CreateBusinessCard(UnitRequest):
+    payload = Payload(required=["full_name", "date_of_birth", "address", "phone", "email"],
+                      optional=["shipping_address", "ssn", "passport", "nationality", "design", "idempotency_key",
+                                "tags", "limits", "additional_embossed_text"],
+                      not_none=["print_only_business_name"])
 
-        return payload
-
-    def __repr__(self):
-        return json.dumps(self.to_json_api())
-
-
-class CreateBusinessCard(object):
     def __init__(self, full_name: FullName, date_of_birth: date, address: Address, phone: Phone, email: str,
                  relationships: Dict[str, Relationship], shipping_address: Optional[Address] = None,
                  ssn: Optional[str] = None, passport: Optional[str] = None, nationality: Optional[str] = None,
@@ -204,96 +191,29 @@ class CreateBusinessCard(object):
         self.additional_embossed_text = additional_embossed_text
         self.print_only_business_name = print_only_business_name
 
-    def to_json_api(self, _type: str) -> Dict:
-        payload = {
-            "data": {
-                "type": _type,
-                "attributes": {
-                    "fullName": self.full_name,
-                    "dateOfBirth": self.date_of_birth,
-                    "address": self.address,
-                    "phone": self.phone,
-                    "email": self.email,
-                },
-                "relationships": self.relationships
-            }
-        }
-
-        if self.shipping_address:
-            payload["data"]["attributes"]["shippingAddress"] = self.shipping_address
-
-        if self.ssn:
-            payload["data"]["attributes"]["ssn"] = self.ssn
-
-        if self.passport:
-            payload["data"]["attributes"]["passport"] = self.passport
-
-        if self.nationality:
-            payload["data"]["attributes"]["nationality"] = self.nationality
-
-        if self.design:
-            payload["data"]["attributes"]["design"] = self.design
-
-        if self.idempotency_key:
-            payload["data"]["attributes"]["idempotencyKey"] = self.idempotency_key
-
-        if self.tags:
-            payload["data"]["attributes"]["tags"] = self.tags
-
-        if self.limits:
-            payload["data"]["attributes"]["limits"] = self.limits
-
-        if self.additional_embossed_text:
-            payload["data"]["attributes"]["additionalEmbossedText"] = self.additional_embossed_text
-
-        if self.print_only_business_name is not None:
-            payload["data"]["attributes"]["printOnlyBusinessName"] = self.print_only_business_name
-
-        return payload
-
-    def __repr__(self):
-        return json.dumps(self.to_json_api())
-
 
 class CreateBusinessDebitCard(CreateBusinessCard):
-    def to_json_api(self):
-        return super().to_json_api("businessDebitCard")
+    payload = CreateBusinessCard.payload.extend("businessDebitCard")
 
 
 class CreateBusinessCreditCard(CreateBusinessCard):
-    def to_json_api(self):
-        return super().to_json_api("businessCreditCard")
+    payload = CreateBusinessCard.payload.extend("businessCreditCard")
 
 
-class CreateIndividualVirtualDebitCard(object):
+class CreateIndividualVirtualDebitCard(UnitRequest):
+    payload = Payload("individualVirtualDebitCard", optional=["idempotency_key", "tags"])
+
     def __init__(self, relationships: Dict[str, Relationship], idempotency_key: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None):
         self.idempotency_key = idempotency_key
         self.tags = tags
         self.relationships = relationships
 
-    def to_json_api(self) -> Dict:
-        payload = {
-            "data": {
-                "type": "individualVirtualDebitCard",
-                "attributes": {},
-                "relationships": self.relationships
-            }
-        }
-
-        if self.idempotency_key:
-            payload["data"]["attributes"]["idempotencyKey"] = self.idempotency_key
-
-        if self.tags:
-            payload["data"]["attributes"]["tags"] = self.tags
-
-        return payload
-
-    def __repr__(self):
-        return json.dumps(self.to_json_api())
 
+class CreateBusinessVirtualCard(UnitRequest):
+    payload = Payload(required=["full_name", "date_of_birth", "address", "phone", "email"],
+                      optional=["ssn", "passport", "nationality", "idempotency_key", "tags", "limits"])
 
-class CreateBusinessVirtualCard(object):
     def __init__(self, full_name: FullName, date_of_birth: date, address: Address, phone: Phone, email: str,
                  relationships: Dict[str, Relationship], ssn: Optional[str] = None, passport: Optional[str] = None,
                  nationality: Optional[str] = None, idempotency_key: Optional[str] = None,
@@ -311,53 +231,13 @@ class CreateBusinessVirtualCard(object):
         self.relationships = relationships
         self.limits = limits
 
-    def to_json_api(self, _type: str) -> Dict:
-        payload = {
-            "data": {
-                "type": _type,
-                "attributes": {
-                    "fullName": self.full_name,
-                    "dateOfBirth": self.date_of_birth,
-                    "address": self.address,
-                    "phone": self.phone,
-                    "email": self.email,
-                },
-                "relationships": self.relationships
-            }
-        }
-
-        if self.ssn:
-            payload["data"]["attributes"]["ssn"] = self.ssn
-
-        if self.passport:
-            payload["data"]["attributes"]["passport"] = self.passport
-
-        if self.nationality:
-            payload["data"]["attributes"]["nationality"] = self.nationality
-
-        if self.idempotency_key:
-            payload["data"]["attributes"]["idempotencyKey"] = self.idempotency_key
-
-        if self.tags:
-            payload["data"]["attributes"]["tags"] = self.tags
-
-        if self.limits:
-            payload["data"]["attributes"]["limits"] = self.limits
-
-        return payload
-
-    def __repr__(self):
-        return json.dumps(self.to_json_api())
-
 
 class CreateBusinessVirtualDebitCard(CreateBusinessVirtualCard):
-    def to_json_api(self):
-        return super().to_json_api("businessVirtualDebitCard")
+    payload = CreateBusinessVirtualCard.payload.extend("businessVirtualDebitCard")
 
 
 class CreateBusinessVirtualCreditCard(CreateBusinessVirtualCard):
-    def to_json_api(self):
-        return super().to_json_api("businessVirtualCreditCard")
+    payload = CreateBusinessVirtualCard.payload.extend("businessVirtualCreditCard")
 
 
 CreateCardRequest = Union[CreateIndividualDebitCard, CreateBusinessDebitCard, CreateIndividualVirtualDebitCard,
@@ -548,6 +428,7 @@ class ReplaceCardRequest(object):
 PinStatus = Literal["Set", "NotSet"]
 
 
+@register_decoder("pinStatus")
 class PinStatusDTO(object):
     def __init__(self, status: PinStatus):
         self.type = "pinStatus"
@@ -622,6 +503,7 @@ class GetMobileWalletPayloadRequest(UnitRequest):
         return json.dumps(self.to_json_api())
 
 
+@register_decoder("mobileWalletPayload")
 class MobileWalletPayloadDTO(object):
     def __init__(self, payload: str):
         self.type = "mobileWalletPayload"
@@ -657,6 +539,7 @@ class EnableCardToCardPaymentsRequest(UnitRequest):
         return json.dumps(self.to_json_api())
 
 
+@register_decoder("astra")
 class CardToCardPaymentDTO(object):
     def __init__(self, _type: str, _id: str, astra_card_id: str):
         self._type = _type
@@ -10,6 +10,7 @@ from unit.models import *
 CheckDepositStatus = Literal["AwaitingImages", "AwaitingFrontImage", "AwaitingBackImage", "Pending", "PendingReview",
                              "Rejected", "Clearing", "Sent", "Canceled", "Returned"]
 
+@register_decoder("checkDeposit")
 class CheckDepositDTO(object):
     def __init__(self, id: str, created_at: datetime, status: str, description: str, amount: str, reason: Optional[str],
                  check_number: Optional[str], counterparty: Optional[CheckCounterparty], settlement_date: Optional[date],
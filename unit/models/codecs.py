@@ -1,3 +1,8 @@
+import sys
+from typing import Callable, FrozenSet, Optional, Tuple
+
+from unit.utils import json_backend
+# importing the model modules registers the decoders of their DTOs
 from unit.models.applicationForm import ApplicationFormDTO
 from unit.models.application import IndividualApplicationDTO, BusinessApplicationDTO, ApplicationDocumentDTO,\
     TrustApplicationDTO
@@ -28,297 +33,346 @@ from unit.models.account_end_of_day import AccountEndOfDayDTO
 from unit.models.check_deposit import CheckDepositDTO
 from unit.models.dispute import DisputeDTO
 
-mappings = {
-        "individualApplication": lambda _id, _type, attributes, relationships:
-        IndividualApplicationDTO.from_json_api(_id, _type, attributes, relationships),
+# every DTO registers its JSON:API types with @register_decoder; kept under its historical name
+mappings = decoders
 
-        "businessApplication": lambda _id, _type, attributes, relationships:
-        BusinessApplicationDTO.from_json_api(_id, _type, attributes, relationships),
 
-        "trustApplication": lambda _id, _type, attributes, relationships:
-        TrustApplicationDTO.from_json_api(_id, _type, attributes, relationships),
+# enum-like attribute values repeated by every resource of a page
+interned_attributes = ("status", "direction")
 
-        "document": lambda _id, _type, attributes, relationships:
-        ApplicationDocumentDTO.from_json_api(_id, _type, attributes),
 
-        "individualCustomer": lambda _id, _type, attributes, relationships:
-        IndividualCustomerDTO.from_json_api(_id, _type, attributes, relationships),
+def intern_relationship(data: Dict, interned: Dict[Tuple[str, str], Relationship]) -> Relationship:
+    key = (data["type"], data["id"])
+    relationship = interned.get(key)
+    if relationship is None:
+        relationship = interned[key] = Relationship(sys.intern(key[0]), key[1])
 
-        "businessCustomer": lambda _id, _type, attributes, relationships:
-        BusinessCustomerDTO.from_json_api(_id, _type, attributes, relationships),
+    return relationship
 
-        "depositAccount": lambda _id, _type, attributes, relationships:
-        DepositAccountDTO.from_json_api(_id, _type, attributes, relationships),
 
-        "creditAccount": lambda _id, _type, attributes, relationships:
-        CreditAccountDTO.from_json_api(_id, _type, attributes, relationships),
+def decode_relationships(payload: Optional[Dict], interned: Optional[Dict[Tuple[str, str], Relationship]] = None):
+    if not payload:
+        return None
 
-        "limits": lambda _id, _type, attributes, relationships:
-        decode_limits(_id, _type, attributes),
+    if interned is None:
+        interned = {}
 
-        "creditLimits": lambda _id, _type, attributes, relationships:
-        CreditAccountLimitsDTO.from_json_api(_id, _type, attributes),
+    relationships = dict()
+    for k, v in payload.items():
+        if isinstance(v["data"], list):
+            relationships[k] = RelationshipArray([intern_relationship(r, interned) for r in v["data"]])
+        else:
+            relationships[k] = intern_relationship(v["data"], interned)
 
-        "individualDebitCard": lambda _id, _type, attributes, relationships:
-        IndividualDebitCardDTO.from_json_api(_id, _type, attributes, relationships),
+    return relationships
 
-        "businessDebitCard": lambda _id, _type, attributes, relationships:
-        BusinessDebitCardDTO.from_json_api(_id, _type, attributes, relationships),
 
-        "businessCreditCard": lambda _id, _type, attributes, relationships:
-        BusinessCreditCardDTO.from_json_api(_id, _type, attributes, relationships),
+def intern_strings(payload: Dict) -> str:
+    """
+    Interns the type and enum-like attribute values of a resource and returns its type. The payload is updated in
+    place: its values are replaced by equal, interned strings, so decoding a payload the caller keeps using changes
+    only the identity of those strings.
+    """
+    _type = payload["type"] = sys.intern(payload["type"])
+    attributes = payload.get("attributes")
+    if attributes:
+        for name in interned_attributes:
+            value = attributes.get(name)
+            if value.__class__ is str:
+                attributes[name] = sys.intern(value)
 
-        "individualVirtualDebitCard": lambda _id, _type, attributes, relationships:
-        IndividualVirtualDebitCardDTO.from_json_api(_id, _type, attributes, relationships),
+    return _type
 
-        "businessVirtualDebitCard": lambda _id, _type, attributes, relationships:
-        BusinessVirtualDebitCardDTO.from_json_api(_id, _type, attributes, relationships),
 
-        "businessVirtualCreditCard": lambda _id, _type, attributes, relationships:
-        BusinessVirtualCreditCardDTO.from_json_api(_id, _type, attributes, relationships),
+def split_json_api_single_response(payload: Dict, interned: Optional[Dict[Tuple[str, str], Relationship]] = None):
+    _id, _type, attributes = payload.get("id"), intern_strings(payload), payload["attributes"]
+    return _id, _type, attributes, decode_relationships(payload.get("relationships"), interned)
 
-        "achPayment": lambda _id, _type, attributes, relationships:
-        AchPaymentDTO.from_json_api(_id, _type, attributes, relationships),
 
-        "bookPayment": lambda _id, _type, attributes, relationships:
-        BookPaymentDTO.from_json_api(_id, _type, attributes, relationships),
+def split_json_api_array_response(payload, interned: Optional[Dict[Tuple[str, str], Relationship]] = None):
+    if not isinstance(payload, list):
+        raise Exception("split_json_api_array_response - couldn't parse response.")
 
-        "wirePayment": lambda _id, _type, attributes, relationships:
-        WirePaymentDTO.from_json_api(_id, _type, attributes, relationships),
+    if interned is None:
+        interned = {}
 
-        "billPayment": lambda _id, _type, attributes, relationships:
-        BillPaymentDTO.from_json_api(_id, _type, attributes, relationships),
+    dtos = []
+    for single_obj in payload:
+        dtos.append(split_json_api_single_response(single_obj, interned))
 
-        "achReceivedPayment": lambda _id, _type, attributes, relationships:
-        AchReceivedPaymentDTO.from_json_api(_id, _type, attributes, relationships),
+    return dtos
 
-        "recurringCreditAchPayment": lambda _id, _type, attributes, relationships:
-        RecurringCreditAchPaymentDTO.from_json_api(_id, _type, attributes, relationships),
 
-        "recurringCreditBookPayment": lambda _id, _type, attributes, relationships:
-        RecurringCreditBookPaymentDTO.from_json_api(_id, _type, attributes, relationships),
+@register_decoder("limits")
+def decode_limits(_id: str, _type: str, attributes: Dict):
+    if "ach" in attributes.keys():
+        return DepositAccountLimitsDTO.from_json_api(_id, _type, attributes)
+    else:
+        return CardLimitsDTO.from_json_api(attributes)
 
-        "recurringDebitAchPayment": lambda _id, _type, attributes, relationships:
-        RecurringDebitAchPaymentDTO.from_json_api(_id, _type, attributes, relationships),
 
-        "accountStatementDTO": lambda _id, _type, attributes, relationships:
-        StatementDTO.from_json_api(_id, _type, attributes, relationships),
+def mapping_wrapper(_id, _type, attributes, relationships):
+    decoder = decoders.get(_type)
+    if decoder is None:
+        return RawUnitObject(_id, _type, attributes, relationships)
 
-        "sandboxAccountStatement": lambda _id, _type, attributes, relationships:
-        StatementDTO.from_json_api(_id, _type, attributes, relationships),
+    return decoder(_id, _type, attributes, relationships)
 
-        "customerBearerToken": lambda _id, _type, attributes, relationships:
-        CustomerTokenDTO.from_json_api(_id, _type, attributes, relationships),
 
-        "customerTokenVerification": lambda _id, _type, attributes, relationships:
-        CustomerVerificationTokenDTO.from_json_api(_id, _type, attributes, relationships),
+class LazyAttributes(dict):
+    """
+    The attributes of a lazily decoded resource, as parsed from the response. Values having a converter in the DTO's
+    `lazy_attributes` (datetimes, nested objects) are converted on first access. As with eager decoding, the DTO's
+    `optional_attributes` read as None when the response leaves them out, and other missing attributes raise KeyError.
+    """
+    __slots__ = ("pending", "optional")
 
-        "achCounterparty": lambda _id, _type, attributes, relationships:
-        CounterpartyDTO.from_json_api(_id, _type, attributes, relationships),
+    def __init__(self, attributes: Dict, converters: Dict[str, Callable[[object], object]],
+                 optional: FrozenSet[str] = frozenset()):
+        super().__init__(attributes)
+        self.pending = dict(converters)
+        self.optional = optional
 
-        "applicationForm": lambda _id, _type, attributes, relationships:
-        ApplicationFormDTO.from_json_api(_id, _type, attributes, relationships),
+    def __getitem__(self, key):
+        converter = self.pending.pop(key, None) if self.pending else None
+        if converter is None or not dict.__contains__(self, key):
+            return dict.__getitem__(self, key)
 
-        "fee": lambda _id, _type, attributes, relationships:
-        FeeDTO.from_json_api(_id, _type, attributes, relationships),
+        value = dict.__getitem__(self, key)
+        if value is not None:
+            value = converter(value)
+            dict.__setitem__(self, key, value)
 
-        "account.closed": lambda _id, _type, attributes, relationships:
-        AccountClosedEvent.from_json_api(_id, _type, attributes, relationships),
+        return value
 
-        "account.frozen": lambda _id, _type, attributes, relationships:
-        AccountFrozenEvent.from_json_api(_id, _type, attributes, relationships),
+    def __missing__(self, key):
+        if key in self.optional:
+            return None
 
-        "application.awaitingDocuments": lambda _id, _type, attributes, relationships:
-        ApplicationAwaitingDocumentsEvent.from_json_api(_id, _type, attributes, relationships),
+        raise KeyError(key)
 
-        "application.denied": lambda _id, _type, attributes, relationships:
-        ApplicationDeniedEvent.from_json_api(_id, _type, attributes, relationships),
+    def __setitem__(self, key, value):
+        self.pending.pop(key, None)
+        dict.__setitem__(self, key, value)
 
-        "application.pendingReview": lambda _id, _type, attributes, relationships:
-        ApplicationPendingReviewEvent.from_json_api(_id, _type, attributes, relationships),
+    def get(self, key, default=None):
+        return self[key] if key in self else default
 
-        "card.activated": lambda _id, _type, attributes, relationships:
-        CardActivatedEvent.from_json_api(_id, _type, attributes, relationships),
+    def materialize(self) -> "LazyAttributes":
+        for key in list(self.pending):
+            self[key]
 
-        "card.statusChanged": lambda _id, _type, attributes, relationships:
-        CardStatusChangedEvent.from_json_api(_id, _type, attributes, relationships),
+        return self
 
-        "authorization.created": lambda _id, _type, attributes, relationships:
-        AuthorizationCreatedEvent.from_json_api(_id, _type, attributes, relationships),
+    def items(self):
+        return dict.items(self.materialize())
 
-        "authorizationRequest.declined": lambda _id, _type, attributes, relationships:
-        AuthorizationRequestDeclinedEvent.from_json_api(_id, _type, attributes, relationships),
+    def values(self):
+        return dict.values(self.materialize())
 
-        "authorizationRequest.pending": lambda _id, _type, attributes, relationships:
-        AuthorizationRequestPendingEvent.from_json_api(_id, _type, attributes, relationships),
+    def copy(self):
+        return dict(self.materialize())
 
-        "authorizationRequest.approved": lambda _id, _type, attributes, relationships:
-        AuthorizationRequestApprovedEvent.from_json_api(_id, _type, attributes, relationships),
+    def pop(self, key, *default):
+        self.materialize()
+        return dict.pop(self, key, *default)
 
-        "document.approved": lambda _id, _type, attributes, relationships:
-        DocumentApprovedEvent.from_json_api(_id, _type, attributes, relationships),
+    def popitem(self):
+        return dict.popitem(self.materialize())
 
-        "document.rejected": lambda _id, _type, attributes, relationships:
-        DocumentRejectedEvent.from_json_api(_id, _type, attributes, relationships),
+    def setdefault(self, key, default=None):
+        return dict.setdefault(self.materialize(), key, default)
 
-        "document.approved": lambda _id, _type, attributes, relationships:
-        DocumentApprovedEvent.from_json_api(_id, _type, attributes, relationships),
+    def update(self, *args, **kwargs):
+        dict.update(self.materialize(), *args, **kwargs)
 
-        "checkDeposit.created": lambda _id, _type, attributes, relationships:
-        CheckDepositCreatedEvent.from_json_api(_id, _type, attributes, relationships),
+    def __eq__(self, other):
+        return dict.__eq__(self.materialize(), other)
 
-        "checkDeposit.clearing": lambda _id, _type, attributes, relationships:
-        CheckDepositClearingEvent.from_json_api(_id, _type, attributes, relationships),
+    def __ne__(self, other):
+        return not self == other
 
-        "checkDeposit.sent": lambda _id, _type, attributes, relationships:
-        CheckDepositSentEvent.from_json_api(_id, _type, attributes, relationships),
+    def __repr__(self):
+        return dict.__repr__(self.materialize())
 
-        "payment.clearing": lambda _id, _type, attributes, relationships:
-        PaymentClearingEvent.from_json_api(_id, _type, attributes, relationships),
 
-        "payment.sent": lambda _id, _type, attributes, relationships:
-        PaymentSentEvent.from_json_api(_id, _type, attributes, relationships),
+NOT_DECODED = object()
 
-        "payment.returned": lambda _id, _type, attributes, relationships:
-        PaymentReturnedEvent.from_json_api(_id, _type, attributes, relationships),
 
-        "statements.created": lambda _id, _type, attributes, relationships:
-        StatementsCreatedEvent.from_json_api(_id, _type, attributes, relationships),
+class LazyDTO(object):
+    """
+    Stands in for the DTO of a resource until it is needed: `id` and `type` are read as is, `relationships` are decoded
+    on first access and so are the `attributes` of DTOs declaring `lazy_attributes`, one value at a time. Anything
+    else decodes the DTO and is read from it.
+    """
+    __slots__ = ("id", "type", "__attributes", "__relationships", "__interned", "__decoded_relationships",
+                 "__lazy_attributes", "__dto")
 
-        "transaction.created": lambda _id, _type, attributes, relationships:
-        TransactionCreatedEvent.from_json_api(_id, _type, attributes, relationships),
+    def __init__(self, _id: Optional[str], _type: str, attributes: Dict, relationships: Optional[Dict],
+                 interned: Optional[Dict[Tuple[str, str], Relationship]] = None):
+        self.id = _id
+        self.type = _type
+        self.__attributes = attributes
+        self.__relationships = relationships
+        self.__interned = interned
+        self.__decoded_relationships = NOT_DECODED
+        self.__lazy_attributes = None
+        self.__dto = None
 
-        "customer.created": lambda _id, _type, attributes, relationships:
-        CustomerCreatedEvent.from_json_api(_id, _type, attributes, relationships),
+    @property
+    def __class__(self):
+        return decoder_classes.get(self.type) or type(self.materialize())
 
-        "account.reopened": lambda _id, _type, attributes, relationships:
-        AccountReopenedEvent.from_json_api(_id, _type, attributes, relationships),
+    @property
+    def attributes(self):
+        if self.__lazy_attributes is not None:
+            return self.__lazy_attributes
 
-        "webhook": lambda _id, _type, attributes, relationships:
-        WebhookDTO.from_json_api(_id, _type, attributes, relationships),
+        cls = decoder_classes.get(self.type)
+        converters = getattr(cls, "lazy_attributes", None)
+        if converters is None or self.__dto is not None:
+            return self.materialize().attributes
 
-        "institution": lambda _id, _type, attributes, relationships:
-        InstitutionDTO.from_json_api(_id, _type, attributes, relationships),
+        optional = getattr(cls, "optional_attributes", frozenset())
+        self.__lazy_attributes = LazyAttributes(self.__attributes, converters, optional)
+        return self.__lazy_attributes
 
-        "atmLocation": lambda _id, _type, attributes, relationships:
-        AtmLocationDTO.from_json_api(_type, attributes),
+    @property
+    def relationships(self):
+        if self.__decoded_relationships is NOT_DECODED:
+            self.__decoded_relationships = decode_relationships(self.__relationships, self.__interned)
 
-        "biller": lambda _id, _type, attributes, relationships:
-        BillerDTO.from_json_api(_id, _type, attributes, relationships),
+        return self.__decoded_relationships
 
-        "apiToken": lambda _id, _type, attributes, relationships:
-        APITokenDTO.from_json_api(_id, _type, attributes, relationships),
+    def materialize(self):
+        """
+        Decodes the DTO this object stands in for.
+        """
+        if self.__dto is None:
+            self.__dto = mapping_wrapper(self.id, self.type, self.__attributes, self.relationships)
 
-        "authorization": lambda _id, _type, attributes, relationships:
-        AuthorizationDTO.from_json_api(_id, _type, attributes, relationships),
+        return self.__dto
 
-        "purchaseAuthorizationRequest": lambda _id, _type, attributes, relationships:
-        PurchaseAuthorizationRequestDTO.from_json_api(_id, _type, attributes, relationships),
+    def __getattr__(self, name):
+        if name.startswith("_LazyDTO__"):
+            raise AttributeError(name)
 
-        "accountEndOfDay": lambda _id, _type, attributes, relationships:
-        AccountEndOfDayDTO.from_json_api(_id, _type, attributes, relationships),
+        return getattr(self.materialize(), name)
 
-        "counterpartyBalance": lambda _id, _type, attributes, relationships:
-        CounterpartyBalanceDTO.from_json_api(_id, _type, attributes, relationships),
+    def __repr__(self):
+        return f"LazyDTO(type={self.type!r}, id={self.id!r})"
 
-        "pinStatus": lambda _id, _type, attributes, relationships:
-        PinStatusDTO.from_json_api(attributes),
 
-        "accountDepositProduct": lambda _id, _type, attributes, relationships:
-        AccountDepositProductDTO.from_json_api(attributes),
+class DtoDecoder(object):
+    @staticmethod
+    def decode(payload, lazy: bool = False, interned: Optional[Dict[Tuple[str, str], Relationship]] = None):
+        """
+        Decodes a JSON:API resource (or a list of them) into DTOs, or into LazyDTOs when `lazy`.
+        Equal relationships within the payload, or across the calls sharing an `interned` dict, are decoded to the
+        same Relationship object.
+        """
+        if payload is None:
+            return None
 
-        "checkDeposit": lambda _id, _type, attributes, relationships:
-        CheckDepositDTO.from_json_api(_id, _type, attributes, relationships),
+        if interned is None:
+            interned = {}
 
-        "dispute": lambda _id, _type, attributes, relationships:
-        DisputeDTO.from_json_api(_id, _type, attributes, relationships),
+        if lazy:
+            if isinstance(payload, list):
+                return [LazyDTO(p.get("id"), intern_strings(p), p["attributes"], p.get("relationships"), interned)
+                        for p in payload]
 
-        "mobileWalletPayload": lambda _id, _type, attributes, relationships:
-        MobileWalletPayloadDTO.from_json_api(_id, _type, attributes, relationships),
+            return LazyDTO(payload.get("id"), intern_strings(payload), payload["attributes"],
+                           payload.get("relationships"), interned)
 
-        "bookRepayment": lambda _id, _type, attributes, relationships:
-        BookRepaymentDTO.from_json_api(_id, _type, attributes, relationships),
+        # if response contains a list of dtos
+        if isinstance(payload, list):
+            dtos = split_json_api_array_response(payload, interned)
+            response = []
+            for _id, _type, attributes, relationships in dtos:
+                response.append(mapping_wrapper(_id, _type, attributes, relationships))
 
-        "achRepayment": lambda _id, _type, attributes, relationships:
-        AchRepaymentDTO.from_json_api(_id, _type, attributes, relationships),
+            return response
+        else:
+            _id, _type, attributes, relationships = split_json_api_single_response(payload, interned)
+            return mapping_wrapper(_id, _type, attributes, relationships)
 
-        "astra": lambda _id, _type, attributes, relationships:
-        CardToCardPaymentDTO.from_json_api(_id, _type, attributes, relationships),
 
-        "beneficialOwner": lambda _id, _type, attributes, relationships:
-        BeneficialOwnerDTO.from_json_api(_id, _type, attributes, relationships)
-    }
+serializers: Dict[type, Callable[[object], object]] = {}
 
 
-def split_json_api_single_response(payload: Dict):
-    _id, _type, attributes = payload.get("id"), payload["type"], payload["attributes"]
-    relationships = None
+def register_serializer(cls: type):
+    """
+    Registers the function turning instances of `cls` into JSON-compatible values, instead of the compiled one.
+    """
+    def register(serializer):
+        serializers[cls] = serializer
+        return serializer
 
-    if payload.get("relationships"):
-        relationships = dict()
-        for k, v in payload.get("relationships").items():
-            if isinstance(v["data"], list):
-                relationships[k] = RelationshipArray(v["data"])
-            else:
-                relationships[k] = Relationship(v["data"]["type"], v["data"]["id"])
+    return register
 
-    return _id, _type, attributes, relationships
 
+def compile_serializer(cls: type):
+    if issubclass(cls, (datetime, date)):
+        return cls.isoformat
 
-def split_json_api_array_response(payload):
-    if not isinstance(payload, list):
-        raise Exception("split_json_api_array_response - couldn't parse response.")
+    to_dict = getattr(cls, "to_dict", None)
+    if to_dict is not None and to_dict is not UnitDTO.to_dict:
+        return to_dict
 
-    dtos = []
-    for single_obj in payload:
-        dtos.append(split_json_api_single_response(single_obj))
+    if to_dict is None and not hasattr(cls, "__dict__"):
+        raise TypeError(f"Object of type {cls.__name__} is not JSON serializable")
 
-    return dtos
+    # the attributes of a class are only known from its instances, so their camelCase keys are computed on first use
+    keys = {}
+    slots = tuple(name for c in reversed(cls.__mro__) for name in c.__dict__.get("__slots__", ())
+                  if not name.startswith("__"))
 
+    def members(obj):
+        if not slots:
+            return vars(obj).items()
 
-def decode_limits(_id: str, _type: str, attributes: Dict):
-    if "ach" in attributes.keys():
-        return DepositAccountLimitsDTO.from_json_api(_id, _type, attributes)
-    else:
-        return CardLimitsDTO.from_json_api(attributes)
+        values = [(name, getattr(obj, name, None)) for name in slots]
+        if hasattr(obj, "__dict__"):
+            values.extend(vars(obj).items())
 
+        return values
 
-def mapping_wrapper(_id, _type, attributes, relationships):
-    if "Transaction" in _type:
-        return transactions_mapper(_id, _type, attributes, relationships)
-    if _type in mappings:
-        return mappings[_type](_id, _type, attributes, relationships)
-    else:
-        return RawUnitObject(_id, _type, attributes, relationships)
+    def serialize(obj):
+        attributes = {}
+        for name, value in members(obj):
+            if value is not None:
+                key = keys.get(name)
+                if key is None:
+                    key = keys[name] = to_camel_case(name) if to_dict is not None else name
+                attributes[key] = value
 
+        return attributes
 
-class DtoDecoder(object):
-    @staticmethod
-    def decode(payload):
-        if payload is None:
-            return None
-        # if response contains a list of dtos
-        if isinstance(payload, list):
-            dtos = split_json_api_array_response(payload)
-            response = []
-            for _id, _type, attributes, relationships in dtos:
-                response.append(mapping_wrapper(_id, _type, attributes, relationships))
+    return serialize
 
-            return response
-        else:
-            _id, _type, attributes, relationships = split_json_api_single_response(payload)
-            return mapping_wrapper(_id, _type, attributes, relationships)
+
+def to_jsonable(obj):
+    """
+    The `default` hook of json.dumps and orjson.dumps for DTOs, requests and dates.
+    """
+    serializer = serializers.get(type(obj))
+    if serializer is None:
+        serializer = serializers[type(obj)] = compile_serializer(type(obj))
+
+    return serializer(obj)
+
+
+@register_serializer(LazyDTO)
+def serialize_lazy_dto(obj: LazyDTO):
+    return to_jsonable(obj.materialize())
+
+
+def encode(payload) -> Union[str, bytes]:
+    return json_backend.dumps(payload, default=to_jsonable)
 
 
 class UnitEncoder(json.JSONEncoder):
     def default(self, obj):
-        if isinstance(obj, (datetime, date)):
-            return obj.isoformat()
-        if hasattr(obj, 'to_dict'):
-            return obj.to_dict()
-        else:
-            try:
-                return json.JSONEncoder.default(self, obj)
-            except TypeError:
-                return json.dumps(obj, default=lambda o: o.__dict__, sort_keys=True, indent=4)
+        return to_jsonable(obj)
 
@@ -3,10 +3,11 @@ from datetime import datetime, date
 from typing import Optional, Dict, List
 from typing_extensions import Literal
 
-from unit.models import Relationship, UnitParams, UnitRequest
+from unit.models import Relationship, UnitParams, UnitRequest, register_decoder
 from unit.utils import date_utils
 
 
+@register_decoder("achCounterparty")
 class CounterpartyDTO(object):
     def __init__(self, id: str, created_at: datetime, name: str, routing_number: str, bank: Optional[str],
                  account_number: str, account_type: str, type: str, permissions: str,
@@ -89,6 +90,7 @@ class PatchCounterpartyRequest(UnitRequest):
         return json.dumps(self.to_json_api())
 
 
+@register_decoder("counterpartyBalance")
 class CounterpartyBalanceDTO(object):
     def __init__(self, id: str, balance: int, available: int, relationships: [Dict[str, Relationship]]):
         self.id = id
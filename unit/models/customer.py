@@ -7,6 +7,7 @@ ArchiveReason = Literal["Inactive", "FraudACHActivity", "FraudCardActivity", "Fr
 CustomerStatus = Literal["Active", "Archived"]
 
 
+@register_decoder("individualCustomer")
 class IndividualCustomerDTO(object):
     def __init__(self, id: str, created_at: datetime, full_name: FullName, date_of_birth: date, address: Address,
                  phone: Phone, email: str, ssn: Optional[str], passport: Optional[str], nationality: Optional[str],
@@ -34,6 +35,7 @@ class IndividualCustomerDTO(object):
         )
 
 
+@register_decoder("businessCustomer")
 class BusinessCustomerDTO(object):
     def __init__(self, id: str, created_at: datetime, name: str, address: Address, phone: Phone,
                  state_of_incorporation: str, ein: str, entity_type: EntityType, contact: BusinessContact,
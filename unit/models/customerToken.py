@@ -1,6 +1,7 @@
 from unit.models import *
 
 
+@register_decoder("customerBearerToken")
 class CustomerTokenDTO(object):
     def __init__(self, token: str, expires_in: int):
         self.type = "customerBearerToken"
@@ -11,6 +12,7 @@ class CustomerTokenDTO(object):
         return CustomerTokenDTO(attributes["token"], attributes["expiresIn"])
 
 
+@register_decoder("customerTokenVerification")
 class CustomerVerificationTokenDTO(object):
     def __init__(self, verification_token: str):
         self.type = "customerTokenVerification"
@@ -21,6 +21,7 @@ class DisputeStatusHistory(object):
         return dispute_statuses
 
 
+@register_decoder("dispute")
 class DisputeDTO(object):
     def __init__(self, _id: str, source: str, status: DisputeStatus,
                  status_history: Optional[List[DisputeStatusHistory]], description: str, created_at: datetime,
@@ -8,7 +8,9 @@ except ImportError:
 from unit.utils import date_utils
 from unit.models import *
 
-class BaseEvent(object):
+class BaseEvent(CompactDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         self.id = id
@@ -16,7 +18,10 @@ class BaseEvent(object):
         self.relationships = relationships
 
 
+@register_decoder("account.closed")
 class AccountClosedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, close_reason: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -29,7 +34,10 @@ class AccountClosedEvent(BaseEvent):
                                   attributes.get("tags"), relationships)
 
 
+@register_decoder("account.frozen")
 class AccountFrozenEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, freeze_reason: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -42,7 +50,10 @@ class AccountFrozenEvent(BaseEvent):
                                   attributes.get("tags"), relationships)
 
 
+@register_decoder("application.denied")
 class ApplicationDeniedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -54,7 +65,10 @@ class ApplicationDeniedEvent(BaseEvent):
                                       relationships)
 
 
+@register_decoder("application.pendingReview")
 class ApplicationPendingReviewEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -66,7 +80,10 @@ class ApplicationPendingReviewEvent(BaseEvent):
                                              attributes.get("tags"), relationships)
 
 
+@register_decoder("application.awaitingDocuments")
 class ApplicationAwaitingDocumentsEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -78,7 +95,10 @@ class ApplicationAwaitingDocumentsEvent(BaseEvent):
                                                  attributes.get("tags"), relationships)
 
 
+@register_decoder("authorization.created")
 class AuthorizationCreatedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, card_last_4_digits: str, recurring: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -92,7 +112,10 @@ class AuthorizationCreatedEvent(BaseEvent):
                                          attributes["cardLast4Digits"], attributes["recurring"],
                                          attributes.get("tags"), relationships)
 
+@register_decoder("authorizationRequest.approved")
 class AuthorizationRequestApprovedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, amount: str, status: str, approved_amount: str,
                  partial_approval_allowed: str, merchant: Dict[str, str], recurring: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
@@ -115,7 +138,10 @@ class AuthorizationRequestApprovedEvent(BaseEvent):
                                                  attributes.get("tags"), relationships)
 
 
+@register_decoder("authorizationRequest.declined")
 class AuthorizationRequestDeclinedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, amount: str, status: str, decline_reason: str,
                  partial_approval_allowed: str, merchant: Dict[str, str], recurring: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
@@ -138,7 +164,10 @@ class AuthorizationRequestDeclinedEvent(BaseEvent):
                                                  attributes.get("tags"), relationships)
 
 
+@register_decoder("authorizationRequest.pending")
 class AuthorizationRequestPendingEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, amount: str, status: str, partial_approval_allowed: str,
                  merchant: Dict[str, str], recurring: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -158,7 +187,10 @@ class AuthorizationRequestPendingEvent(BaseEvent):
                                                 attributes["partialApprovalAllowed"], attributes["merchant"],
                                                 attributes["recurring"], attributes.get("tags"), relationships)
 
+@register_decoder("card.activated")
 class CardActivatedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -170,7 +202,10 @@ class CardActivatedEvent(BaseEvent):
                                   relationships)
 
 
+@register_decoder("card.statusChanged")
 class CardStatusChangedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, new_status: str, previous_status: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -184,7 +219,10 @@ class CardStatusChangedEvent(BaseEvent):
                                       attributes["previousStatus"], attributes.get("tags"), relationships)
 
 
+@register_decoder("checkDeposit.created")
 class CheckDepositCreatedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -196,7 +234,10 @@ class CheckDepositCreatedEvent(BaseEvent):
         return CheckDepositCreatedEvent(_id, date_utils.to_datetime(attributes["createdAt"]),
                                       attributes["status"], attributes.get("tags"), relationships)
 
+@register_decoder("checkDeposit.clearing")
 class CheckDepositClearingEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, previous_status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -209,7 +250,10 @@ class CheckDepositClearingEvent(BaseEvent):
                                       attributes["previousStatus"], attributes.get("tags"), relationships)
 
 
+@register_decoder("checkDeposit.sent")
 class CheckDepositSentEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, previous_status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -223,6 +267,8 @@ class CheckDepositSentEvent(BaseEvent):
 
 
 class CheckDepositReturnedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, previous_status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -235,7 +281,10 @@ class CheckDepositReturnedEvent(BaseEvent):
                                       attributes["previousStatus"], attributes.get("tags"), relationships)
 
 
+@register_decoder("customer.created")
 class CustomerCreatedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -246,7 +295,10 @@ class CustomerCreatedEvent(BaseEvent):
         return CustomerCreatedEvent(_id, date_utils.to_datetime(attributes["createdAt"]),
                                     attributes.get("tags"), relationships)
 
+@register_decoder("document.approved")
 class DocumentApprovedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -257,7 +309,10 @@ class DocumentApprovedEvent(BaseEvent):
         return DocumentApprovedEvent(_id, date_utils.to_datetime(attributes["createdAt"]),
                                     attributes.get("tags"), relationships)
 
+@register_decoder("document.rejected")
 class DocumentRejectedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, reason: str, reason_code: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -272,7 +327,10 @@ class DocumentRejectedEvent(BaseEvent):
                                      relationships)
 
 
+@register_decoder("payment.clearing")
 class PaymentClearingEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, previous_status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -284,7 +342,10 @@ class PaymentClearingEvent(BaseEvent):
         return PaymentClearingEvent(_id, date_utils.to_datetime(attributes["createdAt"]), attributes["previousStatus"],
                                     attributes.get("tags"), relationships)
 
+@register_decoder("payment.sent")
 class PaymentSentEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, previous_status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -296,7 +357,10 @@ class PaymentSentEvent(BaseEvent):
         return PaymentSentEvent(_id, date_utils.to_datetime(attributes["createdAt"]), attributes["previousStatus"],
                                     attributes.get("tags"), relationships)
 
+@register_decoder("payment.returned")
 class PaymentReturnedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, previous_status: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -308,7 +372,10 @@ class PaymentReturnedEvent(BaseEvent):
         return PaymentReturnedEvent(_id, date_utils.to_datetime(attributes["createdAt"]), attributes["previousStatus"],
                                     attributes.get("tags"), relationships)
 
+@register_decoder("statements.created")
 class StatementsCreatedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, period: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -320,7 +387,10 @@ class StatementsCreatedEvent(BaseEvent):
         return StatementsCreatedEvent(_id, date_utils.to_datetime(attributes["createdAt"]), attributes["period"],
                                     attributes.get("tags"), relationships)
 
+@register_decoder("transaction.created")
 class TransactionCreatedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, summary: str, direction: str, amount: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -335,7 +405,10 @@ class TransactionCreatedEvent(BaseEvent):
                                        attributes["direction"], attributes["amount"], attributes.get("tags"),
                                        relationships)
 
+@register_decoder("account.reopened")
 class AccountReopenedEvent(BaseEvent):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime,tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
         BaseEvent.__init__(self, id, created_at, tags, relationships)
@@ -356,13 +429,20 @@ EventDTO = Union[AccountClosedEvent, AccountFrozenEvent, ApplicationDeniedEvent,
 
 
 class ListEventParams(UnitParams):
-    def __init__(self, limit: int = 100, offset: int = 0, type: Optional[List[str]] = None):
+    def __init__(self, limit: int = 100, offset: int = 0, type: Optional[List[str]] = None,
+                 since: Optional[str] = None, until: Optional[str] = None):
         self.limit = limit
         self.offset = offset
         self.type = type
+        self.since = since
+        self.until = until
 
     def to_dict(self) -> Dict:
         parameters = {"page[limit]": self.limit, "page[offset]": self.offset}
         if self.type:
             parameters["filter[type][]"] = self.type
+        if self.since:
+            parameters["filter[since]"] = self.since
+        if self.until:
+            parameters["filter[until]"] = self.until
         return parameters
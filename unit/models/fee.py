@@ -3,6 +3,7 @@ from typing import Optional
 from unit.models import *
 
 
+@register_decoder("fee")
 class FeeDTO(object):
     def __init__(self, id: str, amount: int, description: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
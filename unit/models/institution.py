@@ -3,6 +3,7 @@ from typing import Optional
 from unit.models import *
 
 
+@register_decoder("institution")
 class InstitutionDTO(object):
     def __init__(self, routing_number: str, name: str, is_ach_supported: bool, is_wire_supported: bool,
                  address: Optional[Address] = None):
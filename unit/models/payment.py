@@ -39,6 +39,9 @@ class CreateSchedule(UnitDTO):
 
 
 class BasePayment(object):
+    lazy_attributes = {"createdAt": date_utils.to_datetime}
+    optional_attributes = frozenset({"reason", "tags"})
+
     def __init__(self, _id: str, created_at: datetime, status: PaymentStatus, direction: PaymentDirections, description: str,
                  amount: int, reason: Optional[str], tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -48,7 +51,12 @@ class BasePayment(object):
         self.relationships = relationships
 
 
+@register_decoder("achPayment")
 class AchPaymentDTO(BasePayment):
+    lazy_attributes = dict(BasePayment.lazy_attributes, counterparty=Counterparty.from_json_api,
+                           settlementDate=date_utils.to_date)
+    optional_attributes = BasePayment.optional_attributes | {"addenda", "settlementDate"}
+
     def __init__(self, _id: str, created_at: datetime, status: PaymentStatus, counterparty: Counterparty, direction: str,
                  description: str, amount: int, addenda: Optional[str], reason: Optional[str],
                  settlement_date: Optional[date], tags: Optional[Dict[str, str]],
@@ -69,7 +77,10 @@ class AchPaymentDTO(BasePayment):
                              attributes["sameDay"])
 
 
+@register_decoder("bookPayment")
 class BookPaymentDTO(BasePayment):
+    optional_attributes = BasePayment.optional_attributes | {"direction"}
+
     def __init__(self, _id: str, created_at: datetime, status: PaymentStatus, direction: Optional[str], description: str,
                  amount: int, reason: Optional[str], tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -83,7 +94,10 @@ class BookPaymentDTO(BasePayment):
                               attributes.get("reason"), attributes.get("tags"), relationships)
 
 
+@register_decoder("wirePayment")
 class WirePaymentDTO(BasePayment):
+    lazy_attributes = dict(BasePayment.lazy_attributes, counterparty=WireCounterparty.from_json_api)
+
     def __init__(self, _id: str, created_at: datetime, status: PaymentStatus, counterparty: WireCounterparty,
                  direction: str, description: str, amount: int, reason: Optional[str], tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -99,6 +113,7 @@ class WirePaymentDTO(BasePayment):
                               attributes.get("tags"), relationships)
 
 
+@register_decoder("billPayment")
 class BillPaymentDTO(BasePayment):
     def __init__(self, _id: str, created_at: datetime, status: PaymentStatus, direction: str, description: str,
                  amount: int, reason: Optional[str], tags: Optional[Dict[str, str]],
@@ -118,7 +133,12 @@ PaymentDTO = Union[AchPaymentDTO, BookPaymentDTO, WirePaymentDTO, BillPaymentDTO
 AchReceivedPaymentStatus = Literal["Pending", "Advanced", "Completed", "Returned"]
 
 
+@register_decoder("achReceivedPayment")
 class AchReceivedPaymentDTO(object):
+    lazy_attributes = {"createdAt": date_utils.to_datetime, "completionDate": date_utils.to_date}
+    optional_attributes = frozenset({"returnReason", "addenda", "companyName", "counterpartyRoutingNumber",
+                                     "traceNumber", "secCode", "tags"})
+
     def __init__(self, _id: str, created_at: datetime, status: AchReceivedPaymentStatus, was_advanced: bool,
                  completion_date: date, return_reason: Optional[str], amount: int, description: str,
                  addenda: Optional[str], company_name: str, counterparty_routing_number: str, trace_number: str,
@@ -144,6 +164,10 @@ class AchReceivedPaymentDTO(object):
 
 
 class BaseRecurringPaymentDTO(object):
+    lazy_attributes = {"createdAt": date_utils.to_datetime, "updatedAt": date_utils.to_datetime,
+                       "schedule": Schedule.from_json_api}
+    optional_attributes = frozenset({"addenda", "tags"})
+
     def __init__(self, _id: str, _type: str, created_at: datetime, update_at: datetime, amount: int, description: str,
                  addenda: Optional[str], status: RecurringStatus, number_of_payments: int, schedule: Schedule,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
@@ -155,6 +179,7 @@ class BaseRecurringPaymentDTO(object):
         self.relationships = relationships
 
 
+@register_decoder("recurringCreditAchPayment")
 class RecurringCreditAchPaymentDTO(BaseRecurringPaymentDTO):
     @staticmethod
     def from_json_api(_id, _type, attributes, relationships):
@@ -166,7 +191,10 @@ class RecurringCreditAchPaymentDTO(BaseRecurringPaymentDTO):
                                             relationships)
 
 
+@register_decoder("recurringCreditBookPayment")
 class RecurringCreditBookPaymentDTO(BaseRecurringPaymentDTO):
+    optional_attributes = BaseRecurringPaymentDTO.optional_attributes | {"transactionSummaryOverride"}
+
     def __init__(self, _id: str, _type: str, created_at: datetime, update_at: datetime, amount: int, description: str,
                  addenda: Optional[str], status: RecurringStatus, number_of_payments: int, schedule: Schedule,
                  transaction_summary_override: str, tags: Optional[Dict[str, str]],
@@ -186,6 +214,7 @@ class RecurringCreditBookPaymentDTO(BaseRecurringPaymentDTO):
                                              relationships)
 
 
+@register_decoder("recurringDebitAchPayment")
 class RecurringDebitAchPaymentDTO(BaseRecurringPaymentDTO):
     @staticmethod
     def from_json_api(_id, _type, attributes, relationships):
@@ -201,6 +230,8 @@ RecurringPaymentDTO = Union[RecurringCreditAchPaymentDTO, RecurringDebitAchPayme
 
 
 class CreateRecurringPaymentBaseRequest(UnitRequest):
+    payload = Payload(required=["amount", "description", "schedule"], optional=["idempotency_key", "tags"])
+
     def __init__(self,_type: str, amount: int, description: str, schedule: CreateSchedule, relationships: Dict[str, Relationship],
                  idempotency_key: Optional[str], tags: Optional[Dict[str, str]]):
         self.type = _type
@@ -211,32 +242,10 @@ class CreateRecurringPaymentBaseRequest(UnitRequest):
         self.tags = tags
         self.relationships = relationships
 
-    def to_json_api(self) -> Dict:
-        payload = {
-            "data": {
-                "type": self.type,
-                "attributes": {
-                    "amount": self.amount,
-                    "description": self.description,
-                    "schedule": self.schedule
-                },
-                "relationships": self.relationships
-            }
-        }
-
-        if self.idempotency_key:
-            payload["data"]["attributes"]["idempotencyKey"] = self.idempotency_key
-
-        if self.tags:
-            payload["data"]["attributes"]["tags"] = self.tags
-
-        return payload
-
-    def __repr__(self):
-        json.dumps(self.to_json_api())
-
 
 class CreateRecurringCreditAchPaymentRequest(CreateRecurringPaymentBaseRequest):
+    payload = CreateRecurringPaymentBaseRequest.payload.extend(optional=["addenda"])
+
     def __init__(self, amount: int, description: str, schedule: CreateSchedule, relationships: Dict[str, Relationship],
                  addenda: Optional[str] = None, idempotency_key: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None):
@@ -244,16 +253,10 @@ class CreateRecurringCreditAchPaymentRequest(CreateRecurringPaymentBaseRequest):
                                                    relationships, idempotency_key, tags)
         self.addenda = addenda
 
-    def to_json_api(self) -> Dict:
-        payload = CreateRecurringPaymentBaseRequest.to_json_api(self)
-
-        if self.addenda:
-            payload["data"]["attributes"]["addenda"] = self.addenda
-
-        return payload
-
 
 class CreateRecurringCreditBookPaymentRequest(CreateRecurringPaymentBaseRequest):
+    payload = CreateRecurringPaymentBaseRequest.payload.extend(optional=["transaction_summary_override"])
+
     def __init__(self, amount: int, description: str, schedule: CreateSchedule, relationships: Dict[str, Relationship],
                  transaction_summary_override: Optional[str] = None, idempotency_key: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None):
@@ -261,16 +264,11 @@ class CreateRecurringCreditBookPaymentRequest(CreateRecurringPaymentBaseRequest)
                                                    relationships, idempotency_key, tags)
         self.transaction_summary_override = transaction_summary_override
 
-    def to_json_api(self) -> Dict:
-        payload = CreateRecurringPaymentBaseRequest.to_json_api(self)
-
-        if self.transaction_summary_override:
-            payload["data"]["attributes"]["transactionSummaryOverride"] = self.transaction_summary_override
-
-        return payload
-
 
 class CreateRecurringDebitAchPaymentRequest(CreateRecurringPaymentBaseRequest):
+    payload = CreateRecurringPaymentBaseRequest.payload.extend(optional=["addenda", "verify_counterparty_balance",
+                                                                         "same_day"])
+
     def __init__(self, amount: int, description: str, schedule: CreateSchedule, relationships: Dict[str, Relationship],
                  addenda: Optional[str] = None, idempotency_key: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None, verify_counterparty_balance: Optional[bool] = False,
@@ -281,26 +279,15 @@ class CreateRecurringDebitAchPaymentRequest(CreateRecurringPaymentBaseRequest):
         self.verify_counterparty_balance = verify_counterparty_balance
         self.same_day = same_day
 
-    def to_json_api(self) -> Dict:
-        payload = CreateRecurringPaymentBaseRequest.to_json_api(self)
-
-        if self.addenda:
-            payload["data"]["attributes"]["addenda"] = self.addenda
-
-        if self.verify_counterparty_balance:
-            payload["data"]["attributes"]["verifyCounterpartyBalance"] = self.verify_counterparty_balance
-
-        if self.same_day:
-            payload["data"]["attributes"]["sameDay"] = self.same_day
-
-        return payload
-
 
 CreateRecurringPaymentRequest = Union[CreateRecurringCreditAchPaymentRequest,
                                       CreateRecurringCreditBookPaymentRequest, CreateRecurringDebitAchPaymentRequest]
 
 
 class CreatePaymentBaseRequest(UnitRequest):
+    payload = Payload(required=["amount", "direction", "description"],
+                      optional=["addenda", "same_day", "sec_code", "idempotency_key", "tags"])
+
     def __init__(self, amount: int, description: str, relationships: Dict[str, Relationship],
                  idempotency_key: Optional[str] = None, tags: Optional[Dict[str, str]] = None,
                  direction: str = "Credit", addenda: Optional[str] = None, same_day: Optional[bool] = False,
@@ -316,41 +303,10 @@ class CreatePaymentBaseRequest(UnitRequest):
         self.tags = tags
         self.relationships = relationships
 
-    def to_json_api(self) -> Dict:
-        payload = {
-            "data": {
-                "type": self.type,
-                "attributes": {
-                    "amount": self.amount,
-                    "direction": self.direction,
-                    "description": self.description
-                },
-                "relationships": self.relationships
-            }
-        }
-
-        if self.addenda:
-            payload["data"]["attributes"]["addenda"] = self.addenda
-
-        if self.same_day:
-            payload["data"]["attributes"]["sameDay"] = self.same_day
-
-        if self.sec_code:
-            payload["data"]["attributes"]["secCode"] = self.sec_code
-
-        if self.idempotency_key:
-            payload["data"]["attributes"]["idempotencyKey"] = self.idempotency_key
-
-        if self.tags:
-            payload["data"]["attributes"]["tags"] = self.tags
-
-        return payload
-
-    def __repr__(self):
-        return json.dumps(self.to_json_api())
-
 
 class CreateInlinePaymentRequest(CreatePaymentBaseRequest):
+    payload = CreatePaymentBaseRequest.payload.extend(required=["counterparty"])
+
     def __init__(self, amount: int, description: str, counterparty: Counterparty, relationships: Dict[str, Relationship],
                  addenda: Optional[str] = None, idempotency_key: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None, direction: Optional[str] = "Credit",
@@ -359,15 +315,10 @@ class CreateInlinePaymentRequest(CreatePaymentBaseRequest):
                                           addenda, same_day, sec_code)
         self.counterparty = counterparty
 
-    def to_json_api(self) -> Dict:
-        payload = CreatePaymentBaseRequest.to_json_api(self)
-
-        payload["data"]["attributes"]["counterparty"] = self.counterparty
-
-        return payload
-
 
 class CreateLinkedPaymentRequest(CreatePaymentBaseRequest):
+    payload = CreatePaymentBaseRequest.payload.extend(optional=["verify_counterparty_balance"])
+
     def __init__(self, amount: int, description: str, relationships: Dict[str, Relationship],
                  addenda: Optional[str] = None, verify_counterparty_balance: Optional[bool] = None,
                  idempotency_key: Optional[str] = None, tags: Optional[Dict[str, str]] = None,
@@ -376,16 +327,11 @@ class CreateLinkedPaymentRequest(CreatePaymentBaseRequest):
                                           addenda, same_day, sec_code)
         self.verify_counterparty_balance = verify_counterparty_balance
 
-    def to_json_api(self) -> Dict:
-        payload = CreatePaymentBaseRequest.to_json_api(self)
-
-        if self.verify_counterparty_balance:
-            payload["data"]["attributes"]["verifyCounterpartyBalance"] = self.verify_counterparty_balance
-
-        return payload
-
 
 class CreateVerifiedPaymentRequest(CreatePaymentBaseRequest):
+    payload = CreatePaymentBaseRequest.payload.extend(required=["plaid_processor_token"],
+                                                      optional=["counterparty_name", "verify_counterparty_balance"])
+
     def __init__(self, amount: int, description: str, plaid_processor_token: str, relationships: Dict[str, Relationship],
                  counterparty_name: Optional[str] = None, verify_counterparty_balance: Optional[bool] = None,
                  idempotency_key: Optional[str] = None, tags: Optional[Dict[str, str]] = None,
@@ -397,18 +343,6 @@ class CreateVerifiedPaymentRequest(CreatePaymentBaseRequest):
         self.counterparty_name = counterparty_name
         self.verify_counterparty_balance = verify_counterparty_balance
 
-    def to_json_api(self) -> Dict:
-        payload = CreatePaymentBaseRequest.to_json_api(self)
-        payload["data"]["attributes"]["plaidProcessorToken"] = self.plaid_processor_token
-
-        if self.counterparty_name:
-            payload["data"]["attributes"]["counterpartyName"] = self.counterparty_name
-
-        if self.verify_counterparty_balance:
-            payload["data"]["attributes"]["verifyCounterpartyBalance"] = self.verify_counterparty_balance
-
-        return payload
-
 
 class CreateBookPaymentRequest(CreatePaymentBaseRequest):
     def __init__(self, amount: int, description: str, relationships: Dict[str, Relationship],
@@ -418,6 +352,8 @@ class CreateBookPaymentRequest(CreatePaymentBaseRequest):
 
 
 class CreateWirePaymentRequest(CreatePaymentBaseRequest):
+    payload = CreatePaymentBaseRequest.payload.extend(required=["counterparty"])
+
     def __init__(self, amount: int, description: str, counterparty: WireCounterparty,
                  relationships: Dict[str, Relationship], idempotency_key: Optional[str] = None,
                  tags: Optional[Dict[str, str]] = None, direction: str = "Credit"):
@@ -425,11 +361,6 @@ class CreateWirePaymentRequest(CreatePaymentBaseRequest):
                                           _type="wirePayment")
         self.counterparty = counterparty
 
-    def to_json_api(self) -> Dict:
-        payload = CreatePaymentBaseRequest.to_json_api(self)
-        payload["data"]["attributes"]["counterparty"] = self.counterparty
-        return payload
-
 
 CreatePaymentRequest = Union[CreateInlinePaymentRequest, CreateLinkedPaymentRequest, CreateVerifiedPaymentRequest,
                              CreateBookPaymentRequest, CreateWirePaymentRequest]
@@ -4,7 +4,7 @@ except ImportError:
     from typing import Optional, Dict, Union, List
     from typing_extensions import Literal
 
-from unit.models import UnitDTO, extract_attributes, UnitRequest, Relationship, UnitParams
+from unit.models import UnitDTO, extract_attributes, UnitRequest, Relationship, UnitParams, register_decoder
 from unit.utils import date_utils
 
 
@@ -19,12 +19,14 @@ class BaseRepayment(UnitDTO):
         self.relationships = relationships
 
 
+@register_decoder("bookRepayment")
 class BookRepaymentDTO(BaseRepayment):
     @staticmethod
     def from_json_api(_id, _type, attributes, relationships):
         return BookRepaymentDTO(_id, _type, attributes, relationships)
 
 
+@register_decoder("achRepayment")
 class AchRepaymentDTO(BaseRepayment):
     @staticmethod
     def from_json_api(_id, _type, attributes, relationships):
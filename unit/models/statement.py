@@ -2,6 +2,7 @@ import json
 from unit.models import *
 
 
+@register_decoder("accountStatementDTO", "sandboxAccountStatement")
 class StatementDTO(object):
     def __init__(self, id: str, _type: str, period: str, relationships: Optional[Dict[str, Relationship]]):
         self.id = id
@@ -2,7 +2,11 @@ from unit.utils import date_utils
 from unit.models import *
 
 
-class BaseTransactionDTO(object):
+class BaseTransactionDTO(CompactDTO):
+    __slots__ = ()
+    lazy_attributes = {"createdAt": date_utils.to_datetime}
+    optional_attributes = frozenset({"tags"})
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int,
                  summary: str, tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         self.id = id
@@ -11,7 +15,12 @@ class BaseTransactionDTO(object):
         self.relationships = relationships
 
 
+@register_decoder("originatedAchTransaction")
 class OriginatedAchTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+    lazy_attributes = dict(BaseTransactionDTO.lazy_attributes, counterparty=Counterparty.from_json_api)
+    optional_attributes = BaseTransactionDTO.optional_attributes | {"addenda"}
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int,
                  summary: str, description: str, addenda: Optional[str], counterparty: Counterparty,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
@@ -30,7 +39,11 @@ class OriginatedAchTransactionDTO(BaseTransactionDTO):
             attributes.get("tags"), relationships)
 
 
+@register_decoder("receivedAchTransaction")
 class ReceivedAchTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+    optional_attributes = BaseTransactionDTO.optional_attributes | {"addenda", "traceNumber", "secCode"}
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int,
                  summary: str, description: str, addenda: Optional[str], company_name: str,
                  counterparty_routing_number: str, trace_number: Optional[str], sec_code: Optional[str],
@@ -53,7 +66,10 @@ class ReceivedAchTransactionDTO(BaseTransactionDTO):
             attributes.get("traceNumber"), attributes.get("secCode"), attributes.get("tags"), relationships)
 
 
+@register_decoder("returnedAchTransaction")
 class ReturnedAchTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int,
                  summary: str, company_name: str, counterparty_name: str, counterparty_routing_number: str, reason: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
@@ -72,7 +88,10 @@ class ReturnedAchTransactionDTO(BaseTransactionDTO):
             attributes["counterpartyRoutingNumber"], attributes["reason"], attributes.get("tags"), relationships)
 
 
+@register_decoder("returnedReceivedAchTransaction")
 class ReturnedReceivedAchTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  company_name: str, reason: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -89,7 +108,11 @@ class ReturnedReceivedAchTransactionDTO(BaseTransactionDTO):
             attributes["reason"], attributes.get("tags"), relationships)
 
 
+@register_decoder("dishonoredAchTransaction")
 class DishonoredAchTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+    optional_attributes = BaseTransactionDTO.optional_attributes | {"traceNumber", "secCode"}
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  company_name: str, counterparty_routing_number: str, reason: str, trace_number: Optional[str],
                  sec_code: Optional[str], tags: Optional[Dict[str, str]],
@@ -111,7 +134,11 @@ class DishonoredAchTransactionDTO(BaseTransactionDTO):
             attributes.get("secCode"), attributes.get("tags"), relationships)
 
 
+@register_decoder("bookTransaction")
 class BookTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+    lazy_attributes = dict(BaseTransactionDTO.lazy_attributes, counterparty=Counterparty.from_json_api)
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int,
                  summary: str, counterparty: Counterparty, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -127,7 +154,15 @@ class BookTransactionDTO(BaseTransactionDTO):
             Counterparty.from_json_api(attributes["counterparty"]), attributes.get("tags"), relationships)
 
 
+@register_decoder("purchaseTransaction")
 class PurchaseTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+    lazy_attributes = dict(BaseTransactionDTO.lazy_attributes, merchant=Merchant.from_json_api,
+                           coordinates=Coordinates.from_json_api)
+    optional_attributes = BaseTransactionDTO.optional_attributes | {"coordinates", "interchange", "ecommerce",
+                                                                    "cardPresent", "paymentMethod", "digitalWallet",
+                                                                    "cardVerificationData", "cardNetwork"}
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int,
                  summary: str, card_last_4_digits: str, merchant: Merchant, coordinates: Optional[Coordinates],
                  recurring: bool, interchange: Optional[int], ecommerce: bool, card_present: bool,
@@ -160,7 +195,11 @@ class PurchaseTransactionDTO(BaseTransactionDTO):
             relationships)
 
 
+@register_decoder("atmTransaction")
 class AtmTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+    optional_attributes = BaseTransactionDTO.optional_attributes | {"atmLocation", "interchange", "cardNetwork"}
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int,
                  summary: str, card_last_4_digits: str, atm_name: str, atm_location: Optional[str], surcharge: int,
                  interchange: Optional[int], card_network: Optional[str],
@@ -183,7 +222,10 @@ class AtmTransactionDTO(BaseTransactionDTO):
                                  attributes.get("tags"), relationships)
 
 
+@register_decoder("feeTransaction")
 class FeeTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int,
                  summary: str, tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseTransactionDTO.__init__(self, id, created_at, direction, amount, balance, summary, tags, relationships)
@@ -196,7 +238,14 @@ class FeeTransactionDTO(BaseTransactionDTO):
                                  attributes.get("tags"), relationships)
 
 
+@register_decoder("cardTransaction")
 class CardTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+    lazy_attributes = dict(BaseTransactionDTO.lazy_attributes, merchant=Merchant.from_json_api)
+    optional_attributes = BaseTransactionDTO.optional_attributes | {"merchant", "recurring", "interchange",
+                                                                    "paymentMethod", "digitalWallet",
+                                                                    "cardVerificationData", "cardNetwork"}
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int,
                  summary: str, card_last_4_digits: str, merchant: Optional[Merchant], recurring: Optional[bool],
                  interchange: Optional[int], payment_method: Optional[str], digital_wallet: Optional[str],
@@ -225,7 +274,10 @@ class CardTransactionDTO(BaseTransactionDTO):
                                   attributes.get("tags"), relationships)
 
 
+@register_decoder("cardReversalTransaction")
 class CardReversalTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int,
                  summary: str, card_last_4_digits: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -240,7 +292,15 @@ class CardReversalTransactionDTO(BaseTransactionDTO):
                                           attributes["cardLast4Digits"], attributes.get("tags"), relationships)
 
 
+@register_decoder("wireTransaction")
 class WireTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+    lazy_attributes = dict(BaseTransactionDTO.lazy_attributes, counterparty=Counterparty.from_json_api)
+    optional_attributes = BaseTransactionDTO.optional_attributes | {"originatorToBeneficiaryInformation",
+                                                                    "senderReference", "referenceForBeneficiary",
+                                                                    "beneficiaryInformation",
+                                                                    "beneficiaryAdviceInformation"}
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int,
                  summary: str, counterparty: Counterparty, description: str,
                  originator_to_beneficiary_information: str, sender_reference: str,
@@ -267,7 +327,12 @@ class WireTransactionDTO(BaseTransactionDTO):
                                 attributes.get("beneficiaryAdviceInformation"), attributes.get("tags"), relationships)
 
 
+@register_decoder("releaseTransaction")
 class ReleaseTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+    lazy_attributes = dict(BaseTransactionDTO.lazy_attributes, senderAddress=Address.from_json_api,
+                           counterparty=Counterparty.from_json_api)
+
     def __init__(self, id: str, created_at: datetime, sender_name: str, sender_address: Address,
                  sender_account_number: str, counterparty: Counterparty, amount: int, direction: str,
                  description: str, balance: int, summary: str, tags: Optional[Dict[str, str]],
@@ -290,7 +355,10 @@ class ReleaseTransactionDTO(BaseTransactionDTO):
                                      attributes["summary"], attributes.get("tags"), relationships)
 
 
+@register_decoder("adjustmentTransaction")
 class AdjustmentTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  description: str, tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseTransactionDTO.__init__(self, id, created_at, direction, amount, balance, summary, tags, relationships)
@@ -305,7 +373,10 @@ class AdjustmentTransactionDTO(BaseTransactionDTO):
                                         relationships)
 
 
+@register_decoder("interestTransaction")
 class InterestTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseTransactionDTO.__init__(self, id, created_at, direction, amount, balance, summary, tags, relationships)
@@ -319,7 +390,10 @@ class InterestTransactionDTO(BaseTransactionDTO):
                                       attributes.get("tags"), relationships)
 
 
+@register_decoder("disputeTransaction")
 class DisputeTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, dispute_id: str,
                  summary: str, reason: str, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -335,7 +409,10 @@ class DisputeTransactionDTO(BaseTransactionDTO):
                                      attributes["summary"], attributes["reason"], attributes.get("tags"), relationships)
 
 
+@register_decoder("checkDepositTransaction")
 class CheckDepositTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseTransactionDTO.__init__(self, id, created_at, direction, amount, balance, summary, tags, relationships)
@@ -348,7 +425,10 @@ class CheckDepositTransactionDTO(BaseTransactionDTO):
                                           attributes.get("tags"), relationships)
 
 
+@register_decoder("returnedCheckDepositTransaction")
 class ReturnedCheckDepositTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  reason: str, tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseTransactionDTO.__init__(self, id, created_at, direction, amount, balance, summary, tags, relationships)
@@ -363,7 +443,10 @@ class ReturnedCheckDepositTransactionDTO(BaseTransactionDTO):
                                                   attributes["reason"], attributes.get("tags"), relationships)
 
 
+@register_decoder("paymentAdvanceTransaction")
 class PaymentAdvanceTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseTransactionDTO.__init__(self, id, created_at, direction, amount, balance, summary, tags, relationships)
@@ -376,7 +459,10 @@ class PaymentAdvanceTransactionDTO(BaseTransactionDTO):
                                             attributes["summary"], attributes.get("tags"), relationships)
 
 
+@register_decoder("repaidPaymentAdvanceTransaction")
 class RepaidPaymentAdvanceTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  reason: str, tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseTransactionDTO.__init__(self, id, created_at, direction, amount, balance, summary, tags, relationships)
@@ -390,7 +476,12 @@ class RepaidPaymentAdvanceTransactionDTO(BaseTransactionDTO):
                                                   attributes.get("tags"), relationships)
 
 
+@register_decoder("rewardTransaction")
 class RewardTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+    lazy_attributes = dict(BaseTransactionDTO.lazy_attributes, receiverCounterparty=Counterparty.from_json_api)
+    optional_attributes = BaseTransactionDTO.optional_attributes | {"receiverCounterparty"}
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  receiver_counterparty: Counterparty, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -406,7 +497,10 @@ class RewardTransactionDTO(BaseTransactionDTO):
                                     attributes.get("tags"), relationships)
 
 
+@register_decoder("paymentCanceledTransaction")
 class PaymentCanceledTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseTransactionDTO.__init__(self, id, created_at, direction, amount, balance, summary, tags, relationships)
@@ -419,7 +513,12 @@ class PaymentCanceledTransactionDTO(BaseTransactionDTO):
                                              attributes["summary"], attributes.get("tags"), relationships)
 
 
+@register_decoder("chargebackTransaction")
 class ChargebackTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+    lazy_attributes = dict(BaseTransactionDTO.lazy_attributes, counterparty=Counterparty.from_json_api)
+    optional_attributes = BaseTransactionDTO.optional_attributes | {"counterparty"}
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  counterparty: Counterparty, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -436,7 +535,12 @@ class ChargebackTransactionDTO(BaseTransactionDTO):
                                         attributes.get("tags"), relationships)
 
 
+@register_decoder("accountLowBalanceClosureTransaction")
 class AccountLowBalanceClosureTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+    lazy_attributes = dict(BaseTransactionDTO.lazy_attributes, receiverCounterparty=Counterparty.from_json_api)
+    optional_attributes = BaseTransactionDTO.optional_attributes | {"receiverCounterparty"}
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  receiver_counterparty: Counterparty, tags: Optional[Dict[str, str]],
                  relationships: Optional[Dict[str, Relationship]]):
@@ -453,7 +557,10 @@ class AccountLowBalanceClosureTransactionDTO(BaseTransactionDTO):
                                                    attributes.get("tags"), relationships)
 
 
+@register_decoder("negativeBalanceCoverageTransaction")
 class NegativeBalanceCoverageTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseTransactionDTO.__init__(self, id, created_at, direction, amount, balance, summary, tags, relationships)
@@ -466,7 +573,10 @@ class NegativeBalanceCoverageTransactionDTO(BaseTransactionDTO):
                                                   attributes["summary"], attributes.get("tags"), relationships)
 
 
+@register_decoder("pushToCardTransaction")
 class PushToCardTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseTransactionDTO.__init__(self, id, created_at, direction, amount, balance, summary, tags, relationships)
@@ -479,7 +589,10 @@ class PushToCardTransactionDTO(BaseTransactionDTO):
                                         attributes["summary"], attributes.get("tags"), relationships)
 
 
+@register_decoder("checkPaymentTransaction")
 class CheckPaymentTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseTransactionDTO.__init__(self, id, created_at, direction, amount, balance, summary, tags, relationships)
@@ -492,7 +605,10 @@ class CheckPaymentTransactionDTO(BaseTransactionDTO):
                                           attributes["summary"], attributes.get("tags"), relationships)
 
 
+@register_decoder("returnedCheckPaymentTransaction")
 class ReturnedCheckPaymentTransactionDTO(BaseTransactionDTO):
+    __slots__ = ()
+
     def __init__(self, id: str, created_at: datetime, direction: str, amount: int, balance: int, summary: str,
                  reason: str, tags: Optional[Dict[str, str]], relationships: Optional[Dict[str, Relationship]]):
         BaseTransactionDTO.__init__(self, id, created_at, direction, amount, balance, summary, tags, relationships)
@@ -520,13 +636,12 @@ TransactionDTO = Union[OriginatedAchTransactionDTO, ReceivedAchTransactionDTO, R
 
 
 def transactions_mapper(_id, _type, attributes, relationships):
-    c = globals()
-    c_name = _type[0].upper() + _type[1:] + "DTO"
-    if c_name in c.keys():
-        return c[c_name].from_json_api(_id, _type, attributes, relationships)
-    else:
+    decoder = decoders.get(_type)
+    if decoder is None:
         return RawUnitObject(_id, _type, attributes, relationships)
 
+    return decoder(_id, _type, attributes, relationships)
+
 
 class PatchTransactionRequest(BaseTransactionDTO, UnitRequest):
     def __init__(self, account_id: str, transaction_id: str, tags: Optional[Dict[str, str]] = None):
@@ -11,6 +11,7 @@ ContentType = Literal["Json", "JsonAPI"]
 WebhookStatus = Literal["Enabled", "Disabled"]
 
 
+@register_decoder("webhook")
 class WebhookDTO(object):
     def __init__(self, id: str, created_at: datetime, label: str, url: str, status: WebhookStatus,
                  content_type: ContentType, token: str):
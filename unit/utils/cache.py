@@ -0,0 +1,158 @@
+import asyncio
+import re
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from fnmatch import fnmatch, translate
+from typing import Dict, List, Optional, Tuple
+
+
+def is_cacheable(response) -> bool:
+    return 200 <= response.status_code < 300
+
+
+class ResponseCache(object):
+    """
+    Read-through cache of GET responses, shared by the resources of a Configuration.
+    Only paths matching one of the `ttls` patterns (relative to the API url, e.g. "institutions/*" or
+    "cards/*/limits") are cached, each for its number of seconds; the first matching pattern is used. At most
+    `max_entries` successful responses are kept, evicting the least recently used one. Concurrent identical misses
+    are sent once and share its response (counted as `coalesced` rather than as misses). Writes (POST, PATCH, PUT,
+    DELETE) to a resource, e.g. cards/1/freeze, invalidate the cached responses of that resource and below (cards/1).
+    """
+    def __init__(self, ttls: Dict[str, float], max_entries: int = 1000):
+        self.ttls: List[Tuple[re.Pattern, float]] = [(re.compile(translate(p.strip("/"))), t) for p, t in ttls.items()]
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.coalesced = 0
+        self.__entries: "OrderedDict[Tuple, Tuple[float, object]]" = OrderedDict()
+        self.__in_flight: Dict[Tuple, Future] = {}
+        self.__lock = threading.Lock()
+
+    def ttl(self, path: str) -> Optional[float]:
+        for regex, ttl in self.ttls:
+            if regex.match(path):
+                return ttl
+
+        return None
+
+    @staticmethod
+    def key(path: str, params: Optional[Dict] = None, headers: Optional[Dict[str, str]] = None) -> Tuple:
+        return (path, tuple(sorted((k, str(v)) for k, v in (params or {}).items())),
+                tuple(sorted((headers or {}).items())))
+
+    def lookup(self, key: Tuple) -> Tuple[object, Optional[Future], bool]:
+        """
+        Returns the cached response of `key`, or None, the future of the request of `key` and whether the caller
+        should send it (and then store() its response) rather than wait for the one already being sent.
+        """
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None:
+                if entry[0] > time.monotonic():
+                    self.__entries.move_to_end(key)
+                    self.hits += 1
+                    return entry[1], None, False
+
+                del self.__entries[key]
+
+            future = self.__in_flight.get(key)
+            if future is not None:
+                self.coalesced += 1
+                return None, future, False
+
+            self.misses += 1
+            future = self.__in_flight[key] = Future()
+            return None, future, True
+
+    def store(self, key: Tuple, future: Future, ttl: float, response=None, error: Optional[BaseException] = None):
+        with self.__lock:
+            # a request invalidated while in flight may hold the state from before the write, its response is only
+            # given to the callers already waiting for it
+            if self.__in_flight.get(key) is future:
+                del self.__in_flight[key]
+                if error is None and is_cacheable(response):
+                    self.__entries[key] = (time.monotonic() + ttl, response)
+                    self.__entries.move_to_end(key)
+                    while len(self.__entries) > self.max_entries:
+                        self.__entries.popitem(last=False)
+                        self.evictions += 1
+
+        if error is None:
+            future.set_result(response)
+        else:
+            future.set_exception(error)
+
+    def call(self, path: str, params: Optional[Dict], headers: Optional[Dict[str, str]], send, *args):
+        ttl = self.ttl(path)
+        if ttl is None:
+            return send(*args)
+
+        key = self.key(path, params, headers)
+        response, future, sending = self.lookup(key)
+        if response is not None:
+            return response
+        if not sending:
+            return future.result()
+
+        try:
+            response = send(*args)
+        except BaseException as e:
+            self.store(key, future, ttl, error=e)
+            raise
+
+        self.store(key, future, ttl, response)
+        return response
+
+    async def call_async(self, path: str, params: Optional[Dict], headers: Optional[Dict[str, str]], send, *args):
+        ttl = self.ttl(path)
+        if ttl is None:
+            return await send(*args)
+
+        key = self.key(path, params, headers)
+        response, future, sending = self.lookup(key)
+        if response is not None:
+            return response
+        if not sending:
+            return await asyncio.wrap_future(future)
+
+        try:
+            response = await send(*args)
+        except BaseException as e:
+            self.store(key, future, ttl, error=e)
+            raise
+
+        self.store(key, future, ttl, response)
+        return response
+
+    def invalidate(self, pattern: Optional[str] = None):
+        """
+        Drops the cached responses of the paths matching `pattern` (e.g. "institutions/053285241" or "cards/*"), or
+        every cached response. The responses of the matching requests in flight will not be cached, and later
+        requests send their own instead of waiting for them.
+        """
+        if pattern is None:
+            self.__drop(lambda path: True)
+        else:
+            pattern = pattern.strip("/")
+            self.__drop(lambda path: fnmatch(path, pattern))
+
+    def invalidate_path(self, path: str):
+        path = path.strip("/")
+        self.__drop(lambda key_path: key_path == path or key_path.startswith(path + "/"))
+
+    def __drop(self, matches):
+        with self.__lock:
+            for entries in (self.__entries, self.__in_flight):
+                for key in [key for key in entries if matches(key[0])]:
+                    del entries[key]
+
+    def __len__(self):
+        return len(self.__entries)
+
+    def __repr__(self):
+        return f"ResponseCache(entries={len(self)}, hits={self.hits}, misses={self.misses}, " \
+               f"coalesced={self.coalesced}, evictions={self.evictions})"
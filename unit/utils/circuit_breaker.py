@@ -0,0 +1,120 @@
+import re
+import threading
+import time
+from collections import deque
+from fnmatch import translate
+from typing import Optional, List, Tuple
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(Exception):
+    def __init__(self, endpoint: str, retry_in: float):
+        super().__init__(f"circuit breaker for {endpoint} is open, retry in {retry_in:.1f} seconds")
+        self.endpoint = endpoint
+        self.retry_in = retry_in
+
+
+def is_failure(status_code: Optional[int]):
+    return status_code is None or status_code == 408 or status_code >= 500
+
+
+class CircuitBreaker(object):
+    """
+    Opens once `failure_rate` of the last `window_size` calls (and at least `minimum_calls`) failed, rejecting calls
+    for `open_timeout` seconds. It then lets `half_open_calls` trial calls through: it closes again if they all
+    succeed and re-opens on the first failure.
+    """
+    def __init__(self, failure_rate: float = 0.5, minimum_calls: int = 10, window_size: int = 50,
+                 open_timeout: float = 30, half_open_calls: int = 1, name: Optional[str] = None):
+        self.name = name
+        self.failure_rate = failure_rate
+        self.minimum_calls = minimum_calls
+        self.open_timeout = open_timeout
+        self.half_open_calls = half_open_calls
+        self.state = CLOSED
+        self.outcomes = deque(maxlen=window_size)
+        self.__opened_at = 0.0
+        self.__trials = 0
+        self.__successful_trials = 0
+        self.__lock = threading.Lock()
+
+    def before_call(self):
+        with self.__lock:
+            if self.state == CLOSED:
+                return
+
+            if self.state == OPEN:
+                retry_in = self.__opened_at + self.open_timeout - time.monotonic()
+                if retry_in > 0:
+                    raise CircuitOpenError(self.name, retry_in)
+
+                self.state = HALF_OPEN
+                self.__trials = self.__successful_trials = 0
+
+            if self.__trials >= self.half_open_calls:
+                raise CircuitOpenError(self.name, 0)
+
+            self.__trials += 1
+
+    def cancel(self):
+        """
+        Gives back the trial taken by before_call() for a call abandoned before its outcome was known.
+        """
+        with self.__lock:
+            if self.state == HALF_OPEN and self.__trials > self.__successful_trials:
+                self.__trials -= 1
+
+    def record(self, status_code: Optional[int]):
+        failed = is_failure(status_code)
+
+        with self.__lock:
+            if self.state == OPEN:
+                return
+
+            if self.state == HALF_OPEN:
+                if failed:
+                    self.__open()
+                else:
+                    self.__successful_trials += 1
+                    if self.__successful_trials >= self.half_open_calls:
+                        self.state = CLOSED
+                        self.outcomes.clear()
+                return
+
+            self.outcomes.append(failed)
+            if len(self.outcomes) >= self.minimum_calls and \
+                    sum(self.outcomes) >= self.failure_rate * len(self.outcomes):
+                self.__open()
+
+    def __open(self):
+        self.state = OPEN
+        self.__opened_at = time.monotonic()
+        self.outcomes.clear()
+
+
+class CircuitBreakers(object):
+    """
+    Circuit breakers keyed by endpoint pattern, e.g. "cards/*/limits" or "payments", optionally for a single method.
+    The first pattern matching the request path (relative to the API url) is used.
+    """
+    def __init__(self):
+        self.breakers: List[Tuple[Optional[str], re.Pattern, CircuitBreaker]] = []
+
+    def add(self, pattern: str, breaker: CircuitBreaker, method: Optional[str] = None):
+        if breaker.name is None:
+            breaker.name = f"{method} {pattern}" if method else pattern
+
+        self.breakers.append((method, re.compile(translate(pattern.strip("/"))), breaker))
+
+    def find(self, method: str, path: str) -> Optional[CircuitBreaker]:
+        for m, regex, breaker in self.breakers:
+            if (m is None or m == method) and regex.match(path):
+                return breaker
+
+        return None
+
+    def __bool__(self):
+        return bool(self.breakers)
@@ -0,0 +1,56 @@
+import gzip
+from typing import Optional, Dict
+
+
+class TransferStats(object):
+    """
+    Bytes moved by a single API call: request bodies as built and as sent, response bodies as received on the wire and
+    after decompression. `response_wire_bytes` is None when the transport cannot tell.
+    """
+    def __init__(self, method: str, url: str, status_code: int, request_bytes: int, request_wire_bytes: int,
+                 response_bytes: int, response_wire_bytes: Optional[int]):
+        self.method = method
+        self.url = url
+        self.status_code = status_code
+        self.request_bytes = request_bytes
+        self.request_wire_bytes = request_wire_bytes
+        self.response_bytes = response_bytes
+        self.response_wire_bytes = response_wire_bytes
+
+    def __repr__(self):
+        return f"TransferStats({self.method} {self.url}, status_code={self.status_code}, " \
+               f"request={self.request_wire_bytes}/{self.request_bytes}, " \
+               f"response={self.response_wire_bytes}/{self.response_bytes})"
+
+
+def body_size(data) -> int:
+    if data is None:
+        return 0
+
+    if isinstance(data, str):
+        return len(data.encode("utf-8"))
+
+    return len(data) if isinstance(data, bytes) else 0
+
+
+JSON_CONTENT_TYPES = ("application/vnd.api+json", "application/json")
+
+
+def is_json(headers: Dict[str, str]) -> bool:
+    return all(value.split(";")[0].strip().lower() in JSON_CONTENT_TYPES
+               for name, value in headers.items() if name.lower() == "content-type")
+
+
+def compress_body(data, headers: Dict[str, str], min_size: Optional[int]):
+    """
+    Gzips a JSON request body of at least `min_size` bytes, returning the body and headers to send. Bodies of any
+    other content type, such as uploaded documents, are sent as is.
+    """
+    if min_size is None or not isinstance(data, (str, bytes)) or body_size(data) < min_size or not is_json(headers):
+        return data, headers
+
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+
+    headers = dict(headers, **{"content-encoding": "gzip"})
+    return gzip.compress(data, compresslevel=6, mtime=0), headers
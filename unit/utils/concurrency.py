@@ -0,0 +1,116 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from typing import Optional
+
+from unit.utils.retry import RETRYABLE_STATUS_CODES
+
+
+class AdaptiveConcurrencyLimiter(object):
+    """
+    AIMD limit on the number of in-flight requests of a Unit instance.
+    The limit grows by about one request per round trip while responses are healthy and fast, and is cut by
+    `decrease_factor` (at most once per round trip) on 429/5xx responses, timeouts and connection errors.
+    """
+    def __init__(self, initial_limit: int = 10, min_limit: int = 1, max_limit: int = 200,
+                 decrease_factor: float = 0.5, latency_tolerance: float = 2.0, smoothing: float = 0.1):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.decrease_factor = decrease_factor
+        self.latency_tolerance = latency_tolerance
+        self.smoothing = smoothing
+        self.in_flight = 0
+        self.latency: Optional[float] = None
+        self.baseline_latency: Optional[float] = None
+        self.__last_decrease = 0.0
+        self.__condition = threading.Condition()
+        self.__async_waiters = deque()
+
+    def acquire(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Waits for a free slot and returns when the request started, or None when no slot was free within `timeout`.
+        """
+        with self.__condition:
+            if not self.__condition.wait_for(lambda: self.in_flight < int(self.limit), timeout):
+                return None
+            self.in_flight += 1
+
+        return time.monotonic()
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> Optional[float]:
+        expires_at = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.__condition:
+                if self.in_flight < int(self.limit):
+                    self.in_flight += 1
+                    return time.monotonic()
+
+                waiter = asyncio.get_running_loop().create_future()
+                self.__async_waiters.append(waiter)
+
+            left = None if expires_at is None else expires_at - time.monotonic()
+            if left is not None and left <= 0:
+                waiter.cancel()
+                return None
+
+            try:
+                await asyncio.wait_for(waiter, left)
+            except asyncio.TimeoutError:
+                return None
+
+    def cancel(self):
+        """
+        Gives back a slot taken with acquire() whose request was not sent, without recording an outcome.
+        """
+        with self.__condition:
+            self.in_flight -= 1
+            self.__condition.notify_all()
+            self.__wake_async_waiters()
+
+    def release(self, started_at: float, status_code: Optional[int] = None):
+        """
+        Records the outcome of a request started with acquire(); status_code is None when the request failed
+        without a response.
+        """
+        now = time.monotonic()
+        latency = now - started_at
+
+        with self.__condition:
+            self.in_flight -= 1
+            self.__observe(latency)
+
+            if status_code is None or status_code in RETRYABLE_STATUS_CODES:
+                if now - self.__last_decrease >= self.latency:
+                    self.limit = max(self.limit * self.decrease_factor, self.min_limit)
+                    self.__last_decrease = now
+            elif latency <= self.baseline_latency * self.latency_tolerance:
+                self.limit = min(self.limit + 1 / self.limit, self.max_limit)
+
+            self.__condition.notify_all()
+            self.__wake_async_waiters()
+
+    def __observe(self, latency: float):
+        if self.latency is None:
+            self.latency = self.baseline_latency = latency
+            return
+
+        self.latency += (latency - self.latency) * self.smoothing
+        # the baseline follows improvements immediately and degradations slowly
+        self.baseline_latency = min(latency, self.baseline_latency + (self.latency - self.baseline_latency) * 0.01)
+
+    def __wake_async_waiters(self):
+        while self.__async_waiters:
+            waiter = self.__async_waiters.popleft()
+            if not waiter.done():
+                waiter.get_loop().call_soon_threadsafe(self.__set_waiter_result, waiter)
+
+    @staticmethod
+    def __set_waiter_result(waiter):
+        if not waiter.done():
+            waiter.set_result(None)
+
+    def __repr__(self):
+        return f"AdaptiveConcurrencyLimiter(limit={int(self.limit)}, in_flight={self.in_flight}, " \
+               f"latency={self.latency})"
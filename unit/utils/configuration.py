@@ -1,17 +1,69 @@
+import threading
+from urllib.parse import urlparse
+from typing import Union, Optional, Dict, Tuple, Callable
+
+from unit.utils.cache import ResponseCache
+from unit.utils.circuit_breaker import CircuitBreaker, CircuitBreakers
+from unit.utils.compression import TransferStats
+from unit.utils.concurrency import AdaptiveConcurrencyLimiter
+from unit.utils.deadline import remaining
+from unit.utils.hedging import HedgingPolicy
+from unit.utils.institution_cache import InstitutionCache
+from unit.utils.rate_limit import RateLimiter
+from unit.utils.raw import check_raw_format
+from unit.utils.retry import RetryPolicy
+from unit.utils.transport import Transport, AsyncTransport, AsyncHttpxTransport, Timeout, transports
+
+
 class Configuration(object):
-    def __init__(self, api_url, token, retries=0, timeout=120):
+    def __init__(self, api_url, token, retries=0, timeout=120, pool_connections=10, pool_maxsize=10,
+                 transport: Union[str, Transport] = "requests", async_transport: AsyncTransport = None,
+                 rate_limiter: Optional[RateLimiter] = None,
+                 concurrency_limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+                 connect_timeout: Optional[float] = 10, read_timeout: Optional[float] = 60,
+                 compression: bool = True, compress_requests_over: Optional[int] = None,
+                 on_transfer: Optional[Callable[[TransferStats], None]] = None, lazy_decoding: bool = False,
+                 raw_responses: Optional[str] = None, response_cache: Optional[ResponseCache] = None,
+                 institution_cache: Optional[InstitutionCache] = None):
         self.api_url = self.__check_api_url(api_url)
         self.token = self.__check_token(token)
         self.retries = self.__check_retries(retries)
         self.timeout = self.__check_timeout(timeout)
+        self.connect_timeout = self.__check_socket_timeout(connect_timeout, "connect_timeout")
+        self.read_timeout = self.__check_socket_timeout(read_timeout, "read_timeout")
+        self.pool_connections = self.__check_pool_size(pool_connections, "pool_connections")
+        self.pool_maxsize = self.__check_pool_size(pool_maxsize, "pool_maxsize")
+        self.transport = self.__check_transport(transport)
+        self.async_transport = async_transport
+        self.__transport = transport if isinstance(transport, Transport) else None
+        self.__async_transport = async_transport
+        self.__transport_lock = threading.Lock()
+        self.retry_policy = self.__create_retry_policy()
+        self.retry_policies: Dict[Tuple[Optional[str], Optional[str]], RetryPolicy] = {}
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self.concurrency_limiter = concurrency_limiter
+        self.circuit_breakers = CircuitBreakers()
+        self.hedging_policies: Dict[Optional[str], HedgingPolicy] = {}
+        self.compression = compression
+        self.compress_requests_over = compress_requests_over
+        self.on_transfer = on_transfer
+        self.lazy_decoding = lazy_decoding
+        self.raw_responses = check_raw_format(raw_responses)
+        self.response_cache = response_cache
+        self.institution_cache = institution_cache
 
     def get_headers(self):
-        return {
+        headers = {
             "content-type": "application/vnd.api+json",
             "authorization": f"Bearer {self.token}",
             "X-UNIT-SDK": f"unit-python-sdk@v0.25.0"
         }
 
+        # sent either way, so HTTP clients compressing by default (requests, httpx) are overridden too
+        headers["accept-encoding"] = "gzip, deflate" if self.compression else "identity"
+
+        return headers
+
     def set_api_url(self, api_url):
         self.api_url = self.__check_api_url(api_url)
 
@@ -20,9 +72,26 @@ class Configuration(object):
 
     def set_timeout(self, timeout):
         self.timeout = self.__check_timeout(timeout)
+        self.retry_policy = self.__create_retry_policy()
 
     def set_retries(self, retries):
         self.retries = self.__check_retries(retries)
+        self.retry_policy = self.__create_retry_policy()
+
+    def set_retry_policy(self, policy: RetryPolicy, resource: Optional[str] = None, method: Optional[str] = None):
+        if resource is None and method is None:
+            self.retry_policy = policy
+        else:
+            self.retry_policies[(resource, method)] = policy
+
+    def get_retry_policy(self, resource: Optional[str] = None, method: Optional[str] = None) -> RetryPolicy:
+        if self.retry_policies:
+            for key in ((resource, method), (resource, None), (None, method)):
+                policy = self.retry_policies.get(key)
+                if policy is not None:
+                    return policy
+
+        return self.retry_policy
 
     def get_tries(self):
         return self.retries + 1
@@ -36,6 +105,91 @@ class Configuration(object):
     def get_timeout(self):
         return self.timeout
 
+    def set_socket_timeouts(self, connect_timeout: Optional[float], read_timeout: Optional[float]):
+        self.connect_timeout = self.__check_socket_timeout(connect_timeout, "connect_timeout")
+        self.read_timeout = self.__check_socket_timeout(read_timeout, "read_timeout")
+
+    def get_socket_timeouts(self, deadline: Optional[float] = None) -> Timeout:
+        """
+        Returns the (connect, read) timeouts of a single attempt, shortened to what is left until `deadline`.
+        """
+        left = remaining(deadline)
+        if left is None:
+            return self.connect_timeout, self.read_timeout
+
+        left = max(left, 0.001)
+        return tuple(left if t is None else min(t, left) for t in (self.connect_timeout, self.read_timeout))
+
+    def set_hedging_policy(self, policy: Optional[HedgingPolicy], resource: Optional[str] = None):
+        if policy is None:
+            self.hedging_policies.pop(resource, None)
+        else:
+            self.hedging_policies[resource] = policy
+
+    def get_hedging_policy(self, resource: Optional[str] = None) -> Optional[HedgingPolicy]:
+        if not self.hedging_policies:
+            return None
+
+        return self.hedging_policies.get(resource) or self.hedging_policies.get(None)
+
+    def add_circuit_breaker(self, pattern: str, breaker: Optional[CircuitBreaker] = None,
+                            method: Optional[str] = None) -> CircuitBreaker:
+        breaker = breaker or CircuitBreaker()
+        self.circuit_breakers.add(pattern, breaker, method)
+        return breaker
+
+    def get_circuit_breaker(self, method: str, url: str) -> Optional[CircuitBreaker]:
+        if not self.circuit_breakers:
+            return None
+
+        path = url[len(self.api_url) + 1:] if url.startswith(self.api_url) else urlparse(url).path.lstrip("/")
+        return self.circuit_breakers.find(method, path)
+
+    def get_transport(self) -> Transport:
+        transport = self.__transport
+        if transport is None:
+            with self.__transport_lock:
+                if self.__transport is None:
+                    self.__transport = transports[self.transport](self.pool_connections, self.pool_maxsize)
+                transport = self.__transport
+
+        return transport
+
+    def get_async_transport(self) -> AsyncTransport:
+        transport = self.__async_transport
+        if transport is None:
+            with self.__transport_lock:
+                if self.__async_transport is None:
+                    self.__async_transport = AsyncHttpxTransport(self.pool_connections, self.pool_maxsize,
+                                                                 http2=self.transport == "http2")
+                transport = self.__async_transport
+
+        return transport
+
+    def close(self):
+        with self.__transport_lock:
+            transport = self.__transport
+            if not isinstance(self.transport, Transport):
+                self.__transport = None
+
+        if transport is not None:
+            transport.close()
+
+        for policy in self.hedging_policies.values():
+            policy.close()
+
+    async def aclose(self):
+        with self.__transport_lock:
+            transport = self.__async_transport
+            if self.async_transport is None:
+                self.__async_transport = None
+
+        if transport is not None:
+            await transport.close()
+
+    def __create_retry_policy(self):
+        return RetryPolicy(tries=self.get_tries(), max_time=self.timeout)
+
     @staticmethod
     def __check_timeout(seconds):
         try:
@@ -49,6 +203,22 @@ class Configuration(object):
 
         return i_seconds
 
+    @staticmethod
+    def __check_socket_timeout(seconds, name: str):
+        if seconds is None:
+            return None
+
+        try:
+            f_seconds = float(seconds)
+
+        except Exception as e:
+            raise Exception(f"{name} must be a number")
+
+        if f_seconds <= 0:
+            raise Exception(f"{name} must be greater than 0")
+
+        return f_seconds
+
     @staticmethod
     def __check_retries(retries):
         try:
@@ -62,6 +232,29 @@ class Configuration(object):
 
         return i_retries
 
+    @staticmethod
+    def __check_pool_size(size, name: str):
+        try:
+            i_size = int(size)
+
+        except Exception as e:
+            raise Exception(f"{name} must be an int")
+
+        if i_size < 1:
+            raise Exception(f"{name} must be 1 or greater")
+
+        return i_size
+
+    @staticmethod
+    def __check_transport(transport: Union[str, Transport]):
+        if isinstance(transport, Transport):
+            return transport
+
+        if transport not in transports:
+            raise Exception(f"transport must be a Transport or one of: {', '.join(transports.keys())}")
+
+        return transport
+
     @staticmethod
     def __check_api_url(api_url: str):
         if not api_url:
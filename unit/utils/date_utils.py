@@ -1,11 +1,27 @@
 from datetime import date, datetime
+from functools import lru_cache
+
+DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S.%f%z"
+
+
+@lru_cache(maxsize=4096)
+def parse_datetime(dt: str) -> datetime:
+    """
+    Parses the timestamps returned by the API, e.g. 2022-02-10T17:56:49.235Z, with datetime.fromisoformat, falling
+    back to strptime for the shapes older Python versions cannot read (such as fractions of other than 3 or 6 digits).
+    Timestamps repeat a lot within a page (createdAt/updatedAt of related resources), so results are cached.
+    """
+    try:
+        return datetime.fromisoformat(dt[:-1] + "+00:00" if dt[-1:] == "Z" else dt)
+    except ValueError:
+        return datetime.strptime(dt, DATETIME_FORMAT)
 
 
 def to_datetime(dt: str):
     if dt is None:
         return None
 
-    return datetime.strptime(dt, "%Y-%m-%dT%H:%M:%S.%f%z")
+    return parse_datetime(dt)
 
 def from_datetime(dt: datetime):
     return dt.isoformat(timespec='milliseconds') + "Z"
@@ -0,0 +1,32 @@
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+current_deadline: ContextVar[Optional[float]] = ContextVar("unit_deadline", default=None)
+
+
+class DeadlineExceeded(Exception):
+    def __init__(self, method: str, url: str):
+        super().__init__(f"deadline exceeded for {method} {url}")
+        self.method = method
+        self.url = url
+
+
+@contextmanager
+def deadline(seconds: float):
+    """
+    Bounds every API call made inside the block to `seconds` in total, including retries and the waits between them.
+    A nested deadline can only shorten the enclosing one.
+    """
+    expires_at = time.monotonic() + seconds
+    enclosing = current_deadline.get()
+    token = current_deadline.set(expires_at if enclosing is None else min(enclosing, expires_at))
+    try:
+        yield
+    finally:
+        current_deadline.reset(token)
+
+
+def remaining(expires_at: Optional[float]) -> Optional[float]:
+    return None if expires_at is None else expires_at - time.monotonic()
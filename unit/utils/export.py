@@ -0,0 +1,228 @@
+import asyncio
+import copy
+import json
+import math
+import os
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from datetime import datetime, timedelta, timezone
+from itertools import islice
+from typing import Iterator, List, Optional, Tuple
+
+from unit.utils import date_utils
+from unit.utils.pagination import next_page, page_total, paginate, paginate_async
+
+# windows shorter than this are scanned whatever their size
+MIN_WINDOW = timedelta(seconds=1)
+# the API filters by milliseconds
+ACCURACY = timedelta(milliseconds=1)
+
+
+def to_utc(dt: datetime) -> datetime:
+    dt = dt.replace(tzinfo=timezone.utc) if dt.tzinfo is None else dt.astimezone(timezone.utc)
+    return dt.replace(microsecond=dt.microsecond // 1000 * 1000)
+
+
+def filter_timestamp(dt: datetime) -> str:
+    return date_utils.from_datetime(dt.astimezone(timezone.utc).replace(tzinfo=None))
+
+
+def created_at(resource) -> datetime:
+    attributes = resource["attributes"] if isinstance(resource, dict) else resource.attributes
+    value = attributes["createdAt"]
+    return to_utc(date_utils.to_datetime(value) if isinstance(value, str) else value)
+
+
+class ExportCheckpoint(object):
+    """
+    JSON file recording how far an export got: every resource created before `completed_until` was yielded.
+    It is replaced atomically after every window, so a crashed export resumes after its last completed window.
+    """
+    def __init__(self, path: str):
+        self.path = path
+
+    def load(self, since: datetime, until: datetime) -> Tuple[Optional[datetime], int]:
+        try:
+            with open(self.path) as f:
+                state = json.load(f)
+        except FileNotFoundError:
+            return None, 0
+
+        if state["since"] != filter_timestamp(since) or state["until"] != filter_timestamp(until):
+            raise Exception(f"checkpoint {self.path} belongs to an export of another time range")
+
+        return to_utc(date_utils.to_datetime(state["completed_until"])), state["exported"]
+
+    def save(self, since: datetime, until: datetime, completed_until: datetime, exported: int):
+        path = f"{self.path}.tmp"
+        with open(path, "w") as f:
+            json.dump({"since": filter_timestamp(since), "until": filter_timestamp(until),
+                       "completed_until": filter_timestamp(completed_until), "exported": exported}, f)
+            f.flush()
+            os.fsync(f.fileno())
+
+        os.replace(path, self.path)
+
+
+class ShardedExport(object):
+    """
+    Exports every resource of a list endpoint created in [since, until) by scanning consecutive time windows
+    concurrently, on `workers` threads (or tasks with an asyncio resource), and yielding them in createdAt order.
+    The first windows are `window` long, the next ones are sized from the density observed so far to hold about half
+    of `window_size` resources, and a window holding more than `window_size` is split again, so no scan pages deeper
+    than that. With a `checkpoint` file the end of every window whose resources were all yielded is recorded, and an
+    export of the same range started again with that file resumes after it.
+    """
+    def __init__(self, resource, since: datetime, until: datetime, params=None, window: timedelta = timedelta(hours=1),
+                 window_size: int = 10000, workers: int = 4, checkpoint: Optional[str] = None):
+        self.resource = resource
+        self.since = to_utc(since)
+        self.until = to_utc(until)
+        self.params = resource.first_page(params)
+        self.window = window
+        self.window_size = window_size
+        self.workers = workers
+        self.checkpoint = ExportCheckpoint(checkpoint) if checkpoint else None
+        self.exported = 0
+        self.density: Optional[float] = None
+        self.__lock = threading.Lock()
+
+    def __iter__(self) -> Iterator:
+        windows = self.windows(self.resume())
+        executor = ThreadPoolExecutor(self.workers, thread_name_prefix="unit-export")
+        pending = deque()
+        try:
+            while True:
+                for window in islice(windows, self.workers - len(pending)):
+                    pending.append((window, executor.submit(copy_context().run, self.scan, *window)))
+
+                if not pending:
+                    return
+
+                (_, until), future = pending.popleft()
+                resources = future.result()
+                yield from resources
+                self.completed(until, len(resources))
+        finally:
+            for _, future in pending:
+                future.cancel()
+            executor.shutdown(wait=False)
+
+    async def __aiter__(self):
+        windows = self.windows(self.resume())
+        pending = deque()
+        try:
+            while True:
+                for window in islice(windows, self.workers - len(pending)):
+                    pending.append((window, asyncio.ensure_future(self.scan_async(*window))))
+
+                if not pending:
+                    return
+
+                (_, until), task = pending.popleft()
+                resources = await task
+                for resource in resources:
+                    yield resource
+                self.completed(until, len(resources))
+        finally:
+            tasks = [task for _, task in pending]
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def resume(self) -> datetime:
+        if self.checkpoint is None:
+            return self.since
+
+        completed_until, self.exported = self.checkpoint.load(self.since, self.until)
+        return completed_until or self.since
+
+    def completed(self, until: datetime, count: int):
+        self.exported += count
+        if self.checkpoint is not None:
+            self.checkpoint.save(self.since, self.until, until, self.exported)
+
+    def windows(self, start: datetime) -> Iterator[Tuple[datetime, datetime]]:
+        # windows are cut only when a worker is free, so each is sized from the latest density
+        while start < self.until:
+            end = min(start + self.next_duration(), self.until)
+            yield start, end
+            start = end
+
+    def next_duration(self) -> timedelta:
+        with self.__lock:
+            density = self.density
+
+        if density is None:
+            return self.window
+
+        if density == 0:
+            return self.window * 2
+
+        return max(timedelta(milliseconds=math.ceil(self.window_size / 2 / density * 1000)), MIN_WINDOW)
+
+    def observe(self, total: int, duration: timedelta):
+        density = total / max(duration.total_seconds(), 0.001)
+        with self.__lock:
+            self.density = density if self.density is None else (self.density + density) / 2
+
+    def split(self, since: datetime, until: datetime, total: int) -> List[Tuple[datetime, datetime]]:
+        pieces = math.ceil(total * 2 / self.window_size)
+        step = timedelta(milliseconds=math.ceil((until - since) / timedelta(milliseconds=1) / pieces))
+        bounds = [min(since + step * i, until) for i in range(pieces + 1)]
+        return [(start, end) for start, end in zip(bounds, bounds[1:]) if start < end]
+
+    def window_params(self, since: datetime, until: datetime):
+        # the API may treat either bound as exclusive: query 1ms wider on both sides, so a resource created exactly
+        # on a window boundary is listed by both windows and window_resources() keeps it in one of them
+        params = copy.copy(self.params)
+        params.since = filter_timestamp(since - ACCURACY)
+        params.until = filter_timestamp(until + ACCURACY)
+        params.offset = 0
+        return params
+
+    def should_split(self, since: datetime, until: datetime, response) -> bool:
+        total = page_total(response)
+        if total is None:
+            return False
+
+        self.observe(total, until - since)
+        return total > self.window_size and until - since >= MIN_WINDOW * 2
+
+    def scan(self, since: datetime, until: datetime) -> List:
+        params = self.window_params(since, until)
+        response = self.resource.list(params)
+        data, params = next_page(params, response)
+        if self.should_split(since, until, response):
+            return [r for window in self.split(since, until, page_total(response)) for r in self.scan(*window)]
+
+        resources = list(data)
+        if params is not None:
+            resources.extend(paginate(self.resource.list, params))
+
+        return self.window_resources(since, until, resources)
+
+    async def scan_async(self, since: datetime, until: datetime) -> List:
+        params = self.window_params(since, until)
+        response = await self.resource.list(params)
+        data, params = next_page(params, response)
+        if self.should_split(since, until, response):
+            resources = []
+            for window in self.split(since, until, page_total(response)):
+                resources.extend(await self.scan_async(*window))
+            return resources
+
+        resources = list(data)
+        if params is not None:
+            resources.extend([resource async for resource in paginate_async(self.resource.list, params)])
+
+        return self.window_resources(since, until, resources)
+
+    @staticmethod
+    def window_resources(since: datetime, until: datetime, resources: List) -> List:
+        # whatever the API does at the bounds of the filters, every resource belongs to exactly one window
+        resources = [resource for resource in resources if since <= created_at(resource) < until]
+        resources.sort(key=created_at)
+        return resources
@@ -0,0 +1,143 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextvars import copy_context
+from typing import Optional
+
+
+def close_response(future):
+    if not future.cancelled() and future.exception() is None:
+        close = getattr(future.result(), "close", None)
+        if close is not None:
+            close()
+
+
+class HedgingPolicy(object):
+    """
+    Hedges idempotent GET requests: when a request is slower than the `percentile` of recently observed latencies,
+    a duplicate is sent on another pooled connection and whichever answers first wins. At most `budget` of all
+    requests are hedged. Requests and their hedges are sent from a pool of `max_workers` threads, so it should be at
+    least twice the number of concurrent GETs of the hedged resources; latencies are measured from the moment a
+    request is actually sent, so time spent waiting for a free thread is neither recorded nor delays the hedge.
+    """
+    def __init__(self, percentile: float = 95, budget: float = 0.05, min_delay: float = 0.005,
+                 min_samples: int = 20, window_size: int = 1000, max_workers: int = 32):
+        self.percentile = percentile
+        self.budget = budget
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.latencies = deque(maxlen=window_size)
+        self.requests = 0
+        self.hedged_requests = 0
+        self.max_workers = max_workers
+        self.__delay: Optional[float] = None
+        self.__executor: Optional[ThreadPoolExecutor] = None
+        self.__lock = threading.Lock()
+
+    def delay(self) -> Optional[float]:
+        """
+        Seconds to wait for the first response before hedging, or None until enough latencies were observed.
+        """
+        with self.__lock:
+            if self.__delay is None and len(self.latencies) >= self.min_samples:
+                latencies = sorted(self.latencies)
+                index = min(int(len(latencies) * self.percentile / 100), len(latencies) - 1)
+                self.__delay = max(latencies[index], self.min_delay)
+
+            return self.__delay
+
+    def record(self, latency: float):
+        with self.__lock:
+            self.latencies.append(latency)
+            # recompute the percentile every few samples instead of on every request
+            if len(self.latencies) % 10 == 0:
+                self.__delay = None
+
+    def spend(self) -> bool:
+        with self.__lock:
+            if self.hedged_requests + 1 > self.budget * self.requests:
+                return False
+
+            self.hedged_requests += 1
+            return True
+
+    def call(self, send, *args):
+        with self.__lock:
+            self.requests += 1
+            if self.__executor is None:
+                self.__executor = ThreadPoolExecutor(self.max_workers, thread_name_prefix="unit-hedging")
+            executor = self.__executor
+
+        delay = self.delay()
+        started = threading.Event()
+        primary = executor.submit(copy_context().run, self.__timed(send, started), *args)
+        if delay is not None:
+            # the hedge delay starts when the primary request is sent, not while it waits for a free thread
+            started.wait()
+
+        if delay is None or not wait([primary], timeout=delay).not_done or not self.spend():
+            return primary.result()
+
+        hedge = executor.submit(copy_context().run, self.__timed(send, threading.Event()), *args)
+        done, _ = wait([primary, hedge], return_when=FIRST_COMPLETED)
+        winner, loser = (primary, hedge) if primary in done else (hedge, primary)
+
+        if winner.exception() is not None:
+            # the first request to finish failed, so the answer is whatever the other one returns
+            return loser.result()
+
+        if not loser.cancel():
+            loser.add_done_callback(close_response)
+
+        return winner.result()
+
+    async def call_async(self, send, *args):
+        with self.__lock:
+            self.requests += 1
+
+        delay = self.delay()
+        primary = asyncio.ensure_future(send(*args))
+        primary.add_done_callback(self.__latency_recorder(time.monotonic()))
+
+        if delay is None:
+            return await primary
+
+        done, _ = await asyncio.wait([primary], timeout=delay)
+        if done or not self.spend():
+            return await primary
+
+        hedge = asyncio.ensure_future(send(*args))
+        done, _ = await asyncio.wait([primary, hedge], return_when=asyncio.FIRST_COMPLETED)
+        winner, loser = (primary, hedge) if primary in done else (hedge, primary)
+
+        if winner.exception() is not None:
+            return await loser
+
+        loser.cancel()
+        return winner.result()
+
+    def __timed(self, send, started: threading.Event):
+        def timed(*args):
+            started.set()
+            started_at = time.monotonic()
+            response = send(*args)
+            self.record(time.monotonic() - started_at)
+            return response
+
+        return timed
+
+    def __latency_recorder(self, started_at: float):
+        def record(future):
+            if not future.cancelled() and future.exception() is None:
+                self.record(time.monotonic() - started_at)
+
+        return record
+
+    def close(self):
+        with self.__lock:
+            executor, self.__executor = self.__executor, None
+
+        if executor is not None:
+            executor.shutdown(wait=False)
@@ -0,0 +1,131 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Iterable, List, Optional
+
+
+class InstitutionCache(object):
+    """
+    Persistent store of institution responses keyed by routing number, in a SQLite database that survives restarts
+    and is shared by every process and thread opening the same `path`. Entries expire `ttl` seconds (30 days by
+    default) after they were fetched. The database is opened in WAL mode so readers never wait for a writer, and
+    every thread of every process uses its own connection; close() closes them all.
+    """
+    def __init__(self, path: str, ttl: float = 30 * 24 * 3600, busy_timeout: float = 30):
+        if not path or path == ":memory:" or path.startswith("file::memory:"):
+            raise Exception("the institution cache must be a database file, in-memory databases are not shared "
+                            "between connections")
+
+        self.path = path
+        self.ttl = ttl
+        self.busy_timeout = busy_timeout
+        self.hits = 0
+        self.misses = 0
+        self.__local = threading.local()
+        self.__connections: List[sqlite3.Connection] = []
+        self.__pid = os.getpid()
+        self.__generation = 0
+        self.__lock = threading.Lock()
+        self.__connection().execute("CREATE TABLE IF NOT EXISTS institutions (routing_number TEXT PRIMARY KEY, "
+                                    "content BLOB NOT NULL, fetched_at REAL NOT NULL)")
+
+    def __connection(self) -> sqlite3.Connection:
+        # connections cannot be shared across threads, nor inherited by a forked process
+        local = self.__local
+        connection = getattr(local, "connection", None)
+        if connection is None or local.pid != os.getpid() or local.generation != self.__generation:
+            # check_same_thread=False only so that close() can close the connections of other threads
+            connection = sqlite3.connect(self.path, timeout=self.busy_timeout, isolation_level=None,
+                                         check_same_thread=False)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            with self.__lock:
+                if self.__pid != os.getpid():
+                    # the connections listed were opened by the parent process
+                    self.__connections, self.__pid = [], os.getpid()
+                self.__connections.append(connection)
+                local.connection, local.pid, local.generation = connection, os.getpid(), self.__generation
+
+        return connection
+
+    def __write(self, sql: str, params, many: bool = False) -> int:
+        connection = self.__connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            cursor = connection.executemany(sql, params) if many else connection.execute(sql, params)
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+        return cursor.rowcount
+
+    def get(self, routing_number: str) -> Optional[bytes]:
+        """
+        Returns the cached response body of the institution, or None when it is missing or expired.
+        """
+        row = self.__connection().execute(
+            "SELECT content FROM institutions WHERE routing_number = ? AND fetched_at > ?",
+            (routing_number, time.time() - self.ttl)).fetchone()
+        with self.__lock:
+            if row is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+
+        return None if row is None else row[0]
+
+    def put(self, routing_number: str, content: bytes):
+        self.put_many({routing_number: content})
+
+    def put_many(self, contents: Dict[str, bytes]):
+        now = time.time()
+        self.__write("INSERT OR REPLACE INTO institutions VALUES (?, ?, ?)",
+                     [(routing_number, content, now) for routing_number, content in contents.items()], many=True)
+
+    def missing(self, routing_numbers: Iterable[str]) -> List[str]:
+        """
+        Returns the routing numbers that are not cached or expired, in order and without duplicates.
+        """
+        routing_numbers = list(dict.fromkeys(routing_numbers))
+        fresh = set()
+        connection = self.__connection()
+        # stay below SQLite's limit of 999 variables per statement
+        for i in range(0, len(routing_numbers), 900):
+            chunk = routing_numbers[i:i + 900]
+            rows = connection.execute(
+                f"SELECT routing_number FROM institutions WHERE routing_number IN ({','.join('?' * len(chunk))}) "
+                f"AND fetched_at > ?", (*chunk, time.time() - self.ttl))
+            fresh.update(row[0] for row in rows)
+
+        return [routing_number for routing_number in routing_numbers if routing_number not in fresh]
+
+    def invalidate(self, routing_number: Optional[str] = None):
+        """
+        Drops the institution of `routing_number`, or every institution.
+        """
+        if routing_number is None:
+            self.__write("DELETE FROM institutions", ())
+        else:
+            self.__write("DELETE FROM institutions WHERE routing_number = ?", (routing_number,))
+
+    def purge_expired(self) -> int:
+        return self.__write("DELETE FROM institutions WHERE fetched_at <= ?", (time.time() - self.ttl,))
+
+    def __len__(self):
+        return self.__connection().execute("SELECT COUNT(*) FROM institutions").fetchone()[0]
+
+    def close(self):
+        """
+        Closes the connections opened by every thread of this process; the cache reconnects when used again.
+        """
+        with self.__lock:
+            connections, self.__connections = self.__connections, []
+            self.__generation += 1
+
+        for connection in connections:
+            connection.close()
+
+    def __repr__(self):
+        return f"InstitutionCache(path={self.path!r}, hits={self.hits}, misses={self.misses})"
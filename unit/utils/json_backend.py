@@ -0,0 +1,47 @@
+import importlib
+import json
+import os
+
+BACKENDS = ("orjson", "ujson", "json")
+
+
+def stdlib_dumps(obj, default=None):
+    return json.dumps(obj, default=default)
+
+
+def orjson_dumps(module):
+    option = module.OPT_NON_STR_KEYS
+
+    def dumps(obj, default=None):
+        return module.dumps(obj, default=default, option=option)
+
+    return dumps
+
+
+def load_backend(name: str = None):
+    """
+    Returns the name and the `loads`/`dumps` functions of the JSON library used for API payloads: the one named by the
+    UNIT_JSON_BACKEND environment variable, otherwise the fastest installed one. Only orjson replaces the standard
+    library for encoding; its `dumps` returns UTF-8 bytes.
+    """
+    name = name or os.environ.get("UNIT_JSON_BACKEND")
+    if name:
+        if name not in BACKENDS:
+            raise Exception(f"UNIT_JSON_BACKEND must be one of: {', '.join(BACKENDS)}")
+
+        candidates = [name]
+    else:
+        candidates = BACKENDS
+
+    for candidate in candidates:
+        try:
+            module = importlib.import_module(candidate)
+        except ImportError:
+            if name:
+                raise
+            continue
+
+        return candidate, module.loads, orjson_dumps(module) if candidate == "orjson" else stdlib_dumps
+
+
+backend, loads, dumps = load_backend()
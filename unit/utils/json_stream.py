@@ -0,0 +1,175 @@
+import codecs
+import json
+import re
+from typing import Dict, List
+
+WHITESPACE = re.compile(r"[ \t\n\r]*")
+STRUCTURE = re.compile(r'["{}\[\]]')
+STRING_END = re.compile(r'["\\]')
+STRING = re.compile(r'"[^"\\]*(?:\\.[^"\\]*)*"')
+
+# what the parser expects next
+OBJECT = "object"
+MEMBER = "member"
+COLON = "colon"
+VALUE = "value"
+ARRAY = "array"
+DONE = "done"
+
+
+class JsonApiStreamParser(object):
+    """
+    Incremental parser of a JSON:API document received in chunks. feed() returns the resources of the top-level
+    `data` array completed by a chunk, so only the resource being received is held in memory rather than the whole
+    page; the other top-level members (included, meta, ...) are parsed into `members`, each once complete.
+    Built on json.JSONDecoder.raw_decode, as the other JSON backends cannot resume parsing mid-document. Top-level
+    arrays are decoded one element at a time, and an object or array cut by the end of a chunk is scanned for its
+    closing bracket across chunks before being decoded again, so no value is decoded more than twice.
+    """
+    def __init__(self, key: str = "data"):
+        self.key = key
+        self.members: Dict[str, object] = {}
+        self.__text = codecs.getincrementaldecoder("utf-8")()
+        self.__decoder = json.JSONDecoder()
+        self.__buffer = ""
+        self.__state = OBJECT
+        self.__member = None
+        self.__elements = None
+        # how far the object or array being received was scanned, and the nesting and string state at that point
+        self.__scanned = 0
+        self.__depth = 0
+        self.__in_string = False
+
+    def feed(self, chunk: bytes) -> List[Dict]:
+        self.__buffer += self.__text.decode(chunk)
+        return self.__parse(False)
+
+    def close(self) -> List[Dict]:
+        """
+        Parses the rest of the document once the last chunk was fed.
+        """
+        self.__buffer += self.__text.decode(b"", final=True)
+        resources = self.__parse(True)
+        if self.__state != DONE or self.__buffer.strip():
+            raise ValueError("the response body is not a complete JSON object")
+
+        return resources
+
+    def __parse(self, final: bool) -> List[Dict]:
+        resources = []
+        buffer = self.__buffer
+        pos = 0
+
+        while self.__state != DONE:
+            pos = WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                break
+
+            char = buffer[pos]
+            if self.__state == OBJECT:
+                if char != "{":
+                    raise ValueError(f"expected a JSON object at {char!r}")
+                self.__state, pos = MEMBER, pos + 1
+            elif self.__state == MEMBER:
+                if char == "}":
+                    self.__state, pos = DONE, pos + 1
+                elif char == ",":
+                    pos += 1
+                else:
+                    self.__member, end = self.__decode(buffer, pos, final)
+                    if end is None:
+                        break
+                    self.__state, pos = COLON, end
+            elif self.__state == COLON:
+                if char != ":":
+                    raise ValueError(f"expected ':' after {self.__member!r}")
+                self.__state, pos = VALUE, pos + 1
+            elif self.__state == VALUE and char == "[":
+                # arrays (data, included) are decoded one element at a time
+                self.__state, self.__elements, pos = ARRAY, [], pos + 1
+            elif self.__state == ARRAY and char in ",]":
+                if char == "]":
+                    if self.__member != self.key:
+                        self.members[self.__member] = self.__elements
+                    self.__state, self.__elements = MEMBER, None
+                pos += 1
+            else:
+                value, end = self.__decode(buffer, pos, final)
+                if end is None:
+                    break
+
+                if self.__member == self.key and (self.__state == ARRAY or isinstance(value, dict)):
+                    resources.append(value)
+                elif self.__state == ARRAY:
+                    self.__elements.append(value)
+                else:
+                    self.members[self.__member] = value
+
+                if self.__state == VALUE:
+                    self.__state = MEMBER
+                pos = end
+
+        self.__buffer = buffer[pos:]
+        return resources
+
+    def __closed(self, buffer: str, start: int) -> bool:
+        """
+        Scans the object or array starting at `start` from where the previous chunk left off and returns whether it
+        was closed.
+        """
+        pos, depth, in_string = start + self.__scanned, self.__depth, self.__in_string
+        while True:
+            if in_string:
+                match = STRING_END.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                if match.group() == "\\":
+                    if match.end() == len(buffer):
+                        # the escaped character is in the next chunk, scan the backslash again with it
+                        pos = match.start()
+                        break
+                    pos = match.end() + 1
+                    continue
+                in_string, pos = False, match.end()
+            else:
+                match = STRUCTURE.search(buffer, pos)
+                if match is None:
+                    pos = len(buffer)
+                    break
+                char, pos = match.group(), match.end()
+                if char == '"':
+                    string = STRING.match(buffer, match.start())
+                    if string is None:
+                        in_string = True
+                    else:
+                        pos = string.end()
+                elif char in "{[":
+                    depth += 1
+                else:
+                    depth -= 1
+                    if depth == 0:
+                        self.__scanned, self.__depth, self.__in_string = 0, 0, False
+                        return True
+
+        self.__scanned, self.__depth, self.__in_string = pos - start, depth, in_string
+        return False
+
+    def __decode(self, buffer: str, pos: int, final: bool):
+        container = buffer[pos] in "{["
+        if container and self.__scanned and not final and not self.__closed(buffer, pos):
+            return None, None
+
+        try:
+            value, end = self.__decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # an object or array cut by the end of the chunk is scanned from then on, and decoded once closed
+            if final or (container and self.__closed(buffer, pos)):
+                raise
+            return None, None
+
+        # a number cut by the end of the chunk decodes too, so a value is only complete once something follows it
+        if end == len(buffer) and not final and not container:
+            return None, None
+
+        return value, end
@@ -0,0 +1,157 @@
+import asyncio
+import copy
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from contextvars import copy_context
+from typing import AsyncIterator, Callable, Iterator, List, Optional, Tuple
+
+from unit.models import UnitError
+
+
+class PaginationError(Exception):
+    def __init__(self, error: UnitError, offset: int):
+        super().__init__(f"listing the page at offset {offset} failed: {error}")
+        self.error = error
+        self.offset = offset
+
+
+def page_total(response) -> Optional[int]:
+    return ((response.meta or {}).get("pagination") or {}).get("total")
+
+
+def following_page(params):
+    params = copy.copy(params)
+    params.offset += params.limit
+    return params
+
+
+def next_page(params, response) -> Tuple[List, Optional[object]]:
+    """
+    Returns the resources of the page listed with `params` and the params of the next page, or None after the last
+    page: a page shorter than `params.limit` or reaching the pagination total of the response meta.
+    """
+    if isinstance(response, UnitError):
+        raise PaginationError(response, params.offset)
+
+    data = response.data or []
+    if isinstance(data, bytes):
+        raise Exception("raw bytes responses cannot be paginated")
+
+    offset = params.offset + len(data)
+    total = page_total(response)
+    if not data or len(data) < params.limit or (total is not None and offset >= total):
+        return data, None
+
+    params = copy.copy(params)
+    params.offset = offset
+    return data, params
+
+
+def paginate(list_page: Callable, params) -> Iterator:
+    while params is not None:
+        data, params = next_page(params, list_page(params))
+        yield from data
+
+
+async def paginate_async(list_page: Callable, params) -> AsyncIterator:
+    while params is not None:
+        data, params = next_page(params, await list_page(params))
+        for resource in data:
+            yield resource
+
+
+class PagePlan(object):
+    """
+    Plans the pages fetched ahead by a prefetching paginator: consecutive offsets from the params of the first page,
+    up to `window` pages ahead of the one being consumed and never past meta.pagination.total once a response told
+    it. Only the first page is requested until it was received, so a result that fits in one page costs one request.
+    """
+    def __init__(self, params, window: int):
+        self.window = window
+        self.total: Optional[int] = None
+        self.started = False
+        self.__next = params
+
+    def next(self, in_flight: int):
+        """
+        Returns the params of the next page to request, or None when no more pages should be requested now.
+        """
+        limit = self.window + 1 if self.started else 1
+        if self.__next is None or in_flight >= limit or (self.total is not None and self.__next.offset >= self.total):
+            return None
+
+        params, self.__next = self.__next, following_page(self.__next)
+        return params
+
+    def received(self, response):
+        self.started = True
+        if not isinstance(response, UnitError) and page_total(response) is not None:
+            self.total = page_total(response)
+
+
+def prefetch(list_page: Callable, params, window: int, workers: Optional[int] = None) -> Iterator:
+    """
+    Like paginate(), but fetches up to `window` pages ahead on `workers` threads (`window` by default) while the
+    current page is being consumed. Resources are still yielded in order.
+    """
+    plan = PagePlan(params, window)
+    executor = ThreadPoolExecutor(workers or window, thread_name_prefix="unit-prefetch")
+    pending = deque()
+    try:
+        while True:
+            planned = plan.next(len(pending))
+            while planned is not None:
+                # every page runs in a copy of the caller's context, so deadlines and raw responses still apply
+                pending.append((planned, executor.submit(copy_context().run, list_page, planned)))
+                planned = plan.next(len(pending))
+
+            if not pending:
+                return
+
+            page_params, future = pending.popleft()
+            response = future.result()
+            plan.received(response)
+            data, next_params = next_page(page_params, response)
+            yield from data
+
+            if next_params is None:
+                return
+    finally:
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=False)
+
+
+async def prefetch_async(list_page: Callable, params, window: int, workers: Optional[int] = None) -> AsyncIterator:
+    plan = PagePlan(params, window)
+    semaphore = asyncio.Semaphore(workers or window)
+    pending = deque()
+
+    async def fetch(page_params):
+        async with semaphore:
+            return await list_page(page_params)
+
+    try:
+        while True:
+            planned = plan.next(len(pending))
+            while planned is not None:
+                pending.append((planned, asyncio.ensure_future(fetch(planned))))
+                planned = plan.next(len(pending))
+
+            if not pending:
+                return
+
+            page_params, task = pending.popleft()
+            response = await task
+            plan.received(response)
+            data, next_params = next_page(page_params, response)
+            for resource in data:
+                yield resource
+
+            if next_params is None:
+                return
+    finally:
+        tasks = [task for _, task in pending]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
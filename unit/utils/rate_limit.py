@@ -0,0 +1,132 @@
+import asyncio
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Optional
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        return None
+
+
+def parse_reset(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+
+    try:
+        reset = float(value)
+    except ValueError:
+        return None
+
+    # some APIs send the epoch second the window resets at, others the seconds left in the window
+    if reset > 1e9:
+        reset -= time.time()
+
+    return max(reset, 0)
+
+
+def get_header(headers, *names: str) -> Optional[str]:
+    for name in names:
+        value = headers.get(name)
+        if value is not None:
+            return value
+
+    return None
+
+
+class RateLimiter(object):
+    """
+    Client-side token bucket shared by every resource of a Unit instance.
+    Without a fixed `rate` it lets requests through until the API reports its limits, then paces requests so the
+    remaining budget lasts until the window resets, and holds every request while a Retry-After is in effect.
+    """
+    def __init__(self, rate: Optional[float] = None, burst: int = 10, learn: bool = True):
+        self.rate = rate
+        self.burst = burst
+        self.learn = learn
+        self.tokens = float(burst)
+        self.blocked_until = 0.0
+        self.__updated_at = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def reserve(self, timeout: Optional[float] = None) -> Optional[float]:
+        """
+        Takes a token and returns how many seconds the caller has to wait before sending its request, or None without
+        taking it when that wait would not end within `timeout` seconds.
+        """
+        with self.__lock:
+            now = time.monotonic()
+            wait = max(self.blocked_until - now, 0)
+
+            if self.rate:
+                self.tokens = min(self.tokens + (now - self.__updated_at) * self.rate, self.burst)
+                self.tokens -= 1
+                if self.tokens < 0:
+                    wait = max(wait, -self.tokens / self.rate)
+
+            self.__updated_at = now
+            if timeout is not None and wait >= timeout:
+                if self.rate:
+                    self.tokens += 1
+                return None
+
+            return wait
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        """
+        Waits until the caller may send its request; returns False right away when it could not within `timeout`.
+        """
+        wait = self.reserve(timeout)
+        if wait is None:
+            return False
+
+        if wait > 0:
+            time.sleep(wait)
+        return True
+
+    async def acquire_async(self, timeout: Optional[float] = None) -> bool:
+        wait = self.reserve(timeout)
+        if wait is None:
+            return False
+
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return True
+
+    def update(self, response):
+        if not self.learn:
+            return
+
+        headers = response.headers
+        retry_after = parse_retry_after(get_header(headers, "Retry-After"))
+        remaining = get_header(headers, "X-RateLimit-Remaining", "RateLimit-Remaining")
+        reset = parse_reset(get_header(headers, "X-RateLimit-Reset", "RateLimit-Reset"))
+
+        if retry_after is None and remaining is None:
+            return
+
+        with self.__lock:
+            now = time.monotonic()
+
+            if retry_after is not None:
+                self.blocked_until = max(self.blocked_until, now + retry_after)
+
+            if remaining is not None and reset is not None and remaining.isdigit():
+                remaining = int(remaining)
+                if remaining == 0:
+                    self.blocked_until = max(self.blocked_until, now + reset)
+                else:
+                    self.rate = remaining / max(reset, 1)
+                    self.tokens = min(self.tokens, remaining)
+                    self.__updated_at = now
@@ -0,0 +1,28 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Optional
+
+RAW_FORMATS = ("json", "bytes")
+
+current_raw_format: ContextVar[Optional[str]] = ContextVar("unit_raw_format", default=None)
+
+
+def check_raw_format(raw_format: Optional[str]) -> Optional[str]:
+    if raw_format is not None and raw_format not in RAW_FORMATS:
+        raise Exception(f"raw responses must be one of: {', '.join(RAW_FORMATS)}")
+
+    return raw_format
+
+
+@contextmanager
+def raw_responses(raw_format: str = "json"):
+    """
+    Skips decoding into DTOs for the API calls made inside the block: with "json" the data, included and meta of a
+    response are the parsed JSON:API dicts and lists, with "bytes" `data` is the response body as received.
+    Errors are still decoded into a UnitError and retries are unchanged.
+    """
+    token = current_raw_format.set(check_raw_format(raw_format))
+    try:
+        yield
+    finally:
+        current_raw_format.reset(token)
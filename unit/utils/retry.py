@@ -0,0 +1,105 @@
+import asyncio
+import time
+from typing import Callable, FrozenSet, Iterable, Optional
+
+import backoff
+
+from unit.utils.deadline import remaining
+from unit.utils.rate_limit import parse_retry_after
+
+RETRYABLE_STATUS_CODES = frozenset([408, 429] + list(range(500, 600)))
+
+
+class RetryPolicy(object):
+    """
+    Retry loop for a single API call, built once and shared by every request it applies to.
+    Mirrors backoff.on_predicate(backoff.expo, ...): up to `tries` attempts within `max_time` seconds,
+    waiting exponentially longer (plus jitter) between attempts that returned a retryable status code,
+    unless the API asked for a specific delay with a Retry-After header.
+    A call given a `deadline` (a time.monotonic() timestamp) gives up once the next attempt could not start before it.
+    """
+    def __init__(self, tries: int = 1, max_time: Optional[float] = 120,
+                 retry_status_codes: Iterable[int] = RETRYABLE_STATUS_CODES,
+                 jitter: Optional[Callable[[float], float]] = backoff.random_jitter, base: float = 2,
+                 factor: float = 1, max_value: Optional[float] = None):
+        self.tries = tries
+        self.max_time = max_time
+        self.retry_status_codes: FrozenSet[int] = frozenset(retry_status_codes)
+        self.jitter = jitter
+        self.base = base
+        self.factor = factor
+        self.max_value = max_value
+
+    def should_retry(self, response) -> bool:
+        return response.status_code in self.retry_status_codes
+
+    def with_overrides(self, **kwargs) -> "RetryPolicy":
+        params = dict(tries=self.tries, max_time=self.max_time, retry_status_codes=self.retry_status_codes,
+                      jitter=self.jitter, base=self.base, factor=self.factor, max_value=self.max_value)
+        params.update(kwargs)
+        return RetryPolicy(**params)
+
+    def waits(self):
+        wait = backoff.expo(base=self.base, factor=self.factor, max_value=self.max_value)
+        wait.send(None)
+        return wait
+
+    def next_wait(self, waits, response, elapsed: float, left: Optional[float] = None) -> Optional[float]:
+        """
+        Returns the number of seconds to wait before the next attempt, or None when the call should give up.
+        """
+        if self.max_time is not None and elapsed >= self.max_time:
+            return None
+
+        seconds = parse_retry_after(response.headers.get("Retry-After"))
+        if seconds is None:
+            seconds = next(waits)
+            if self.jitter is not None:
+                seconds = self.jitter(seconds)
+
+        if self.max_time is not None:
+            seconds = min(seconds, max(self.max_time - elapsed, 0))
+
+        if left is not None and seconds >= left:
+            return None
+
+        return seconds
+
+    def call(self, send, *args, deadline: Optional[float] = None, **kwargs):
+        start = time.monotonic()
+        waits = None
+
+        for attempt in range(1, self.tries + 1):
+            response = send(*args, **kwargs)
+            if attempt == self.tries or not self.should_retry(response):
+                return response
+
+            waits = waits or self.waits()
+            seconds = self.next_wait(waits, response, time.monotonic() - start, remaining(deadline))
+            if seconds is None:
+                return response
+
+            time.sleep(seconds)
+
+    async def call_async(self, send, *args, deadline: Optional[float] = None, **kwargs):
+        start = time.monotonic()
+        waits = None
+
+        for attempt in range(1, self.tries + 1):
+            response = await send(*args, **kwargs)
+            if attempt == self.tries or not self.should_retry(response):
+                return response
+
+            waits = waits or self.waits()
+            seconds = self.next_wait(waits, response, time.monotonic() - start, remaining(deadline))
+            if seconds is None:
+                return response
+
+            await asyncio.sleep(seconds)
+
+    def __repr__(self):
+        return f"RetryPolicy(tries={self.tries}, max_time={self.max_time}, " \
+               f"retry_status_codes={sorted(self.retry_status_codes)}, jitter={self.jitter})"
+
+
+NO_RETRY = RetryPolicy(tries=1)
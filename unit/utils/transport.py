@@ -0,0 +1,267 @@
+from typing import Optional, Dict, Tuple, Iterator, AsyncIterator
+from urllib.parse import urlencode
+
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
+
+from unit.utils import json_backend
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+
+def encode_params(params: Optional[Dict]):
+    if not params:
+        return None
+
+    # keep the query string requests sends: drop None and render booleans as "True"/"False"
+    return dict((k, str(v) if isinstance(v, bool) else v) for k, v in params.items() if v is not None)
+
+
+# (connect, read) socket timeouts in seconds, None meaning no limit
+Timeout = Tuple[Optional[float], Optional[float]]
+
+
+def require_httpx(feature: str, extra: str):
+    if httpx is None:
+        raise Exception(f"httpx is required for {feature}, install it with: pip install unit-python-sdk[{extra}]")
+
+
+def httpx_timeout(timeout: Optional[Timeout]):
+    if timeout is None:
+        return httpx.USE_CLIENT_DEFAULT
+
+    connect, read = timeout
+    return httpx.Timeout(read, connect=connect)
+
+
+# bytes read at a time from streamed response bodies
+CHUNK_SIZE = 65536
+
+
+class TransportResponse(object):
+    def __init__(self, status_code: int, headers: Dict[str, str], content: Optional[bytes],
+                 wire_size: Optional[int] = None, raw=None):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.wire_size = wire_size
+        self.raw = raw
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        return json_backend.loads(self.content)
+
+
+class Transport(object):
+    def request(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        raise NotImplementedError()
+
+    def stream(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+               headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        """
+        Sends a request and returns its response as soon as the headers were received, leaving the body to be read
+        with iter_content(). Transports that cannot stream return the whole response.
+        """
+        return self.request(method, url, params, data, headers, timeout)
+
+    def iter_content(self, response, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        Yields the decompressed body of a streamed response in chunks.
+        """
+        yield response.content
+
+    def close_response(self, response):
+        close = getattr(response, "close", None)
+        if close is not None:
+            close()
+
+    def response_size(self, response) -> Optional[int]:
+        """
+        Size of the response body as received on the wire, before decompression, or None when unknown.
+        """
+        wire_size = getattr(response, "wire_size", None)
+        return wire_size if wire_size is not None else len(response.content)
+
+    def close(self):
+        pass
+
+
+class RequestsTransport(Transport):
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, session: Optional[requests.Session] = None):
+        if session is None:
+            session = requests.Session()
+            adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+
+        self.session = session
+
+    def request(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        return self.session.request(method, url, params=params, data=data, headers=headers, timeout=timeout)
+
+    def stream(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+               headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        return self.session.request(method, url, params=params, data=data, headers=headers, timeout=timeout,
+                                    stream=True)
+
+    def iter_content(self, response, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        return response.iter_content(chunk_size)
+
+    def response_size(self, response) -> Optional[int]:
+        # urllib3 does not count the bytes of chunked responses
+        size = response.raw.tell() if response.raw is not None else 0
+        if size or not response.content:
+            return size
+
+        return None if "content-encoding" in response.headers else len(response.content)
+
+    def close(self):
+        self.session.close()
+
+
+class Urllib3Transport(Transport):
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10,
+                 pool_manager: Optional[urllib3.PoolManager] = None):
+        self.pool_manager = pool_manager or urllib3.PoolManager(num_pools=pool_connections, maxsize=pool_maxsize)
+
+    def request(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        response = self.__send(method, url, params, data, headers, timeout, True)
+        return TransportResponse(response.status, response.headers, response.data, response.tell())
+
+    def stream(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+               headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        response = self.__send(method, url, params, data, headers, timeout, False)
+        return TransportResponse(response.status, response.headers, None, raw=response)
+
+    def iter_content(self, response, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        if response.raw is None:
+            return super().iter_content(response, chunk_size)
+
+        return response.raw.stream(chunk_size, decode_content=True)
+
+    def close_response(self, response):
+        if response.raw is not None:
+            response.raw.release_conn()
+
+    def __send(self, method: str, url: str, params: Optional[Dict], data, headers: Optional[Dict[str, str]],
+               timeout: Optional[Timeout], preload_content: bool):
+        params = encode_params(params)
+        if params:
+            url = f"{url}?{urlencode(params, doseq=True)}"
+
+        if isinstance(data, str):
+            data = data.encode("utf-8")
+
+        kwargs = {} if timeout is None else {"timeout": urllib3.Timeout(connect=timeout[0], read=timeout[1])}
+        return self.pool_manager.request(method, url, body=data, headers=headers, retries=False,
+                                         preload_content=preload_content, **kwargs)
+
+    def close(self):
+        self.pool_manager.clear()
+
+
+class Http2Transport(Transport):
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, client=None):
+        if client is None:
+            require_httpx("Http2Transport", "http2")
+            limits = httpx.Limits(max_connections=pool_connections * pool_maxsize,
+                                  max_keepalive_connections=pool_maxsize)
+            client = httpx.Client(http2=True, limits=limits, timeout=None)
+
+        self.client = client
+
+    def request(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        return self.client.request(method, url, params=encode_params(params), content=data, headers=headers,
+                                   timeout=httpx_timeout(timeout))
+
+    def stream(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+               headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        request = self.client.build_request(method, url, params=encode_params(params), content=data, headers=headers,
+                                            timeout=httpx_timeout(timeout))
+        return self.client.send(request, stream=True)
+
+    def iter_content(self, response, chunk_size: int = CHUNK_SIZE) -> Iterator[bytes]:
+        return response.iter_bytes(chunk_size)
+
+    def response_size(self, response) -> Optional[int]:
+        return response.num_bytes_downloaded
+
+    def close(self):
+        self.client.close()
+
+
+class AsyncTransport(object):
+    async def request(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                      headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        raise NotImplementedError()
+
+    async def stream(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                     headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        return await self.request(method, url, params, data, headers, timeout)
+
+    async def iter_content(self, response, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+        yield response.content
+
+    async def close_response(self, response):
+        close = getattr(response, "close", None)
+        if close is not None:
+            close()
+
+    def response_size(self, response) -> Optional[int]:
+        wire_size = getattr(response, "wire_size", None)
+        return wire_size if wire_size is not None else len(response.content)
+
+    async def close(self):
+        pass
+
+
+class AsyncHttpxTransport(AsyncTransport):
+    def __init__(self, pool_connections: int = 10, pool_maxsize: int = 10, http2: bool = False, client=None):
+        if client is None:
+            require_httpx("AsyncUnit", "async")
+            limits = httpx.Limits(max_connections=pool_connections * pool_maxsize,
+                                  max_keepalive_connections=pool_maxsize)
+            client = httpx.AsyncClient(http2=http2, limits=limits, timeout=None)
+
+        self.client = client
+
+    async def request(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                      headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        return await self.client.request(method, url, params=encode_params(params), content=data, headers=headers,
+                                         timeout=httpx_timeout(timeout))
+
+    async def stream(self, method: str, url: str, params: Optional[Dict] = None, data=None,
+                     headers: Optional[Dict[str, str]] = None, timeout: Optional[Timeout] = None):
+        request = self.client.build_request(method, url, params=encode_params(params), content=data, headers=headers,
+                                            timeout=httpx_timeout(timeout))
+        return await self.client.send(request, stream=True)
+
+    def iter_content(self, response, chunk_size: int = CHUNK_SIZE) -> AsyncIterator[bytes]:
+        return response.aiter_bytes(chunk_size)
+
+    async def close_response(self, response):
+        await response.aclose()
+
+    def response_size(self, response) -> Optional[int]:
+        return response.num_bytes_downloaded
+
+    async def close(self):
+        await self.client.aclose()
+
+
+transports = {
+    "requests": RequestsTransport,
+    "urllib3": Urllib3Transport,
+    "http2": Http2Transport,
+}